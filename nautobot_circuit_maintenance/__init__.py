@@ -85,7 +85,11 @@ class CircuitMaintenanceConfig(NautobotAppConfig):
         "raw_notification_initial_days_since": 7,
         "raw_notification_size": 8192,
         "dashboard_n_days": 30,
+        "dashboard_cache_timeout": 86400,
         "overlap_job_exclude_no_impact": False,
+        "overlap_job_min_available_circuits": 1,
+        "notification_retention_days": 365,
+        "notification_archive_dir": None,
     }
     caching_config = {}
     home_view_name = "plugins:nautobot_circuit_maintenance:circuitmaintenance_overview"
@@ -97,6 +101,9 @@ class CircuitMaintenanceConfig(NautobotAppConfig):
         post_migrate.connect(custom_fields_extension, sender=self)
         post_migrate.connect(import_notification_sources, sender=self)
 
+        # pylint: disable=import-outside-toplevel,unused-import
+        from . import signals  # noqa: F401
+
         # App metrics are disabled by default
         if settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {}).get("metrics", {}).get("enable", False):
             # pylint: disable=import-outside-toplevel
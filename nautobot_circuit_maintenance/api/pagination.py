@@ -0,0 +1,128 @@
+"""API pagination for nautobot_circuit_maintenance."""
+
+import base64
+import binascii
+import json
+import uuid
+
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from nautobot.core.api.pagination import OptionalLimitOffsetPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class OptionalCursorPagination(OptionalLimitOffsetPagination):
+    """Offset pagination by default, and keyset pagination when the `cursor` query parameter is provided.
+
+    The keyset is defined by the `cursor_ordering` attribute of the view, a datetime field followed by `id`. The
+    datetime field may be null, as `last_updated`, the objects without it go first, ordered by `id`. An empty
+    `cursor` starts from the beginning, and every page provides the `cursor` to resume after its last object, so new
+    objects can be tailed without scanning the previous ones. Objects don't shift between pages while others are being
+    created, as happens with offsets.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the pagination in offset mode."""
+        super().__init__(*args, **kwargs)
+        self.cursor_ordering = None
+        self.cursor = None
+        self.has_next = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate by keyset if the `cursor` query parameter is provided, by offset otherwise."""
+        self.cursor_ordering = getattr(view, "cursor_ordering", None)
+        if not self.cursor_ordering or self.cursor_query_param not in request.query_params:
+            self.cursor_ordering = None
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.cursor = self.decode_cursor(request.query_params[self.cursor_query_param])
+
+        field_name, id_field_name = self.cursor_ordering
+        # The position of the nulls is database specific by default
+        queryset = queryset.order_by(F(field_name).asc(nulls_first=True), id_field_name)
+        if self.cursor:
+            field_value, id_value = self.cursor
+            if field_value is None:
+                queryset = queryset.filter(
+                    Q(**{f"{field_name}__isnull": False})
+                    | Q(**{f"{field_name}__isnull": True, f"{id_field_name}__gt": id_value})
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(**{f"{field_name}__gt": field_value})
+                    | Q(**{field_name: field_value, f"{id_field_name}__gt": id_value})
+                )
+
+        if not self.limit:
+            page = list(queryset)
+        else:
+            # Fetching an extra object tells if there is a next page, without counting
+            page = list(queryset[: self.limit + 1])
+            self.has_next = len(page) > self.limit
+            page = page[: self.limit]
+
+        if page:
+            self.cursor = tuple(getattr(page[-1], field_name) for field_name in self.cursor_ordering)
+
+        return page
+
+    def get_paginated_response(self, data):
+        """Return the page with the `cursor` to resume after it, and the `next` link if there are more objects."""
+        if self.cursor_ordering is None:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "cursor": self.encode_cursor(self.cursor),
+                "next": self.get_next_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        """Return the link to the next page."""
+        if self.cursor_ordering is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.cursor))
+
+    def get_previous_link(self):
+        """Keyset pagination only goes forward."""
+        if self.cursor_ordering is None:
+            return super().get_previous_link()
+
+        return None
+
+    @staticmethod
+    def encode_cursor(cursor):
+        """Encode the position of an object as an opaque string."""
+        if not cursor:
+            return ""
+        field_value, id_value = cursor
+        field_value = field_value.isoformat() if field_value is not None else None
+        return base64.urlsafe_b64encode(json.dumps([field_value, str(id_value)]).encode()).decode()
+
+    def decode_cursor(self, encoded_cursor):
+        """Decode the position of an object from the `cursor` query parameter, None for the beginning."""
+        if not encoded_cursor:
+            return None
+        try:
+            raw_field_value, id_value = json.loads(base64.urlsafe_b64decode(encoded_cursor.encode()))
+            field_value = parse_datetime(raw_field_value) if raw_field_value is not None else None
+            id_value = uuid.UUID(id_value)
+        except (binascii.Error, AttributeError, TypeError, ValueError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        if field_value is None and raw_field_value is not None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return field_value, id_value
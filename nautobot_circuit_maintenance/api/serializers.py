@@ -1,8 +1,13 @@
 """API serializers for nautobot_circuit_maintenance."""
 
+import base64
+import binascii
+
 from nautobot.apps.api import NautobotModelSerializer, TaggedModelSerializerMixin
+from rest_framework import serializers
 
 from nautobot_circuit_maintenance import models
+from nautobot_circuit_maintenance.choices import CircuitImpactChoices, CircuitMaintenanceStatusChoices
 
 
 class CircuitMaintenanceSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):  # pylint: disable=too-many-ancestors
@@ -18,6 +23,35 @@ class CircuitMaintenanceSerializer(NautobotModelSerializer, TaggedModelSerialize
         # read_only_fields = []
 
 
+class CircuitImpactUpsertSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Circuit impacted by a maintenance, referenced by provider name and CID."""
+
+    provider = serializers.CharField(max_length=255)
+    cid = serializers.CharField(max_length=255)
+    impact = serializers.ChoiceField(choices=CircuitImpactChoices.CHOICES, default=CircuitImpactChoices.OUTAGE)
+
+
+class CircuitMaintenanceUpsertSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Circuit Maintenance to create or update, identified by its name.
+
+    When `circuits` is provided, it replaces all the circuits impacted by the maintenance.
+    """
+
+    name = serializers.CharField(max_length=models.MAX_MAINTENANCE_NAME_LENGTH)
+    start_time = serializers.DateTimeField()
+    end_time = serializers.DateTimeField()
+    description = serializers.CharField(required=False, allow_blank=True)
+    status = serializers.ChoiceField(choices=CircuitMaintenanceStatusChoices.CHOICES, required=False)
+    ack = serializers.BooleanField(required=False)
+    circuits = CircuitImpactUpsertSerializer(many=True, required=False)
+
+    def validate(self, attrs):
+        """Validate the maintenance window, as CircuitMaintenance.clean() does."""
+        if attrs["end_time"] < attrs["start_time"]:
+            raise serializers.ValidationError("End time should be greater than start time.")
+        return attrs
+
+
 class ParsedNotificationSerializer(NautobotModelSerializer):
     """Serializer for API."""
 
@@ -28,14 +62,51 @@ class ParsedNotificationSerializer(NautobotModelSerializer):
         fields = "__all__"
 
 
+class RawContentField(serializers.CharField):
+    """Raw content of a notification, decompressed and base64 encoded."""
+
+    def to_representation(self, value):
+        """Encode the decompressed raw content."""
+        return base64.b64encode(value).decode()
+
+
 class RawNotificationSerializer(NautobotModelSerializer):
-    """Serializer for API."""
+    """Serializer for API.
+
+    The raw content is only included with `?include=raw`, it can also be downloaded from the `raw/` detail route.
+    """
+
+    raw = RawContentField(source="raw_content", read_only=True)
 
     class Meta:
         """Meta class for RawNotificationSerializer."""
 
         model = models.RawNotification
         fields = "__all__"
+        opt_in_fields = ["raw"]
+
+
+class RawNotificationPayloadSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Raw notification pushed to the app, as a base64 encoded RFC822 message."""
+
+    raw = serializers.CharField()
+    provider = serializers.CharField(max_length=255, required=False)
+
+    def validate_raw(self, value):
+        """Decode the RFC822 message."""
+        try:
+            return base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise serializers.ValidationError("Raw notification must be base64 encoded.") from exc
+
+
+class RawNotificationIngestSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Batch of raw notifications pushed to the app."""
+
+    source = serializers.SlugRelatedField(
+        slug_field="name", queryset=models.NotificationSource.objects.all(), required=False
+    )
+    notifications = RawNotificationPayloadSerializer(many=True, allow_empty=False)
 
 
 class NoteSerializer(NautobotModelSerializer):
@@ -66,3 +137,23 @@ class CircuitImpactSerializer(NautobotModelSerializer):
 
         model = models.CircuitImpact
         fields = "__all__"
+
+
+class ImpactedCircuitSerializer(serializers.ModelSerializer):
+    """Serializer for API."""
+
+    class Meta:
+        """Meta class for ImpactedCircuitSerializer."""
+
+        model = models.ImpactedCircuit
+        fields = ["circuit", "cid", "impact", "maintenance", "end_time"]
+
+
+class MaintenanceOverlapSerializer(NautobotModelSerializer):
+    """Serializer for API."""
+
+    class Meta:
+        """Meta class for MaintenanceOverlapSerializer."""
+
+        model = models.MaintenanceOverlap
+        fields = "__all__"
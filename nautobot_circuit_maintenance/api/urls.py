@@ -9,6 +9,8 @@ router = OrderedDefaultRouter()
 router.register("maintenance", views.MaintenanceTaskView)
 router.register("note", views.MaintenanceNoteTaskView)
 router.register("circuitimpact", views.MaintenanceCircuitImpactTaskView)
+router.register("impactedcircuit", views.ImpactedCircuitTaskView)
+router.register("maintenanceoverlap", views.MaintenanceOverlapTaskView)
 router.register("notificationsource", views.NotificationSourceTaskView)
 router.register("parsednotification", views.ParsedNotificationTaskView)
 router.register("rawnotification", views.RawNotificationTaskView)
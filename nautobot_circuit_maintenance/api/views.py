@@ -1,13 +1,32 @@
 """API views for nautobot_circuit_maintenance."""
 
+import io
+import logging
+
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.http import FileResponse
 from nautobot.apps.api import CustomFieldModelViewSet
-from rest_framework import viewsets
+from nautobot.circuits.models import Circuit, Provider
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
 
 from nautobot_circuit_maintenance import filters
+from nautobot_circuit_maintenance.api.pagination import OptionalCursorPagination
+from nautobot_circuit_maintenance.handle_notifications.handler import (
+    HandleCircuitMaintenanceNotifications,
+    ingest_raw_notifications,
+    upsert_circuit_maintenances,
+)
+from nautobot_circuit_maintenance.handle_notifications.sources import Source
+from nautobot_circuit_maintenance.impacted_circuits import get_impacted_circuits
 from nautobot_circuit_maintenance.models import (
     CircuitImpact,
     CircuitMaintenance,
+    ImpactedCircuit,
+    MaintenanceOverlap,
     Note,
     NotificationSource,
     ParsedNotification,
@@ -17,32 +36,142 @@ from nautobot_circuit_maintenance.models import (
 from .serializers import (
     CircuitImpactSerializer,
     CircuitMaintenanceSerializer,
+    CircuitMaintenanceUpsertSerializer,
+    ImpactedCircuitSerializer,
+    MaintenanceOverlapSerializer,
     NoteSerializer,
     NotificationSourceSerializer,
     ParsedNotificationSerializer,
+    RawNotificationIngestSerializer,
     RawNotificationSerializer,
 )
 
+logger = logging.getLogger(__name__)
+
+BULK_UPSERT_PERMISSIONS = [
+    "nautobot_circuit_maintenance.add_circuitmaintenance",
+    "nautobot_circuit_maintenance.change_circuitmaintenance",
+    "nautobot_circuit_maintenance.add_circuitimpact",
+    "nautobot_circuit_maintenance.change_circuitimpact",
+    "nautobot_circuit_maintenance.delete_circuitimpact",
+    "nautobot_circuit_maintenance.add_note",
+]
+
+INGEST_PERMISSIONS = [
+    "nautobot_circuit_maintenance.add_rawnotification",
+    "nautobot_circuit_maintenance.change_rawnotification",
+    "nautobot_circuit_maintenance.add_parsednotification",
+    *BULK_UPSERT_PERMISSIONS,
+]
+
+
+def check_object_permission(user, action: str, queryset):
+    """Raise PermissionDenied unless the user has the permission for all the objects of the queryset.
+
+    The ObjectPermission constraints are evaluated, as Nautobot's bulk views do, not only the model permissions.
+    """
+    if queryset.restrict(user, action).count() != queryset.count():
+        raise PermissionDenied()
+
 
 class MaintenanceTaskView(CustomFieldModelViewSet):
     """API view for Circuit Maintenance CRUD operations."""
 
-    queryset = CircuitMaintenance.objects.prefetch_related()
+    queryset = CircuitMaintenance.objects.prefetch_related("tags")
     serializer_class = CircuitMaintenanceSerializer
     filterset_class = filters.CircuitMaintenanceFilterSet
 
+    @action(detail=False, methods=["post"], url_path="bulk-upsert")
+    def bulk_upsert(self, request):
+        """Create or update a list of Circuit Maintenances, with their Circuit Impacts, in a single transaction."""
+        if not request.user.has_perms(BULK_UPSERT_PERMISSIONS):
+            raise PermissionDenied()
+
+        serializer = CircuitMaintenanceUpsertSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        maintenances = serializer.validated_data
+
+        provider_names = {
+            circuit["provider"] for maintenance in maintenances for circuit in maintenance.get("circuits", [])
+        }
+        providers = Provider.objects.in_bulk(provider_names, field_name="name")
+        if provider_names - providers.keys():
+            raise serializers.ValidationError(
+                {"provider": f"Providers not found: {', '.join(sorted(provider_names - providers.keys()))}"}
+            )
+        for maintenance in maintenances:
+            for circuit in maintenance.get("circuits", []):
+                circuit["provider"] = providers[circuit["provider"]]
+
+        with transaction.atomic():
+            results = self.upsert_circuit_maintenances(request.user, maintenances)
+        return Response(
+            [
+                {
+                    "id": result.maintenance.pk,
+                    "name": result.maintenance.name,
+                    "created": result.created,
+                    "unknown_cids": result.unknown_cids,
+                }
+                for result in results
+            ]
+        )
+
+    @staticmethod
+    def upsert_circuit_maintenances(user, maintenances):
+        """Upsert the maintenances, checking the ObjectPermission constraints of the user on every object.
+
+        The existing objects to change are checked before the upsert, and the objects created or changed after it, so
+        it has to run in a transaction to roll back the upsert if it's not permitted. Replacing the circuits of a
+        maintenance requires the permissions to change and to delete all its current Circuit Impacts.
+        """
+        names = [maintenance["name"] for maintenance in maintenances]
+        check_object_permission(user, "change", CircuitMaintenance.objects.filter(name__in=names))
+        replaced_circuit_impacts = CircuitImpact.objects.filter(
+            maintenance__name__in=[maintenance["name"] for maintenance in maintenances if "circuits" in maintenance]
+        )
+        check_object_permission(user, "change", replaced_circuit_impacts)
+        check_object_permission(user, "delete", replaced_circuit_impacts)
+        existing_circuit_impact_ids = set(replaced_circuit_impacts.values_list("pk", flat=True))
+        existing_note_ids = set(Note.objects.filter(maintenance__name__in=names).values_list("pk", flat=True))
+
+        results = upsert_circuit_maintenances(
+            logger, maintenances, circuit_queryset=Circuit.objects.restrict(user, "view")
+        )
+
+        maintenance_ids = [result.maintenance.pk for result in results]
+        check_object_permission(
+            user,
+            "add",
+            CircuitMaintenance.objects.filter(pk__in=[result.maintenance.pk for result in results if result.created]),
+        )
+        check_object_permission(
+            user,
+            "change",
+            CircuitMaintenance.objects.filter(
+                pk__in=[result.maintenance.pk for result in results if not result.created]
+            ),
+        )
+        circuit_impacts = CircuitImpact.objects.filter(maintenance__in=maintenance_ids)
+        check_object_permission(user, "add", circuit_impacts.exclude(pk__in=existing_circuit_impact_ids))
+        check_object_permission(user, "change", circuit_impacts.filter(pk__in=existing_circuit_impact_ids))
+        check_object_permission(
+            user, "add", Note.objects.filter(maintenance__in=maintenance_ids).exclude(pk__in=existing_note_ids)
+        )
+        return results
+
 
 class MaintenanceNoteTaskView(CustomFieldModelViewSet):
     """API view for Circuit Note CRUD operations."""
 
-    queryset = Note.objects.prefetch_related()
+    queryset = Note.objects.select_related("maintenance")
     serializer_class = NoteSerializer
 
 
 class MaintenanceCircuitImpactTaskView(CustomFieldModelViewSet):
     """API view for Circuit Impact CRUD operations."""
 
-    queryset = CircuitImpact.objects.prefetch_related()
+    queryset = CircuitImpact.objects.select_related("maintenance", "circuit__provider")
     serializer_class = CircuitImpactSerializer
     filterset_class = filters.CircuitImpactFilterSet
 
@@ -50,23 +179,110 @@ class MaintenanceCircuitImpactTaskView(CustomFieldModelViewSet):
 class RawNotificationTaskView(viewsets.ReadOnlyModelViewSet):
     """API view for Notification Source CRUD operations."""
 
-    queryset = RawNotification.objects.prefetch_related()
+    queryset = RawNotification.objects.select_related("provider", "source")
     serializer_class = RawNotificationSerializer
     filterset_class = filters.RawNotificationFilterSet
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ("stamp", "id")
+
+    def get_queryset(self):
+        """Defer the raw content when it's not going to be serialized."""
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve"] and "raw" not in self.request.query_params.getlist("include"):
+            queryset = queryset.defer("raw")
+        return queryset
+
+    @action(detail=False, methods=["post"], url_path="ingest")
+    def ingest(self, request):
+        """Process a batch of raw notifications, as the notification handling Job does for email sources."""
+        if not request.user.has_perms(INGEST_PERMISSIONS):
+            raise PermissionDenied()
+
+        serializer = RawNotificationIngestSerializer(data=request.data)
+        serializer.fields["source"].queryset = NotificationSource.objects.restrict(request.user, "view")
+        serializer.is_valid(raise_exception=True)
+        notification_source = serializer.validated_data.get("source")
+        source = Source(name=notification_source.name if notification_source else "", url=request.path)
+
+        with transaction.atomic():
+            results = ingest_raw_notifications(
+                HandleCircuitMaintenanceNotifications(),
+                source,
+                [(payload["raw"], payload.get("provider")) for payload in serializer.validated_data["notifications"]],
+                provider_queryset=Provider.objects.restrict(request.user, "view"),
+            )
+            # As Nautobot's bulk views, the notifications are checked against the constraints once created
+            check_object_permission(
+                request.user,
+                "add",
+                RawNotification.objects.filter(
+                    pk__in=[result.raw_notification_id for result in results if result.status == "processed"]
+                ),
+            )
+        return Response(
+            [
+                {"raw_notification": result.raw_notification_id, "status": result.status, "error": result.error}
+                for result in results
+            ]
+        )
+
+    @action(detail=True, methods=["get"], url_path="raw")
+    def download_raw(self, request, pk=None):  # pylint: disable=unused-argument
+        """Download the raw content of a notification."""
+        raw_notification = self.get_object()
+        return FileResponse(
+            io.BytesIO(raw_notification.raw_content),
+            as_attachment=True,
+            filename=f"{raw_notification.pk}.raw",
+            content_type="application/octet-stream",
+        )
 
 
 class ParsedNotificationTaskView(viewsets.ReadOnlyModelViewSet):
     """API view for Notification Source CRUD operations."""
 
-    queryset = ParsedNotification.objects.prefetch_related()
+    # The raw notification subject is used in the display field, but its raw content is not needed
+    queryset = ParsedNotification.objects.select_related("maintenance", "raw_notification").defer(
+        "raw_notification__raw"
+    )
     serializer_class = ParsedNotificationSerializer
     filterset_class = filters.ParsedNotificationFilterSet
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ("last_updated", "id")
+
+
+class ImpactedCircuitTaskView(viewsets.ReadOnlyModelViewSet):
+    """API view for the circuits impacted right now by the active Circuit Maintenances.
+
+    A single circuit is looked up by its ID, and a bulk of circuits with `?cid=<cid>&cid=<cid>`. Circuits that are not
+    impacted are not returned.
+    """
+
+    queryset = ImpactedCircuit.objects.all()
+    serializer_class = ImpactedCircuitSerializer
+    lookup_field = "circuit"
+
+    def get_queryset(self):
+        """Return the impacted circuits, filtered by the `cid` query parameters, if any."""
+        queryset = get_impacted_circuits()
+        cids = self.request.query_params.getlist("cid")
+        if cids:
+            queryset = queryset.filter(cid__in=cids)
+        return queryset
+
+
+class MaintenanceOverlapTaskView(viewsets.ReadOnlyModelViewSet):
+    """API view for Maintenance Overlap read operations, the overlaps are computed by a Job."""
+
+    queryset = MaintenanceOverlap.objects.select_related("location").prefetch_related("maintenances")
+    serializer_class = MaintenanceOverlapSerializer
+    filterset_class = filters.MaintenanceOverlapFilterSet
 
 
 class NotificationSourceTaskView(viewsets.ReadOnlyModelViewSet):
     """API view for Notification Source CRUD operations."""
 
-    queryset = NotificationSource.objects.prefetch_related()
+    queryset = NotificationSource.objects.prefetch_related("providers")
     serializer_class = NotificationSourceSerializer
     filterset_class = filters.NotificationSourceFilterSet
 
@@ -50,6 +50,10 @@ class CircuitImpactChoices(ChoiceSet):
     )
 
 
+# CircuitImpactChoices are defined from the lowest to the highest impact
+IMPACT_SEVERITY = {impact: severity for severity, impact in enumerate(CircuitImpactChoices.values())}
+
+
 class NoteLevelChoices(ChoiceSet):
     """Valid values for Circuit Maintenance Note level."""
 
@@ -1,10 +1,21 @@
 """Custom Validators definition."""
 
+from typing import List
+
 from circuit_maintenance_parser import SUPPORTED_PROVIDER_NAMES
+from django.db.models import Q
 from nautobot.circuits.models import Provider
-from nautobot.extras.models import CustomField
 from nautobot.extras.plugins import PluginCustomValidator
 
+SUPPORTED_PROVIDER_NAMES_LOWER = frozenset(name.lower() for name in SUPPORTED_PROVIDER_NAMES)
+
+
+def get_provider_emails(value) -> List[str]:
+    """Return the emails of the `emails_circuit_maintenances` custom field, normalized as the email sources do."""
+    if not value:
+        return []
+    return [email.strip().lower() for email in value.split(",") if email.strip()]
+
 
 class ProviderEmailValidator(PluginCustomValidator):
     """Custom validator to validate that Providers don't repeat source emails."""
@@ -12,21 +23,30 @@ class ProviderEmailValidator(PluginCustomValidator):
     model = "circuits.provider"
 
     def clean(self):
-        """Validate that provider emails are not repeated."""
-        used_emails = []
-        for provider in Provider.objects.all():
-            if self.context["object"] != provider:
-                for custom_field, value in provider.get_custom_fields().items():
-                    if custom_field.key == "emails_circuit_maintenances" and value:
-                        used_emails.extend(value.split(","))
-
-        for custom_field, value in self.context["object"].get_custom_fields().items():
-            if custom_field.key == "emails_circuit_maintenances" and value:
-                for email in value.split(","):
-                    if email in used_emails:
-                        self.validation_error(
-                            {"cf_emails_circuit_maintenances": f"{email} was already in used by another Provider."}
-                        )
+        """Validate that provider emails are not repeated.
+
+        Only the Providers whose emails contain any of the new ones are fetched, in a single query, to compare them.
+        """
+        emails = get_provider_emails(self.context["object"].cf.get("emails_circuit_maintenances"))
+        if not emails:
+            return
+
+        query = Q()
+        for email in emails:
+            query |= Q(_custom_field_data__emails_circuit_maintenances__icontains=email)
+        used_emails = set()
+        for value in (
+            Provider.objects.exclude(pk=self.context["object"].pk)
+            .filter(query)
+            .values_list("_custom_field_data__emails_circuit_maintenances", flat=True)
+        ):
+            used_emails.update(get_provider_emails(value))
+
+        for email in emails:
+            if email in used_emails:
+                self.validation_error(
+                    {"cf_emails_circuit_maintenances": f"{email} was already in used by another Provider."}
+                )
 
 
 class ProviderParserValidator(PluginCustomValidator):
@@ -36,13 +56,9 @@ class ProviderParserValidator(PluginCustomValidator):
 
     def clean(self):
         """Validate that the Provider's parser exists in the Parser library."""
-        provider_mapping = (
-            self.context["object"]
-            .get_custom_fields()
-            .get(CustomField.objects.get(key="provider_parser_circuit_maintenances"))
-        )
+        provider_mapping = self.context["object"].cf.get("provider_parser_circuit_maintenances")
 
-        if provider_mapping and provider_mapping.lower() not in SUPPORTED_PROVIDER_NAMES:
+        if provider_mapping and provider_mapping.lower() not in SUPPORTED_PROVIDER_NAMES_LOWER:
             self.validation_error(
                 {
                     "cf_provider_parser_circuit_maintenances": (
@@ -5,8 +5,17 @@ import logging
 import django_filters
 from nautobot.apps.filters import NaturalKeyOrPKMultipleChoiceFilter, NautobotFilterSet, SearchFilter
 from nautobot.circuits.models import Circuit, Provider
-
-from .models import CircuitImpact, CircuitMaintenance, Note, NotificationSource, ParsedNotification, RawNotification
+from nautobot.dcim.models import Location
+
+from .models import (
+    CircuitImpact,
+    CircuitMaintenance,
+    MaintenanceOverlap,
+    Note,
+    NotificationSource,
+    ParsedNotification,
+    RawNotification,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -146,3 +155,30 @@ class NotificationSourceFilterSet(NautobotFilterSet):
 
         model = NotificationSource
         exclude = ["_token"]
+
+
+class MaintenanceOverlapFilterSet(NautobotFilterSet):
+    """Filter capabilities for MaintenanceOverlap instances."""
+
+    location = NaturalKeyOrPKMultipleChoiceFilter(
+        field_name="location",
+        queryset=Location.objects.all(),
+        to_field_name="name",
+        label="Location",
+    )
+
+    maintenance = NaturalKeyOrPKMultipleChoiceFilter(
+        field_name="maintenances",
+        queryset=CircuitMaintenance.objects.all(),
+        to_field_name="name",
+        label="CircuitMaintenance",
+    )
+
+    start_time = django_filters.DateTimeFilter(field_name="start_time", lookup_expr="gte")
+    end_time = django_filters.DateTimeFilter(field_name="end_time", lookup_expr="lte")
+
+    class Meta:
+        """Meta class attributes for MaintenanceOverlapFilterSet."""
+
+        model = MaintenanceOverlap
+        fields = "__all__"
@@ -1,17 +1,22 @@
 # pylint: disable=logging-fstring-interpolation
 """Notifications jobs."""
 
+import collections
 import datetime
+import email
 import uuid
-from typing import List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from circuit_maintenance_parser import Maintenance, NotificationData, ProviderError, init_provider
 from dateutil import parser
-from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Lower
 from nautobot.circuits.models import Circuit, Provider
-from nautobot.extras.jobs import DryRunVar, Job
+from nautobot.extras.jobs import DryRunVar, Job, ObjectVar
+from nautobot.extras.models import Job as JobModel
+from nautobot.extras.models import JobResult
 
 from nautobot_circuit_maintenance.choices import CircuitMaintenanceStatusChoices
 from nautobot_circuit_maintenance.enum import MessageProcessingStatus
@@ -28,12 +33,126 @@ from nautobot_circuit_maintenance.models import (
     RawNotification,
 )
 
-from .sources import MaintenanceNotification, get_notifications
+from .sources import EmailSource, MaintenanceNotification, Source, get_notifications
 
 name = "Circuit Maintenance"  # pylint: disable=invalid-name
 
 # pylint: disable=broad-except
-PLUGIN_SETTINGS = settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {})
+
+
+def get_circuit_maintenance_status(status: str) -> str:
+    """Get the CircuitMaintenance status for a status from a notification, UNKNOWN if it's not a valid one."""
+    if status in CircuitMaintenanceStatusChoices.values():
+        return status
+    return CircuitMaintenanceStatusChoices.UNKNOWN
+
+
+def get_circuits_by_reference(
+    references: Iterable[Tuple[uuid.UUID, str]], queryset: Optional[QuerySet] = None
+) -> Dict[Tuple[uuid.UUID, str], Circuit]:
+    """Get the Circuits referenced by provider ID and CID, in a single query.
+
+    CIDs are matched case-insensitively, as providers don't always use the same case as the one in the database.
+
+    Args:
+        references (Iterable[Tuple[uuid.UUID, str]]): Provider ID and CID of the circuits.
+        queryset (QuerySet): Circuits to look the references up in, all of them if not provided.
+
+    Returns:
+        Dict[Tuple[uuid.UUID, str], Circuit]: Circuits found, keyed by provider ID and lowercase CID.
+    """
+    cids_by_provider = collections.defaultdict(set)
+    for provider_id, cid in references:
+        cids_by_provider[provider_id].add(cid.lower())
+    if not cids_by_provider:
+        return {}
+
+    query = Q()
+    for provider_id, cids in cids_by_provider.items():
+        query |= Q(provider_id=provider_id, cid_lower__in=cids)
+
+    # When several circuits only differ by case, the last one is used
+    return {
+        (circuit.provider_id, circuit.cid_lower): circuit
+        for circuit in (queryset if queryset is not None else Circuit.objects.all())
+        .annotate(cid_lower=Lower("cid"))
+        .filter(query)
+    }
+
+
+def set_circuit_impacts(
+    logger,
+    circuit_maintenance_entry: CircuitMaintenance,
+    circuit_impacts: Iterable[Tuple[uuid.UUID, str, str]],
+    circuits: Dict[Tuple[uuid.UUID, str], Circuit],
+    provider: Optional[Provider] = None,
+) -> List[str]:
+    """Create, update or delete the CircuitImpacts of a CircuitMaintenance to match the referenced circuits.
+
+    Circuits not found in the database are omitted from the maintenance, and a Note is added for each one of them.
+
+    Args:
+        logger: Logger to report the changes to.
+        circuit_maintenance_entry (CircuitMaintenance): CircuitMaintenance to update.
+        circuit_impacts (Iterable[Tuple[uuid.UUID, str, str]]): Provider ID, CID and impact of the circuits.
+        circuits (Dict[Tuple[uuid.UUID, str], Circuit]): Result of `get_circuits_by_reference`.
+        provider (Provider): If provided, only the CircuitImpacts of its circuits are updated or deleted.
+
+    Returns:
+        List[str]: CIDs not found in the database.
+    """
+    maintenance_id = circuit_maintenance_entry.name
+    existing_circuit_impacts = CircuitImpact.objects.filter(maintenance=circuit_maintenance_entry).select_related(
+        "circuit"
+    )
+    if provider:
+        existing_circuit_impacts = existing_circuit_impacts.filter(circuit__provider=provider)
+    existing_circuit_impacts = {
+        (circuit_impact_entry.circuit.provider_id, circuit_impact_entry.circuit.cid.lower()): circuit_impact_entry
+        for circuit_impact_entry in existing_circuit_impacts
+    }
+
+    # When a circuit is referenced more than once, the first reference is used
+    new_circuit_impacts = {}
+    for provider_id, cid, impact in circuit_impacts:
+        new_circuit_impacts.setdefault((provider_id, cid.lower()), (cid, impact))
+
+    unknown_cids = []
+    for reference, (cid, impact) in new_circuit_impacts.items():
+        circuit_impact_entry = existing_circuit_impacts.get(reference)
+        if circuit_impact_entry:
+            if circuit_impact_entry.impact != impact:
+                circuit_impact_entry.impact = impact
+                circuit_impact_entry.save()
+        elif reference in circuits:
+            circuit_impact_entry = CircuitImpact.objects.create(
+                maintenance=circuit_maintenance_entry,
+                circuit=circuits[reference],
+                impact=impact,
+            )
+            logger.info(
+                f"Circuit ID {cid} linked to Maintenance {maintenance_id}",
+                extra={"object": circuit_impact_entry},
+            )
+        else:
+            note_entry, created = Note.objects.get_or_create(
+                maintenance=circuit_maintenance_entry,
+                title=f"Nonexistent circuit ID {cid}"[:MAX_NOTE_TITLE_LENGTH],
+                comment=f"Circuit ID {cid} referenced was not found in the database, so omitted from the maintenance.",
+                level="WARNING",
+            )
+            if created:
+                logger.warning(
+                    f"Circuit ID {cid} referenced in {maintenance_id} is not in the Database, adding a note",
+                    extra={"object": note_entry},
+                )
+            unknown_cids.append(cid)
+
+    for reference, circuit_impact_entry in existing_circuit_impacts.items():
+        if reference not in new_circuit_impacts:
+            circuit_impact_entry.delete()
+
+    return unknown_cids
 
 
 def create_circuit_maintenance(
@@ -49,42 +168,15 @@ def create_circuit_maintenance(
         start_time=datetime.datetime.fromtimestamp(parser_maintenance.start, tz=datetime.timezone.utc),
         end_time=datetime.datetime.fromtimestamp(parser_maintenance.end, tz=datetime.timezone.utc),
         description=parser_maintenance.summary,
-        status=(
-            parser_maintenance.status
-            if parser_maintenance.status in CircuitMaintenanceStatusChoices.values()
-            else CircuitMaintenanceStatusChoices.UNKNOWN
-        ),
+        status=get_circuit_maintenance_status(parser_maintenance.status),
     )
     circuit_maintenance_entry.save()
     job.logger.info("Created Circuit Maintenance.", extra={"object": circuit_maintenance_entry})
 
-    for circuit in parser_maintenance.circuits:
-        circuit_entry = Circuit.objects.filter(cid__iexact=circuit.circuit_id, provider=provider).last()
-        if circuit_entry:
-            circuit_impact_entry, created = CircuitImpact.objects.get_or_create(
-                maintenance=circuit_maintenance_entry, circuit=circuit_entry, defaults={"impact": circuit.impact}
-            )
-            if created:
-                job.logger.info(
-                    f"Circuit ID {circuit.circuit_id} linked to Maintenance {maintenance_id}",
-                    extra={"object": circuit_impact_entry},
-                )
-        else:
-            note_entry, created = Note.objects.get_or_create(
-                maintenance=circuit_maintenance_entry,
-                title=f"Nonexistent circuit ID {circuit.circuit_id}"[:MAX_NOTE_TITLE_LENGTH],
-                comment=(
-                    f"Circuit ID {circuit.circuit_id} referenced was not found in the database, so omitted from the "
-                    "maintenance."
-                ),
-                level="WARNING",
-            )
-            if created:
-                job.logger.warning(
-                    f"Circuit ID {circuit.circuit_id} referenced in {maintenance_id} is not in the Database, adding a note",
-                    extra={"object": note_entry},
-                )
-            notification.source.tag_message(job, notification.msg_id, MessageProcessingStatus.UNKNOWN_CIDS)
+    circuit_impacts = [(provider.pk, circuit.circuit_id, circuit.impact) for circuit in parser_maintenance.circuits]
+    circuits = get_circuits_by_reference((provider_id, cid) for provider_id, cid, _ in circuit_impacts)
+    if set_circuit_impacts(job.logger, circuit_maintenance_entry, circuit_impacts, circuits, provider):
+        notification.source.tag_message(job, notification.msg_id, MessageProcessingStatus.UNKNOWN_CIDS)
 
     if not CircuitImpact.objects.filter(maintenance=circuit_maintenance_entry):
         job.logger.warning(
@@ -100,15 +192,12 @@ def update_circuit_maintenance(
     circuit_maintenance_entry: CircuitMaintenance,
     parser_maintenance: Maintenance,
     provider: Provider,
-):  # pylint: disable=too-many-locals
+):
     """Handles the update of an existent circuit maintenance."""
     maintenance_id = circuit_maintenance_entry.name
     circuit_maintenance_entry.description = parser_maintenance.summary
     if parser_maintenance.status != "NO-CHANGE":
-        if parser_maintenance.status in CircuitMaintenanceStatusChoices.values():
-            circuit_maintenance_entry.status = parser_maintenance.status
-        else:
-            circuit_maintenance_entry.status = CircuitMaintenanceStatusChoices.UNKNOWN
+        circuit_maintenance_entry.status = get_circuit_maintenance_status(parser_maintenance.status)
     circuit_maintenance_entry.start_time = datetime.datetime.fromtimestamp(
         parser_maintenance.start, tz=datetime.timezone.utc
     )
@@ -118,65 +207,10 @@ def update_circuit_maintenance(
     circuit_maintenance_entry.ack = False
     circuit_maintenance_entry.save()
 
-    circuit_entries = CircuitImpact.objects.filter(maintenance=circuit_maintenance_entry)
-
-    new_cids = {parsed_circuit.circuit_id.lower() for parsed_circuit in parser_maintenance.circuits}
-    existing_cids = {circuit_entry.circuit.cid.lower() for circuit_entry in circuit_entries}
-
-    cids_to_update = new_cids & existing_cids
-    cids_to_create = new_cids - existing_cids
-    cids_to_remove = existing_cids - new_cids
-
-    for cid in cids_to_create:
-        circuit_entry = Circuit.objects.filter(cid__iexact=cid, provider=provider.pk).last()
-        circuit = [
-            parsed_circuit
-            for parsed_circuit in parser_maintenance.circuits
-            if parsed_circuit.circuit_id.lower() == cid.lower()
-        ][0]
-        if circuit_entry:
-            circuit_impact_entry = CircuitImpact.objects.create(
-                maintenance=circuit_maintenance_entry,
-                circuit=circuit_entry,
-                impact=circuit.impact,
-            )
-            job.logger.info(
-                f"Circuit ID {circuit.circuit_id} linked to Maintenance {maintenance_id}",
-                extra={"object": circuit_impact_entry},
-            )
-        else:
-            note_entry, created = Note.objects.get_or_create(
-                maintenance=circuit_maintenance_entry,
-                title=f"Nonexistent circuit ID {circuit.circuit_id}"[:MAX_NOTE_TITLE_LENGTH],
-                comment=(
-                    f"Circuit ID {circuit.circuit_id} referenced was not found in the database, so omitted from the "
-                    "maintenance."
-                ),
-                level="WARNING",
-            )
-            if created:
-                job.logger.warning(
-                    f"Circuit ID {circuit.circuit_id} referenced in {maintenance_id} is not in the Database, adding a note",
-                    extra={"object": note_entry},
-                )
-            notification.source.tag_message(job, notification.msg_id, MessageProcessingStatus.UNKNOWN_CIDS)
-
-    for cid in cids_to_update:
-        circuit_entry = Circuit.objects.filter(cid__iexact=cid, provider=provider.pk).last()
-        circuitimpact_entry = CircuitImpact.objects.filter(
-            circuit=circuit_entry, maintenance=circuit_maintenance_entry
-        ).last()
-        circuit = [
-            parsed_circuit
-            for parsed_circuit in parser_maintenance.circuits
-            if parsed_circuit.circuit_id.lower() == cid.lower()
-        ][0]
-        circuitimpact_entry.impact = circuit.impact
-        circuitimpact_entry.save()
-
-    for cid in cids_to_remove:
-        circuit_entry = Circuit.objects.filter(cid__iexact=cid, provider=provider.pk).last()
-        CircuitImpact.objects.filter(circuit=circuit_entry, maintenance=circuit_maintenance_entry).delete()
+    circuit_impacts = [(provider.pk, circuit.circuit_id, circuit.impact) for circuit in parser_maintenance.circuits]
+    circuits = get_circuits_by_reference((provider_id, cid) for provider_id, cid, _ in circuit_impacts)
+    if set_circuit_impacts(job.logger, circuit_maintenance_entry, circuit_impacts, circuits, provider):
+        notification.source.tag_message(job, notification.msg_id, MessageProcessingStatus.UNKNOWN_CIDS)
 
     job.logger.info(
         f"Updated Circuit Maintenance {maintenance_id}",
@@ -226,11 +260,81 @@ def create_or_update_circuit_maintenance(
     return circuit_maintenance_entry
 
 
+class MaintenanceUpsertResult(NamedTuple):
+    """Outcome of the upsert of a CircuitMaintenance."""
+
+    maintenance: CircuitMaintenance
+    created: bool
+    unknown_cids: List[str]
+
+
+def upsert_circuit_maintenances(
+    logger, maintenances: List[dict], circuit_queryset: Optional[QuerySet] = None
+) -> List[MaintenanceUpsertResult]:
+    """Create or update CircuitMaintenances, identified by name, with their CircuitImpacts in a single transaction.
+
+    The circuits of all the maintenances are resolved in a single query, and the CircuitImpacts are updated as for
+    the maintenances created or updated from notifications.
+
+    Args:
+        logger: Logger to report the changes to.
+        maintenances (List[dict]): `name`, `start_time`, `end_time`, and optionally `description`, `status`, `ack`
+            and `circuits` of each maintenance. When `circuits` is provided, it's the list of `provider` (Provider),
+            `cid` and `impact` of all the circuits impacted by the maintenance.
+        circuit_queryset (QuerySet): Circuits that can be impacted, all of them if not provided.
+
+    Returns:
+        List[MaintenanceUpsertResult]: Outcome for each maintenance, in the same order.
+    """
+    circuits = get_circuits_by_reference(
+        [
+            (circuit["provider"].pk, circuit["cid"])
+            for maintenance in maintenances
+            for circuit in maintenance.get("circuits", [])
+        ],
+        circuit_queryset,
+    )
+    circuit_maintenance_entries = CircuitMaintenance.objects.in_bulk(
+        [maintenance["name"] for maintenance in maintenances], field_name="name"
+    )
+
+    results = []
+    with transaction.atomic():
+        for maintenance in maintenances:
+            circuit_maintenance_entry = circuit_maintenance_entries.get(maintenance["name"])
+            created = circuit_maintenance_entry is None
+            if created:
+                circuit_maintenance_entry = CircuitMaintenance(name=maintenance["name"])
+            for field_name in ["start_time", "end_time", "description", "status", "ack"]:
+                if field_name in maintenance:
+                    setattr(circuit_maintenance_entry, field_name, maintenance[field_name])
+            circuit_maintenance_entry.save()
+            circuit_maintenance_entries[circuit_maintenance_entry.name] = circuit_maintenance_entry
+            logger.info(
+                f"{'Created' if created else 'Updated'} Circuit Maintenance {circuit_maintenance_entry.name}",
+                extra={"object": circuit_maintenance_entry},
+            )
+
+            unknown_cids = []
+            if "circuits" in maintenance:
+                circuit_impacts = [
+                    (circuit["provider"].pk, circuit["cid"], circuit["impact"]) for circuit in maintenance["circuits"]
+                ]
+                unknown_cids = set_circuit_impacts(logger, circuit_maintenance_entry, circuit_impacts, circuits)
+
+            results.append(MaintenanceUpsertResult(circuit_maintenance_entry, created, unknown_cids))
+
+    return results
+
+
+def get_provider_parser_type(provider: Provider) -> str:
+    """Get the `circuit_maintenance_parser` provider type of the Provider, custom field or name."""
+    return provider.cf.get("provider_parser_circuit_maintenances", "").lower() or provider.name
+
+
 def get_maintenances_from_notification(job: Job, notification: MaintenanceNotification, provider: Provider):
     """Use the `circuit_maintenance_parser` library to get Maintenances from the notification."""
-    provider_type = provider.cf.get("provider_parser_circuit_maintenances", "").lower() or provider.name
-
-    parser_provider = init_provider(provider_type=provider_type)
+    parser_provider = init_provider(provider_type=get_provider_parser_type(provider))
     if not parser_provider:
         job.logger.warning(
             f"Notification Parser not found for {notification.provider_type}", extra={"object": notification}
@@ -341,27 +445,33 @@ def process_raw_notification(job: Job, notification: MaintenanceNotification) ->
     if not parser_maintenances:
         return raw_entry.id
 
+    save_parsed_maintenances(job, notification, raw_entry, parser_maintenances, provider)
+
+    return raw_entry.id
+
+
+def save_parsed_maintenances(
+    job: Job,
+    notification: MaintenanceNotification,
+    raw_entry: RawNotification,
+    parser_maintenances: List[Maintenance],
+    provider: Provider,
+):
+    """Create or update the Circuit Maintenances of the parsed Maintenances, and their ParsedNotifications.
+
+    The ParsedNotifications are created at once, in the order of the Maintenances, and the RawNotification is marked as
+    parsed once, whatever the number of Maintenances. Maintenances with a ParsedNotification of the RawNotification
+    already, as when it's processed again, don't create another one.
+    """
+    already_parsed = set(
+        ParsedNotification.objects.filter(raw_notification=raw_entry).values_list("maintenance_id", flat=True)
+    )
+    parsed_entries = {}
     for parser_maintenance in parser_maintenances:
         try:
             circuit_maintenance_entry = create_or_update_circuit_maintenance(
                 job, notification, raw_entry, parser_maintenance, provider
             )
-            # Update raw notification as properly parsed
-            raw_entry.parsed = True
-            raw_entry.save()
-
-            # Insert parsed notification in DB
-            parsed_entry = ParsedNotification.objects.create(
-                maintenance=circuit_maintenance_entry,
-                raw_notification=raw_entry,
-                json=parser_maintenance.to_json(),
-            )
-            parsed_entry.save()
-            job.logger.info(
-                f"Saved Parsed Notification for {circuit_maintenance_entry.name}.",
-                extra={"object": parsed_entry},
-            )
-
         except Exception:
             job.logger.error(
                 "Unexpected exception while handling parsed notification",
@@ -370,22 +480,123 @@ def process_raw_notification(job: Job, notification: MaintenanceNotification) ->
             )
             raise
 
-    return raw_entry.id
-
+        if circuit_maintenance_entry.pk in already_parsed:
+            continue
+        # A later Maintenance for the same Circuit Maintenance replaces the previous one, as it did when updating it
+        parsed_entries[circuit_maintenance_entry.pk] = ParsedNotification(
+            maintenance=circuit_maintenance_entry,
+            raw_notification=raw_entry,
+            json=parser_maintenance.to_json(),
+        )
 
-def get_since_reference(job: Job) -> int:
-    """Get the timestamp from the latest processed RawNotification or a reference from config `raw_notification_initial_days_since`."""
-    # Latest retrieved notification will limit the scope of notifications to retrieve
-    last_raw_notification = RawNotification.objects.last()
-    if last_raw_notification:
-        since_reference = last_raw_notification.last_updated.timestamp()
-    else:
-        since_reference = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
-            days=PLUGIN_SETTINGS.get("raw_notification_initial_days_since")
+    # Insert parsed notifications in DB
+    ParsedNotification.objects.bulk_create(parsed_entries.values())
+    for parsed_entry in parsed_entries.values():
+        job.logger.info(
+            f"Saved Parsed Notification for {parsed_entry.maintenance.name}.",
+            extra={"object": parsed_entry},
         )
-        since_reference = int(since_reference.timestamp())
-    job.logger.info(f"Processing notifications since {since_reference}", extra={"object": last_raw_notification})
-    return since_reference
+
+    # Update raw notification as properly parsed
+    if not raw_entry.parsed:
+        raw_entry.parsed = True
+        RawNotification.objects.filter(pk=raw_entry.pk).update(parsed=True)
+
+
+class RawNotificationIngestResult(NamedTuple):
+    """Outcome of the ingestion of a raw notification."""
+
+    raw_notification_id: Optional[uuid.UUID]
+    status: str
+    error: str = ""
+
+
+def get_provider_types_by_email(queryset: Optional[QuerySet] = None) -> Dict[str, str]:
+    """Get the Provider names by the emails in their `emails_circuit_maintenances` custom field, in a single query.
+
+    Only the Providers of the `queryset` are included, all of them if not provided.
+    """
+    provider_types = {}
+    for provider in queryset if queryset is not None else Provider.objects.all():
+        emails_for_provider = provider.cf.get("emails_circuit_maintenances")
+        if not emails_for_provider:
+            continue
+        for email_source in emails_for_provider.split(","):
+            # As in EmailSource.get_provider_type_from_email, the first provider with the email is used
+            provider_types.setdefault(email_source.strip().lower(), provider.name)
+    return provider_types
+
+
+def ingest_raw_notifications(
+    job: Job,
+    source: Source,
+    payloads: List[Tuple[bytes, Optional[str]]],
+    provider_queryset: Optional[QuerySet] = None,
+) -> List[RawNotificationIngestResult]:
+    """Process a batch of RFC822 payloads pushed to the app, in a single transaction.
+
+    Each payload is processed by `process_raw_notification` in its own savepoint, so one failing payload doesn't
+    prevent the others from being stored.
+
+    Args:
+        job (Job): Job to use its logger.
+        source (Source): Source the notifications are related to.
+        payloads (List[Tuple[bytes, Optional[str]]]): RFC822 payload and, optionally, the Provider name of each
+            notification. Without it, the Provider is found from the sender email, as for email sources.
+        provider_queryset (QuerySet): Providers the notifications can be related to, all of them if not provided.
+
+    Returns:
+        List[RawNotificationIngestResult]: Outcome for each payload, in the same order.
+    """
+    # Computed once per batch, instead of once per notification
+    provider_types_by_email = None
+    provider_names = None
+
+    results = []
+    with transaction.atomic():
+        for index, (raw_payload, provider_type) in enumerate(payloads):
+            email_message = email.message_from_bytes(raw_payload)
+            sender = EmailSource.extract_email_source(email_message["From"] or "")
+            if not provider_type:
+                if provider_types_by_email is None:
+                    provider_types_by_email = get_provider_types_by_email(provider_queryset)
+                provider_type = provider_types_by_email.get(sender)
+            elif provider_queryset is not None:
+                if provider_names is None:
+                    provider_names = set(provider_queryset.values_list("name", flat=True))
+                if provider_type not in provider_names:
+                    results.append(RawNotificationIngestResult(None, "failed", f"Provider {provider_type} not found"))
+                    continue
+            if not provider_type:
+                results.append(
+                    RawNotificationIngestResult(None, "failed", f"Not possible to determine the provider for {sender}")
+                )
+                continue
+
+            notification = MaintenanceNotification(
+                msg_id=(email_message["Message-ID"] or str(index)).encode(),
+                source=source,
+                sender=sender,
+                subject=email_message["Subject"] or "",
+                provider_type=provider_type,
+                raw_payload=raw_payload,
+                date=email_message["Date"] or "",
+            )
+            job.logger.info(f"Processing notification `{notification.subject}`.", extra={"object": notification})
+            try:
+                with transaction.atomic():
+                    raw_id = process_raw_notification(job, notification)
+            except Exception as exc:
+                job.logger.error(
+                    "Unexpected exception when parsing notifications",
+                    extra={"object": notification},
+                    exc_info=True,
+                )
+                results.append(RawNotificationIngestResult(None, "failed", str(exc)))
+            else:
+                results.append(RawNotificationIngestResult(raw_id, "processed" if raw_id else "skipped"))
+
+    return results
 
 
 class DryRunTransactionSkip(Exception):
@@ -396,6 +607,11 @@ class HandleCircuitMaintenanceNotifications(Job):
     """Job to handle external circuit maintenance notifications and turn them into Circuit Maintenances."""
 
     dryrun = DryRunVar()
+    notification_source = ObjectVar(
+        model=NotificationSource,
+        required=False,
+        description="Only fetch the notifications from this source, all the sources if not defined.",
+    )
 
     class Meta:
         """Meta object boilerplate for HandleParsedNotifications."""
@@ -405,21 +621,23 @@ class HandleCircuitMaintenanceNotifications(Job):
         description = "Fetch Circuit Maintenance Notifications from Sources and create or update Circuit Maintenances accordingly."
 
     # pylint: disable=arguments-differ
-    def run(self, dryrun=False) -> List[uuid.UUID]:
+    def run(self, dryrun=False, notification_source=None) -> List[uuid.UUID]:
         """Fetch notifications, process them and update Circuit Maintenance accordingly."""
         self.logger.debug("Starting Handle Notifications job.")
 
         notification_sources = NotificationSource.objects.all()
+        if notification_source:
+            notification_sources = notification_sources.filter(pk=notification_source.pk)
+        notification_sources = list(notification_sources)
         if not notification_sources:
             self.logger.warning("No notification sources configured to retrieve notifications from.")
             return []
+        previous_watermarks = {
+            notification_source.name: notification_source.last_fetched for notification_source in notification_sources
+        }
 
         try:
-            notifications = get_notifications(
-                job=self,
-                notification_sources=notification_sources,
-                since=get_since_reference(self),
-            )
+            notifications = get_notifications(job=self, notification_sources=notification_sources)
         except Exception:
             self.logger.error(
                 f"Unexpected exception when retrieving notifications from sources ({notification_sources})",
@@ -429,9 +647,11 @@ class HandleCircuitMaintenanceNotifications(Job):
 
         if not notifications:
             self.logger.info("No notifications received.")
+            self.save_watermarks(notification_sources, dryrun)
             return []
 
         raw_notification_ids = []
+        failed_notifications = []
         for notification in notifications:
             self.logger.info(f"Processing notification `{notification.subject}`.", extra={"object": notification})
             try:
@@ -449,7 +669,66 @@ class HandleCircuitMaintenanceNotifications(Job):
                     extra={"object": notification},
                     exc_info=True,
                 )
+                failed_notifications.append(notification)
 
         self.logger.info(f"{len(raw_notification_ids)} notifications processed.")
+        self.cap_watermarks(notification_sources, previous_watermarks, failed_notifications)
+        self.save_watermarks(notification_sources, dryrun)
 
         return raw_notification_ids
+
+    def cap_watermarks(
+        self,
+        notification_sources: List[NotificationSource],
+        previous_watermarks: Dict[str, Optional[datetime.datetime]],
+        failed_notifications: List[MaintenanceNotification],
+    ):
+        """Move back the watermark of the sources with failed notifications, to fetch these notifications again.
+
+        The watermark is capped at the date of the oldest failed notification of the source, or kept at its previous
+        value if the date of any of them can't be parsed.
+        """
+        failed_stamps = collections.defaultdict(list)
+        for notification in failed_notifications:
+            try:
+                stamp = parser.parse(notification.date)
+            except (OverflowError, ValueError):
+                stamp = None
+            else:
+                if stamp.tzinfo is None:
+                    stamp = stamp.replace(tzinfo=datetime.timezone.utc)
+            failed_stamps[notification.source.name].append(stamp)
+
+        for notification_source in notification_sources:
+            stamps = failed_stamps.get(notification_source.name)
+            if not stamps or notification_source.last_fetched is None:
+                continue
+            if None in stamps:
+                notification_source.last_fetched = previous_watermarks.get(notification_source.name)
+            else:
+                notification_source.last_fetched = min(notification_source.last_fetched, *stamps)
+            self.logger.warning(
+                f"{len(stamps)} notifications from {notification_source.name} failed, they will be fetched again "
+                f"since {notification_source.last_fetched}.",
+                extra={"object": notification_source},
+            )
+
+    @staticmethod
+    def save_watermarks(notification_sources: List[NotificationSource], dryrun: bool):
+        """Save the `last_fetched` watermark of the sources, updated by `get_notifications`, unless in dryrun mode."""
+        if not dryrun:
+            NotificationSource.objects.bulk_update(notification_sources, ["last_fetched"])
+
+
+def enqueue_handle_notifications(notification_source: NotificationSource, user) -> JobResult:
+    """Enqueue the processing of the notifications from a single source.
+
+    Args:
+        notification_source (NotificationSource): Source to fetch the notifications from.
+        user (User): User to run the Job as.
+
+    Returns:
+        JobResult: Result of the enqueued Job.
+    """
+    job_model = JobModel.objects.get_for_class_path(HandleCircuitMaintenanceNotifications.class_path)
+    return JobResult.enqueue_job(job_model, user, dryrun=False, notification_source=str(notification_source.pk))
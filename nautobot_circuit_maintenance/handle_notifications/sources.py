@@ -19,6 +19,7 @@ try:
 except ImportError:
     EXCHANGELIB_PRESENT = False
 from django.conf import settings
+from django.core.cache import cache
 from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
@@ -34,6 +35,10 @@ from nautobot_circuit_maintenance.models import NotificationSource
 
 logger = logging.getLogger(__name__)
 
+# Gmail keeps one watch per mailbox, its request and expiration are cached to only renew it when it's about to expire
+WATCH_CACHE_KEY_PREFIX = "nautobot_circuit_maintenance.gmail_watch"
+WATCH_RENEWAL_MARGIN = datetime.timedelta(days=1)
+
 
 # pylint: disable=broad-except
 
@@ -172,6 +177,10 @@ class Source(BaseModel):
                     limit_emails_with_not_header_from=config.get("limit_emails_with_not_header_from", []),
                     extra_scopes=config.get("extra_scopes", []),
                     labels=config.get("labels", {}),
+                    pubsub_topic=config.get("pubsub_topic"),
+                    push_label_ids=config.get("push_label_ids", ["INBOX"]),
+                    push_token=config.get("push_token"),
+                    push_username=config.get("push_username"),
                 )
 
         raise ValueError(
@@ -542,6 +551,12 @@ class GmailAPI(EmailSource):
     extra_scopes: List[str] = []
     limit_emails_with_not_header_from: List[str] = []
     labels: Dict[str, str] = {}
+    # Gmail push notifications, see https://developers.google.com/gmail/api/guides/push
+    pubsub_topic: Optional[str] = None
+    # Only the changes of the messages with these labels are pushed, not the labels applied by `tag_message`
+    push_label_ids: List[str] = ["INBOX"]
+    push_token: Optional[str] = None
+    push_username: Optional[str] = None
 
     class Config:
         """Pydantic BaseModel config."""
@@ -658,6 +673,36 @@ class GmailAPI(EmailSource):
 
         return search_criteria
 
+    def watch(self, job: Job) -> Optional[Dict]:
+        """Start, or renew, the push notifications of the mailbox changes to the `pubsub_topic`, if defined.
+
+        Gmail stops pushing notifications after 7 days, so they are renewed when notifications are received less
+        than `WATCH_RENEWAL_MARGIN` before the expiration stored in the cache, or if the watch request changed.
+
+        Returns:
+            Optional[Dict]: Gmail response to the watch request, None if it wasn't sent or it failed.
+        """
+        if not self.pubsub_topic:
+            return None
+
+        body = {"topicName": self.pubsub_topic, "labelIds": self.push_label_ids, "labelFilterAction": "include"}
+        cache_key = f"{WATCH_CACHE_KEY_PREFIX}.{self.account}"
+        watched = cache.get(cache_key)
+        renew_at = datetime.datetime.now(datetime.timezone.utc) + WATCH_RENEWAL_MARGIN
+        if watched and watched["body"] == body and int(watched["expiration"]) > renew_at.timestamp() * 1000:
+            return None
+
+        request = self.service.users().watch(userId=self.account, body=body)  # pylint: disable=no-member
+        try:
+            response = self._execute_with_retries(request, job)
+        except HttpError:
+            job.logger.warning(f"Error in watching {self.name} with topic {self.pubsub_topic}:", exc_info=True)
+            return None
+
+        cache.set(cache_key, {"body": body, "expiration": response["expiration"]}, timeout=None)
+        job.logger.debug(f"Push notifications from {self.name} to {self.pubsub_topic} until {response['expiration']}.")
+        return response
+
     def tag_message(self, job: Job, msg_id: Union[str, bytes], tag: MessageProcessingStatus):
         """Apply the given Gmail label to the given message."""
         # Do we have a configured label ID corresponding to the given tag?
@@ -684,6 +729,7 @@ class GmailAPI(EmailSource):
         """Retrieve emails since an specific time, if provided."""
         self.load_credentials()
         self.build_service()
+        self.watch(job)
 
         search_criteria = self._get_search_criteria(since_timestamp)
 
@@ -767,17 +813,48 @@ class GmailAPIServiceAccount(GmailAPI):
             self.credentials.refresh(Request())
 
 
+def get_since_reference(job: Job, notification_source: NotificationSource) -> int:
+    """Get the timestamp to fetch the notifications of a source since.
+
+    It's the `last_fetched` watermark of the source or, for sources never fetched, a reference from config
+    `raw_notification_initial_days_since`.
+    """
+    if notification_source.last_fetched:
+        since_reference = int(notification_source.last_fetched.timestamp())
+    else:
+        since_reference = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            days=settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {}).get(
+                "raw_notification_initial_days_since"
+            )
+        )
+        since_reference = int(since_reference.timestamp())
+    job.logger.info(
+        f"Processing notifications from {notification_source.name} since {since_reference}",
+        extra={"object": notification_source},
+    )
+    return since_reference
+
+
 def get_notifications(
     job: Job,
     notification_sources: Iterable[NotificationSource],
-    since: int,
+    since: Optional[int] = None,
 ) -> Iterable[MaintenanceNotification]:
-    """Method to fetch notifications from multiple sources and return MaintenanceNotification objects."""
+    """Method to fetch notifications from multiple sources and return MaintenanceNotification objects.
+
+    Each source is fetched since its own `last_fetched` watermark, unless `since` is provided. The watermark of every
+    source fetched is moved to the start of its fetch, only in memory, for the caller to save it once the notifications
+    are processed.
+    """
     received_notifications = []
 
     for notification_source in notification_sources:
         try:
-            since_date = datetime.datetime.fromtimestamp(since)
+            fetch_started = datetime.datetime.now(datetime.timezone.utc)
+            if since is None:
+                since_date = datetime.datetime.fromtimestamp(get_since_reference(job, notification_source))
+            else:
+                since_date = datetime.datetime.fromtimestamp(since)
             since_txt = since_date.strftime("%d-%b-%Y")
 
             try:
@@ -808,6 +885,7 @@ def get_notifications(
 
                 raw_notifications = source.receive_notifications(job, since_date)
                 received_notifications.extend(raw_notifications)
+                notification_source.last_fetched = fetch_started
 
                 if not raw_notifications:
                     job.logger.info(
@@ -0,0 +1,142 @@
+"""Materialized set of the circuits impacted right now by the active Circuit Maintenances."""
+
+import logging
+import math
+import uuid
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Min
+
+from .choices import IMPACT_SEVERITY, CircuitImpactChoices
+from .models import CircuitImpact, CircuitMaintenance, ImpactedCircuit
+
+# Statuses that we understand a Circuit Maintenance is expected to run
+# Not all the providers use all the standard statuses.
+ACTIVE_STATUSES = ["CONFIRMED", "IN-PROCESS", "RE-SCHEDULED"]
+
+# Version of the maintenances data, changed on every invalidation
+VERSION_CACHE_KEY = "nautobot_circuit_maintenance.impacted_circuits.version"
+# Timestamp of the next start or end of an active maintenance, when the ImpactedCircuit table gets outdated. It's
+# stored per version, so the refresh of an older version doesn't hide an invalidation happening meanwhile.
+REFRESH_AT_CACHE_KEY = "nautobot_circuit_maintenance.impacted_circuits.refresh_at"
+# The timestamps of the older versions expire, the current one is rebuilt by the refresh Job if it expires too
+REFRESH_AT_CACHE_TIMEOUT = 86400
+
+logger = logging.getLogger(__name__)
+
+
+def get_active_circuit_maintenances(now=None):
+    """Return the Circuit Maintenances running at `now`, by default the current time.
+
+    The query is served by the `(status, start_time, end_time)` index of CircuitMaintenance.
+    """
+    now = now or datetime.now(timezone.utc)
+    return CircuitMaintenance.objects.filter(status__in=ACTIVE_STATUSES, start_time__lte=now, end_time__gte=now)
+
+
+def get_refresh_at_cache_key() -> str:
+    """Return the cache key of the refresh timestamp of the current version of the maintenances data."""
+    version = cache.get_or_set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+    return f"{REFRESH_AT_CACHE_KEY}.{version}"
+
+
+def invalidate_impacted_circuits():
+    """Flag the ImpactedCircuit table as outdated, to be rebuilt by the next refresh."""
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def is_impacted_circuits_outdated(now=None) -> bool:
+    """Return whether the ImpactedCircuit table was invalidated, or a maintenance started or ended, since its refresh."""
+    refresh_at = cache.get(get_refresh_at_cache_key())
+    return refresh_at is None or refresh_at < (now or datetime.now(timezone.utc)).timestamp()
+
+
+def refresh_impacted_circuits(now=None) -> int:
+    """Rebuild the ImpactedCircuit table with the worst impact of the maintenances running at `now` on every circuit.
+
+    If another refresh stores the table at the same time, the table is left outdated for the next refresh.
+
+    Returns:
+        int: Number of circuits impacted.
+    """
+    now = now or datetime.now(timezone.utc)
+    # Read before the maintenances, so any later invalidation leaves this refresh outdated
+    refresh_at_cache_key = get_refresh_at_cache_key()
+    active_circuit_maintenances = get_active_circuit_maintenances(now)
+
+    worst_impacts = {}
+    for circuit_impact in (
+        CircuitImpact.objects.filter(maintenance__in=active_circuit_maintenances)
+        .exclude(impact=CircuitImpactChoices.NO_IMPACT)
+        .select_related("maintenance", "circuit")
+    ):
+        worst_impact = worst_impacts.get(circuit_impact.circuit_id)
+        if worst_impact is None or IMPACT_SEVERITY[circuit_impact.impact] > IMPACT_SEVERITY[worst_impact.impact]:
+            worst_impacts[circuit_impact.circuit_id] = circuit_impact
+
+    # The set changes when an active maintenance ends or when an upcoming one starts
+    next_end = active_circuit_maintenances.aggregate(Min("end_time"))["end_time__min"]
+    next_start = CircuitMaintenance.objects.filter(status__in=ACTIVE_STATUSES, start_time__gt=now).aggregate(
+        Min("start_time")
+    )["start_time__min"]
+    boundaries = [boundary.timestamp() for boundary in (next_end, next_start) if boundary]
+
+    try:
+        with transaction.atomic():
+            ImpactedCircuit.objects.all().delete()
+            ImpactedCircuit.objects.bulk_create(
+                ImpactedCircuit(
+                    circuit=circuit_impact.circuit,
+                    cid=circuit_impact.circuit.cid,
+                    impact=circuit_impact.impact,
+                    maintenance=circuit_impact.maintenance,
+                    end_time=circuit_impact.maintenance.end_time,
+                )
+                for circuit_impact in worst_impacts.values()
+            )
+    except IntegrityError:
+        logger.warning("Impacted circuits stored by a concurrent refresh, leaving them outdated")
+        return len(worst_impacts)
+
+    cache.set(refresh_at_cache_key, min(boundaries, default=math.inf), timeout=REFRESH_AT_CACHE_TIMEOUT)
+    return len(worst_impacts)
+
+
+def invalidate_and_refresh_impacted_circuits():
+    """Invalidate the ImpactedCircuit table and rebuild it right away.
+
+    A failure of the rebuild, run after the commit of the changes, is only logged, leaving the table outdated for the
+    refresh Job.
+    """
+    invalidate_impacted_circuits()
+    try:
+        refresh_impacted_circuits()
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Impacted circuits refresh failed, leaving them outdated")
+
+
+def refresh_impacted_circuits_on_commit():
+    """Invalidate and rebuild the ImpactedCircuit table once the current transaction commits.
+
+    It's invalidated after the commit, as a refresh from another transaction in between would rebuild the table without
+    the changes of this one. The rebuild is scheduled once per transaction, or savepoint, whatever the number of
+    changes in it.
+    """
+    connection = transaction.get_connection()
+    savepoint_ids = set(connection.savepoint_ids)
+    if not any(
+        callback is invalidate_and_refresh_impacted_circuits and callback_savepoint_ids == savepoint_ids
+        for callback_savepoint_ids, callback, *_ in connection.run_on_commit
+    ):
+        transaction.on_commit(invalidate_and_refresh_impacted_circuits)
+
+
+def get_impacted_circuits():
+    """Return the ImpactedCircuit queryset, as rebuilt on the last change or by the refresh Job.
+
+    Looking up circuits by `circuit` or `cid` in the returned queryset only hits their indexes, whatever the number of
+    maintenances.
+    """
+    return ImpactedCircuit.objects.all()
@@ -3,8 +3,17 @@
 from nautobot.core.celery import register_jobs
 
 from nautobot_circuit_maintenance.handle_notifications.handler import HandleCircuitMaintenanceNotifications
+from nautobot_circuit_maintenance.jobs.impacted_circuits_refresh import RefreshImpactedCircuits
 from nautobot_circuit_maintenance.jobs.location_search import FindLocationsWithMaintenanceOverlap
+from nautobot_circuit_maintenance.jobs.notification_reprocess import ReprocessNotifications
+from nautobot_circuit_maintenance.jobs.notification_retention import PruneNotifications
 
-jobs = [FindLocationsWithMaintenanceOverlap, HandleCircuitMaintenanceNotifications]
+jobs = [
+    FindLocationsWithMaintenanceOverlap,
+    HandleCircuitMaintenanceNotifications,
+    PruneNotifications,
+    RefreshImpactedCircuits,
+    ReprocessNotifications,
+]
 
 register_jobs(*jobs)
@@ -0,0 +1,36 @@
+"""Job to rebuild the circuits impacted right now when a maintenance starts or ends."""
+
+from nautobot.extras.jobs import BooleanVar, Job
+
+from nautobot_circuit_maintenance.impacted_circuits import is_impacted_circuits_outdated, refresh_impacted_circuits
+
+name = "Circuit Maintenance"  # pylint: disable=invalid-name
+
+
+class RefreshImpactedCircuits(Job):
+    """Job to rebuild the ImpactedCircuit table.
+
+    The changes of the maintenances rebuild the table on commit, but the start or the end of a maintenance doesn't
+    change anything, so this Job has to be scheduled to rebuild the table after them. It does nothing if the table is
+    up to date.
+    """
+
+    force = BooleanVar(default=False, description="Rebuild the impacted circuits even if they are up to date.")
+
+    class Meta:
+        """Meta definition for the Job."""
+
+        name = "Refresh Impacted Circuits"
+        has_sensitive_variables = False
+        description = "Rebuild the circuits impacted right now after the start or the end of a maintenance."
+
+    # pylint: disable-next=arguments-differ
+    def run(self, force=False) -> int:
+        """Executes the Job."""
+        if not force and not is_impacted_circuits_outdated():
+            self.logger.info("Impacted circuits up to date.")
+            return 0
+
+        impacted = refresh_impacted_circuits()
+        self.logger.info(f"{impacted} impacted circuits stored.")
+        return impacted
@@ -2,17 +2,27 @@
 """Location searching Job definition."""
 
 import collections
-from datetime import date
+import uuid
+from datetime import date, datetime
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
 from django.conf import settings
-from nautobot.circuits.models import Circuit
-from nautobot.extras.jobs import Job
-
-from nautobot_circuit_maintenance.models import CircuitMaintenance
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.models import Location
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.jobs import BooleanVar, Job
+from nautobot.extras.models import JobResult
+
+from nautobot_circuit_maintenance.choices import IMPACT_SEVERITY, CircuitImpactChoices
+from nautobot_circuit_maintenance.models import CircuitImpact, CircuitMaintenance, MaintenanceOverlap
+from nautobot_circuit_maintenance.signals import invalidate_dashboard_cache
 
 PLUGIN_SETTINGS = settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {})
 CIRCUIT_MAINTENANCE_TAG_COLOR = "Purple"
-
+# Key of the Job result of the runs storing MaintenanceOverlaps, the only ones to reevaluate incrementally from
+OVERLAPS_RESULT_KEY = "maintenance_overlaps"
 name = "Circuit Maintenance"  # pylint: disable=invalid-name
 
 
@@ -26,43 +36,243 @@ def check_for_overlap(record1: CircuitMaintenance, record2: CircuitMaintenance)
     Returns:
         bool: True if there is overlap, otherwise False.
     """
-    if record1.end_time < record2.start_time or record2.end_time < record1.start_time:
-        return False
+    return bool(find_overlapping_maintenances([record1, record2]))
+
+
+class OverlapWindow(NamedTuple):
+    """Window of time where a set of maintenances are happening at the same time."""
+
+    start_time: datetime
+    end_time: datetime
+    maintenances: Tuple[CircuitMaintenance, ...]
+
+
+def sort_maintenance_events(maintenances: Iterable[CircuitMaintenance]) -> List[Tuple[datetime, int, int]]:
+    """Sort the start and end times of the maintenances, to sweep a line over them.
+
+    Start events (0) are sorted before end events (1) happening at the same time, so maintenances that end at the very
+    same time that other starts are considered overlapping.
+
+    Args:
+        maintenances (Iterable[CircuitMaintenance]): Maintenance records.
+
+    Returns:
+        List[Tuple[datetime, int, int]]: Time, type and index in `maintenances` of every event, sorted by time.
+    """
+    events = []
+    for index, maintenance in enumerate(maintenances):
+        events.append((maintenance.start_time, 0, index))
+        events.append((maintenance.end_time, 1, index))
+    events.sort()
+    return events
+
+
+def find_overlapping_maintenances(maintenances: Iterable[CircuitMaintenance]) -> List[OverlapWindow]:
+    """Find every maximal set of maintenances that are happening at the same time.
+
+    Sweep line over the sorted start and end times of the maintenances, keeping track of the active ones. Every time
+    an end follows a start, the active maintenances are a maximal overlapping set, so each set is reported once in
+    O(n log n + k), being k the size of the output. As in `check_for_overlap`, maintenances that end at the very same
+    time that other starts are considered overlapping.
+
+    Args:
+        maintenances (Iterable[CircuitMaintenance]): Maintenance records, typically the ones at a single location.
+
+    Returns:
+        List[OverlapWindow]: Overlapping windows, sorted by time, with two or more maintenances each.
+    """
+    maintenances = list(maintenances)
+    overlaps = []
+    active_maintenances = {}
+    window_start = None
+    for event_time, event_type, index in sort_maintenance_events(maintenances):
+        if event_type == 0:
+            active_maintenances[index] = maintenances[index]
+            window_start = event_time
+            continue
+
+        if window_start is not None and len(active_maintenances) > 1:
+            overlaps.append(
+                OverlapWindow(
+                    start_time=window_start,
+                    end_time=event_time,
+                    maintenances=tuple(active_maintenances.values()),
+                )
+            )
+        window_start = None
+        del active_maintenances[index]
+
+    return overlaps
+
+
+class CapacityShortfall(NamedTuple):
+    """Window of time where the available circuits at a location are below the minimum."""
 
-    return True
+    start_time: datetime
+    end_time: datetime
+    available_circuits: int
+    total_circuits: int
+    maintenances: Tuple[CircuitMaintenance, ...]
 
 
-def get_locations_from_circuit(circuit: Circuit) -> set:
-    """Get a list of locations from a circuit object in Nautobot.
+def find_capacity_shortfalls(
+    unavailable_circuits: Iterable[Tuple[uuid.UUID, CircuitMaintenance]],
+    total_circuits: int,
+    min_available_circuits: int,
+) -> List[CapacityShortfall]:
+    """Find the windows of time where the available circuits at a location are below the minimum.
+
+    Sweep line over the sorted start and end times of the maintenances, counting how many distinct circuits are
+    unavailable at every point in time, so a circuit impacted by several overlapping maintenances is only counted once.
 
     Args:
-        circuit (Circuit): Nautobot Circuit Object to find the locations
+        unavailable_circuits (Iterable[Tuple[uuid.UUID, CircuitMaintenance]]): Circuit ID and maintenance making it
+            unavailable, for every circuit terminating at the location.
+        total_circuits (int): Number of circuits terminating at the location.
+        min_available_circuits (int): Minimum number of available circuits for the location to not be flagged.
+
+    Returns:
+        List[CapacityShortfall]: Windows below the minimum, sorted by time, with the lowest available circuits.
+    """
+    unavailable_circuits = list(unavailable_circuits)
+    events = sort_maintenance_events(maintenance for _, maintenance in unavailable_circuits)
+
+    shortfalls = []
+    down_circuits = collections.Counter()
+    active_maintenances = {}
+    window_start = None
+    window_maintenances = {}
+    lowest_available = total_circuits
+    for event_time, event_type, index in events:
+        circuit_id, maintenance = unavailable_circuits[index]
+        if event_type == 0:
+            down_circuits[circuit_id] += 1
+            active_maintenances[index] = maintenance
+            if window_start is not None:
+                window_maintenances[maintenance] = None
+        else:
+            down_circuits[circuit_id] -= 1
+            if not down_circuits[circuit_id]:
+                del down_circuits[circuit_id]
+            del active_maintenances[index]
+
+        available_circuits = total_circuits - len(down_circuits)
+        if available_circuits < min_available_circuits:
+            if window_start is None:
+                window_start = event_time
+                window_maintenances = dict.fromkeys(active_maintenances.values())
+                lowest_available = available_circuits
+            lowest_available = min(lowest_available, available_circuits)
+        elif window_start is not None:
+            shortfalls.append(
+                CapacityShortfall(
+                    start_time=window_start,
+                    end_time=event_time,
+                    available_circuits=lowest_available,
+                    total_circuits=total_circuits,
+                    maintenances=tuple(window_maintenances),
+                )
+            )
+            window_start = None
 
+    return shortfalls
+
+
+class MaintenanceLocationImpact(NamedTuple):
+    """Impact of a maintenance on a circuit terminating at a location."""
+
+    maintenance_id: uuid.UUID
+    circuit_id: uuid.UUID
+    location_id: uuid.UUID
+    location_name: str
+    impact: str
+
+
+def get_maintenance_location_impacts(
+    maintenance_queryset, location_ids: Optional[Iterable[uuid.UUID]] = None
+) -> List[MaintenanceLocationImpact]:
+    """Get the locations impacted by the maintenances, in a single query.
+
+    Follows CircuitImpact -> Circuit -> CircuitTermination -> Location, so terminations attached to a Provider Network
+    instead of a Location are not included.
+
+    Args:
+        maintenance_queryset (Queryset): Queryset of Circuit Maintenance objects
+        location_ids (Iterable[uuid.UUID]): If provided, only these locations are included.
 
     Returns:
-        list: List of Nautobot Location objects
+        List[MaintenanceLocationImpact]: Maintenance, circuit, location and impact for every impacted circuit
+            termination.
     """
-    location_set: set = set()
-    for term in [circuit.circuit_termination_a, circuit.circuit_termination_z]:
-        if term is not None and getattr(term, "provider_network") is None:
-            location_set.add(term.location)
+    termination_filter = {"circuit__circuit_terminations__location__isnull": False}
+    if location_ids is not None:
+        termination_filter["circuit__circuit_terminations__location_id__in"] = list(location_ids)
+
+    # A single filter() call, so both conditions and the values apply to the same join of the terminations
+    rows = (
+        CircuitImpact.objects.filter(maintenance__in=maintenance_queryset, **termination_filter)
+        .order_by()
+        .values_list(
+            "maintenance_id",
+            "circuit_id",
+            "circuit__circuit_terminations__location_id",
+            "circuit__circuit_terminations__location__name",
+            "impact",
+        )
+        .distinct()
+    )
+    return [MaintenanceLocationImpact(*row) for row in rows]
 
-    return location_set
 
+def annotate_has_impactful_circuit(maintenance_queryset):
+    """Annotate the maintenances with `has_impactful_circuit`, True if any of its impacts is not `NO-IMPACT`.
 
-def build_locations_to_maintenance_mapper(maintenance_queryset) -> dict:
+    Args:
+        maintenance_queryset (Queryset): Queryset of Circuit Maintenance objects
+
+    Returns:
+        Queryset: The annotated queryset, resolved with a single `EXISTS` subquery.
+    """
+    return maintenance_queryset.annotate(
+        has_impactful_circuit=Exists(
+            CircuitImpact.objects.filter(maintenance=OuterRef("pk")).exclude(impact=CircuitImpactChoices.NO_IMPACT)
+        )
+    )
+
+
+def get_circuits_per_location(location_ids: Iterable[uuid.UUID]) -> dict:
+    """Get the number of distinct circuits terminating at each location, in a single query.
+
+    Args:
+        location_ids (Iterable[uuid.UUID]): IDs of the locations to count circuits for.
+
+    Returns:
+        dict: Number of circuits, keyed by location ID.
+    """
+    return dict(
+        CircuitTermination.objects.filter(location_id__in=list(location_ids))
+        .order_by()
+        .values("location_id")
+        .annotate(circuit_count=Count("circuit_id", distinct=True))
+        .values_list("location_id", "circuit_count")
+    )
+
+
+def build_locations_to_maintenance_mapper(
+    maintenance_queryset, location_impacts: Optional[List[MaintenanceLocationImpact]] = None
+) -> dict:
     """Build a location to circuit maintenance mapper so the data can be quickly accessed of what possible overlaps.
 
     Leverages defaultdict to provide the default value of an empty set to each key that will be added. Then adds each
     particular circuit maintenance object to the dictionary to be used as a map of maintenances going on at the location.
-    Build a data dictionary that maps locations to circuit maintenances:
+    Build a data dictionary that maps location IDs to circuit maintenances:
 
     data_dict = {
-        "msp": {
+        <msp location ID>: {
             CM1,
             CM2
         },
-        "nyc": {
+        <nyc location ID>: {
             CM3,
             CM4
         }
@@ -70,86 +280,167 @@ def build_locations_to_maintenance_mapper(maintenance_queryset) -> dict:
 
     Args:
         maintenance_queryset (Queryset): Queryset of all Circuit Maintenance objects
+        location_impacts (List[MaintenanceLocationImpact]): Result of `get_maintenance_location_impacts`, if already
+            computed for the same queryset.
 
     Returns:
         dict: Dictionary of a set of maintenance records
     """
+    if location_impacts is None:
+        location_impacts = get_maintenance_location_impacts(maintenance_queryset)
+
+    maintenances_by_id = {record.pk: record for record in maintenance_queryset}
     return_dictionary = collections.defaultdict(set)
-    for record in maintenance_queryset:
-        # Get the location overall
-        # Start with looping over the circuits that are defined
-        for circuit in record.circuits:
-            # Check both termination A and Z for values of None, add that record to the set for each location
-            for term in [circuit.circuit_termination_a, circuit.circuit_termination_z]:
-                if term is not None and term.location is not None:
-                    return_dictionary[term.location.name].add(record)
+    for location_impact in location_impacts:
+        return_dictionary[location_impact.location_id].add(maintenances_by_id[location_impact.maintenance_id])
 
     return dict(return_dictionary)
 
 
+def get_touched_location_ids(since: datetime) -> set:
+    """Get the locations that could have different overlaps because of changes since a moment in time.
+
+    These are the locations of the CircuitMaintenances or CircuitImpacts updated since then, plus the locations of
+    the stored MaintenanceOverlaps referencing updated maintenances or left with less than two maintenances after a
+    deletion. Deleting a CircuitImpact updates its CircuitMaintenance, and deleting a CircuitMaintenance updates the
+    other maintenances of its MaintenanceOverlaps, see `signals.py`.
+
+    Args:
+        since (datetime): Moment in time to look for changes from.
+
+    Returns:
+        set: IDs of the locations to reevaluate.
+    """
+    touched_maintenances = CircuitMaintenance.objects.filter(
+        Q(last_updated__gte=since) | Q(circuitimpact__last_updated__gte=since)
+    ).values("pk")
+
+    location_ids = set(
+        CircuitImpact.objects.filter(
+            maintenance__in=touched_maintenances, circuit__circuit_terminations__location__isnull=False
+        ).values_list("circuit__circuit_terminations__location_id", flat=True)
+    )
+    location_ids.update(
+        MaintenanceOverlap.objects.filter(maintenances__in=touched_maintenances).values_list("location_id", flat=True)
+    )
+    location_ids.update(
+        MaintenanceOverlap.objects.annotate(maintenance_count=Count("maintenances"))
+        .filter(maintenance_count__lt=2)
+        .values_list("location_id", flat=True)
+    )
+
+    return location_ids
+
+
+def save_maintenance_overlaps(
+    overlaps: List[Tuple[uuid.UUID, OverlapWindow]],
+    location_impacts: List[MaintenanceLocationImpact],
+    since: date,
+    location_ids: Optional[Iterable[uuid.UUID]] = None,
+):
+    """Replace the stored MaintenanceOverlaps with the ones just computed.
+
+    The stored overlaps ending since the reference date, for the evaluated locations, are deleted and the new ones are
+    bulk created in the same transaction.
+
+    Args:
+        overlaps (List[Tuple[uuid.UUID, OverlapWindow]]): Location ID and overlapping window to store.
+        location_impacts (List[MaintenanceLocationImpact]): Result of `get_maintenance_location_impacts`, used to
+            compute the worst impact of every overlap.
+        since (date): Reference date of the evaluated maintenances.
+        location_ids (Iterable[uuid.UUID]): IDs of the evaluated locations, all of them if not provided.
+    """
+    worst_impacts = {}
+    for location_impact in location_impacts:
+        key = (location_impact.location_id, location_impact.maintenance_id)
+        if key not in worst_impacts or IMPACT_SEVERITY[location_impact.impact] > IMPACT_SEVERITY[worst_impacts[key]]:
+            worst_impacts[key] = location_impact.impact
+
+    maintenance_overlaps = []
+    maintenance_overlap_maintenances = []
+    for location_id, overlap in overlaps:
+        maintenance_overlap = MaintenanceOverlap(
+            location_id=location_id,
+            start_time=overlap.start_time,
+            end_time=overlap.end_time,
+            impact=max(
+                (worst_impacts[(location_id, circuit_maint.pk)] for circuit_maint in overlap.maintenances),
+                key=IMPACT_SEVERITY.get,
+            ),
+        )
+        maintenance_overlaps.append(maintenance_overlap)
+        maintenance_overlap_maintenances.extend(
+            MaintenanceOverlap.maintenances.through(
+                maintenanceoverlap_id=maintenance_overlap.pk, circuitmaintenance_id=circuit_maint.pk
+            )
+            for circuit_maint in overlap.maintenances
+        )
+
+    outdated_overlaps = MaintenanceOverlap.objects.filter(end_time__gte=since)
+    if location_ids is not None:
+        outdated_overlaps = outdated_overlaps.filter(location_id__in=list(location_ids))
+
+    with transaction.atomic():
+        outdated_overlaps.delete()
+        MaintenanceOverlap.objects.bulk_create(maintenance_overlaps)
+        MaintenanceOverlap.maintenances.through.objects.bulk_create(maintenance_overlap_maintenances)
+
+    # The overlaps are rendered in the dashboard, and bulk operations don't trigger signals
+    invalidate_dashboard_cache()
+
+
 class FindLocationsWithMaintenanceOverlap(Job):
     """Nautobot Job definition for finding locations without redundant circuit for impactful maintenance.
 
-    Current iteration of this job assumes that many locations will be only dual carrier connected. The searches are going
-    to search for a single overlap in this first iteration.
+    The searches report every set of maintenances happening at the same time at a location, using a sweep line per
+    location. Then, counting all the circuits terminating at each location, it reports the windows of time where the
+    circuits not in outage are below the `overlap_job_min_available_circuits` setting, so locations with more than two
+    carriers are only reported when their redundancy is actually lost.
 
-    Future iterations may include the ability to search for multiple circuit overlaps that would allow for just a single
-    circuit to be available.
+    The overlaps are stored as MaintenanceOverlap objects. Unless a full recompute is requested, only the locations
+    with changes since the last successful run are reevaluated.
     """
 
+    full_recompute = BooleanVar(
+        default=False,
+        description="Reevaluate all the locations, instead of only the ones with changes since the last successful run.",
+    )
+
     class Meta:
         """Meta definition for the Job."""
 
         name = "Find Locations With Circuit Maintenance Overlap"
-        description = "Search for locations with overlapping circuit maintenances, 1 or more circuit impacts, assuming only TWO circuits per location."
+        description = "Search for locations with overlapping circuit maintenances, and locations where the circuits available during maintenances are below the minimum."
 
     # TBD: Check options to remove this pylint disable
     # pylint: disable-next=arguments-differ
-    def run(self):
+    def run(self, full_recompute=False):
         """Executes the Job."""
         # Query for all of the circuits maintenances that are on going in the future
         today = date.today()
-        circuit_maintenances = CircuitMaintenance.objects.filter(start_time__gte=today).order_by("start_time")
+        circuit_maintenances = annotate_has_impactful_circuit(
+            CircuitMaintenance.objects.filter(end_time__gte=today).order_by("start_time")
+        )
 
-        # Build a circuit mapper
-        circuit_maintenance_mapper = build_locations_to_maintenance_mapper(circuit_maintenances)
+        location_ids = None if full_recompute else self.get_location_ids_to_reevaluate()
+        if location_ids is not None:
+            self.logger.info(
+                f"Reevaluating {len(location_ids)} location{'s'[:len(location_ids)^1]} with changes since the last successful run."
+            )
 
-        # Loop over each of the circuit maintenance records
-        # pylint: disable=too-many-nested-blocks
-        processed_maintenance_list = []  # List of the processed maintenance records
+        # Build a circuit mapper, from a single query of the impacted locations
+        location_impacts = get_maintenance_location_impacts(circuit_maintenances, location_ids)
+        circuit_maintenance_mapper = build_locations_to_maintenance_mapper(circuit_maintenances, location_impacts)
+        locations = Location.objects.in_bulk(circuit_maintenance_mapper.keys())
+
+        overlaps = self.check_overlaps(circuit_maintenance_mapper, locations)
+        self.check_capacity(circuit_maintenances, location_impacts, locations)
+        save_maintenance_overlaps(overlaps, location_impacts, today, location_ids)
+
+        # Log success for when there is not an overlapping maintenance at a location
+        overlapping_maintenances = {circuit_maint for _, overlap in overlaps for circuit_maint in overlap.maintenances}
         for circuit_maint in circuit_maintenances:
-            # Get the set of locations
-            location_set: set = set()
-            for circuit in circuit_maint.circuits:
-                location_set.update(get_locations_from_circuit(circuit))
-
-            processed_maintenance_list.append(circuit_maint)
-            overlapping_maintenance = False  # Flag for overlapping maintenance present
-            # Check to see if there are any circuit maintenances that are overlapping at some moment in time
-            for location in location_set:
-                for other_circuit_maint in circuit_maintenance_mapper[location.name]:
-                    # Report failures for any time where a circuit will take an outage
-                    # Check to see if the other circuit maintenance has already had overlap checked.
-                    # If this is the same circuit maintenance record, that will also show up in the processed list
-                    # since the list is being added to before the loop.
-                    if other_circuit_maint in processed_maintenance_list:
-                        continue
-                    if check_for_overlap(circuit_maint, other_circuit_maint):
-                        overlapping_maintenance = True
-                        if PLUGIN_SETTINGS.get("overlap_job_exclude_no_impact"):
-                            for circuit_impact in circuit_maint.circuitimpact_set:
-                                if circuit_impact.impact != "NO-IMPACT":
-                                    break
-                            else:
-                                continue
-
-                        self.logger.warning(
-                            f"There is an overlapping maintenance for location: {location.name} on {circuit_maint.start_time}. Other maintenances: {other_circuit_maint}|{circuit_maint}",
-                            extra={"object": location},
-                        )
-
-            # Log success for when there is not an overlapping maintenance at a location
-            if overlapping_maintenance is False:
+            if circuit_maint not in overlapping_maintenances:
                 self.logger.debug(
                     "Checked maintenance for overlap, no overlap was found.",
                     extra={"object": circuit_maint},
@@ -158,3 +449,93 @@ class FindLocationsWithMaintenanceOverlap(Job):
         self.logger.info(
             f"Successfully checked through {circuit_maintenances.count()} maintenance notification{'s'[:circuit_maintenances.count()^1]}."
         )
+
+        return {OVERLAPS_RESULT_KEY: len(overlaps)}
+
+    def get_location_ids_to_reevaluate(self) -> Optional[set]:
+        """Get the locations with changes since the last successful run of this Job.
+
+        All the locations are reevaluated if there are no MaintenanceOverlaps stored, or no previous run stored them,
+        as after upgrading from a version without them.
+
+        Returns:
+            set: IDs of the locations to reevaluate, or None if all of them have to be.
+        """
+        if not MaintenanceOverlap.objects.exists():
+            return None
+
+        last_job_result = (
+            JobResult.objects.filter(
+                job_model=self.job_result.job_model,
+                status=JobResultStatusChoices.STATUS_SUCCESS,
+                result__has_key=OVERLAPS_RESULT_KEY,
+            )
+            .exclude(pk=self.job_result.pk)
+            .order_by("date_created")
+            .last()
+        )
+        if last_job_result is None:
+            return None
+
+        return get_touched_location_ids(since=last_job_result.date_created)
+
+    def check_overlaps(
+        self, circuit_maintenance_mapper: dict, locations: dict
+    ) -> List[Tuple[uuid.UUID, OverlapWindow]]:
+        """Report the overlapping maintenances at each location.
+
+        Args:
+            circuit_maintenance_mapper (dict): Result of `build_locations_to_maintenance_mapper`, for maintenances
+                annotated by `annotate_has_impactful_circuit`.
+            locations (dict): Location objects, keyed by ID.
+
+        Returns:
+            List[Tuple[uuid.UUID, OverlapWindow]]: Location ID and overlapping window found.
+        """
+        exclude_no_impact = PLUGIN_SETTINGS.get("overlap_job_exclude_no_impact")
+        overlaps = []
+        for location_id, location_maintenances in circuit_maintenance_mapper.items():
+            location = locations[location_id]
+            if exclude_no_impact:
+                # Maintenances come from `annotate_has_impactful_circuit`, so they are dropped before the sweep
+                location_maintenances = [
+                    circuit_maint for circuit_maint in location_maintenances if circuit_maint.has_impactful_circuit
+                ]
+
+            for overlap in find_overlapping_maintenances(location_maintenances):
+                overlaps.append((location_id, overlap))
+                self.logger.warning(
+                    f"There is an overlapping maintenance for location: {location.name} from {overlap.start_time} to {overlap.end_time}. Overlapping maintenances: {'|'.join(str(circuit_maint) for circuit_maint in overlap.maintenances)}",
+                    extra={"object": location},
+                )
+
+        return overlaps
+
+    def check_capacity(self, circuit_maintenances, location_impacts: List[MaintenanceLocationImpact], locations: dict):
+        """Report the locations where the circuits not in outage are below the minimum.
+
+        Args:
+            circuit_maintenances (Queryset): Queryset of the Circuit Maintenance objects to check.
+            location_impacts (List[MaintenanceLocationImpact]): Result of `get_maintenance_location_impacts`.
+            locations (dict): Location objects, keyed by ID.
+        """
+        min_available_circuits = PLUGIN_SETTINGS.get("overlap_job_min_available_circuits")
+        circuits_per_location = get_circuits_per_location(locations.keys())
+        maintenances_by_id = {circuit_maint.pk: circuit_maint for circuit_maint in circuit_maintenances}
+
+        unavailable_circuits = collections.defaultdict(list)
+        for location_impact in location_impacts:
+            if location_impact.impact == CircuitImpactChoices.OUTAGE:
+                unavailable_circuits[location_impact.location_id].append(
+                    (location_impact.circuit_id, maintenances_by_id[location_impact.maintenance_id])
+                )
+
+        for location_id, location_unavailable_circuits in unavailable_circuits.items():
+            location = locations[location_id]
+            for shortfall in find_capacity_shortfalls(
+                location_unavailable_circuits, circuits_per_location[location_id], min_available_circuits
+            ):
+                self.logger.warning(
+                    f"Location {location.name} has {shortfall.available_circuits} of {shortfall.total_circuits} circuits available from {shortfall.start_time} to {shortfall.end_time}, below the minimum of {min_available_circuits}. Maintenances: {'|'.join(str(circuit_maint) for circuit_maint in shortfall.maintenances)}",
+                    extra={"object": location},
+                )
@@ -0,0 +1,214 @@
+"""Job to reparse the stored notifications that couldn't be parsed, for instance after upgrading the parser."""
+
+import contextlib
+import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from circuit_maintenance_parser import Maintenance, NotificationData, init_provider
+from django.db import transaction
+from django.db.models import Q
+from nautobot.circuits.models import Provider
+from nautobot.extras.jobs import DryRunVar, IntegerVar, Job, ObjectVar, StringVar
+
+from nautobot_circuit_maintenance.handle_notifications.handler import get_provider_parser_type, save_parsed_maintenances
+from nautobot_circuit_maintenance.handle_notifications.sources import MaintenanceNotification, Source
+from nautobot_circuit_maintenance.models import RawNotification
+
+# Number of notifications reparsed per query, to not load all the raw payloads at once
+REPROCESS_CHUNK_SIZE = 100
+DATE_REGEX = r"^\d{4}-\d{2}-\d{2}$"
+
+name = "Circuit Maintenance"  # pylint: disable=invalid-name
+
+
+def parse_notification_payload(provider_type: str, raw_payload: bytes) -> Tuple[Optional[List[Maintenance]], str]:
+    """Use the `circuit_maintenance_parser` library to get the Maintenances of a raw notification.
+
+    It doesn't access the DB, so it can run in a worker process.
+
+    Returns:
+        Tuple:
+            Optional[List[Maintenance]]: Maintenances parsed, None if the parsing failed.
+            str: Reason of the parsing failure.
+    """
+    parser_provider = init_provider(provider_type=provider_type)
+    if not parser_provider:
+        return None, f"Notification Parser not found for {provider_type}"
+
+    data_to_process = NotificationData.init_from_email_bytes(raw_payload)
+    if not data_to_process:
+        return None, "Notification data was not accepted by the parser"
+
+    try:
+        return parser_provider.get_maintenances(data_to_process), ""
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, f"Parsing failed for notification: {exc}"
+
+
+def parse_date_var(name: str, value: str) -> Optional[datetime.date]:
+    """Parse the date of a `DATE_REGEX` Job variable, if provided, as the regex accepts invalid dates too."""
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name} {value!r}, it must be a valid date as YYYY-MM-DD.") from None
+
+
+def get_unparsed_raw_notifications(
+    provider: Optional[Provider] = None,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+):
+    """Return the RawNotifications not parsed, of the `provider` and received between the dates, if provided."""
+    raw_notifications = RawNotification.objects.filter(parsed=False)
+    if provider:
+        raw_notifications = raw_notifications.filter(provider=provider)
+    if start_date:
+        raw_notifications = raw_notifications.filter(stamp__date__gte=start_date)
+    if end_date:
+        raw_notifications = raw_notifications.filter(stamp__date__lte=end_date)
+    return raw_notifications
+
+
+def iter_raw_notification_chunks(queryset, chunk_size: int = REPROCESS_CHUNK_SIZE) -> Iterator[List[RawNotification]]:
+    """Yield the RawNotifications of the queryset in chunks, ordered by `stamp`.
+
+    Every chunk is queried after the last notification of the previous one, so the notifications parsed in the
+    meantime, leaving the queryset, don't shift the next chunks.
+    """
+    last = None
+    while True:
+        chunk_queryset = queryset.select_related("provider", "source").order_by("stamp", "pk")
+        if last:
+            chunk_queryset = chunk_queryset.filter(Q(stamp__gt=last.stamp) | Q(stamp=last.stamp, pk__gt=last.pk))
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
+
+
+class ReprocessNotifications(Job):
+    """Job to parse again the Raw Notifications stored that couldn't be parsed.
+
+    The notifications are parsed, optionally in several processes, and the Circuit Maintenances are created or
+    updated as when the notifications are received.
+    """
+
+    provider = ObjectVar(
+        model=Provider,
+        required=False,
+        description="Only reprocess the notifications of this Provider.",
+    )
+    start_date = StringVar(
+        required=False,
+        regex=DATE_REGEX,
+        description="Only reprocess the notifications received on or after this date, as YYYY-MM-DD.",
+    )
+    end_date = StringVar(
+        required=False,
+        regex=DATE_REGEX,
+        description="Only reprocess the notifications received on or before this date, as YYYY-MM-DD.",
+    )
+    workers = IntegerVar(
+        default=1,
+        min_value=1,
+        description="Number of processes parsing the notifications in parallel.",
+    )
+    dryrun = DryRunVar()
+
+    class Meta:
+        """Meta definition for the Job."""
+
+        name = "Reprocess Circuit Maintenance Notifications"
+        has_sensitive_variables = False
+        description = "Parse again the Raw Notifications not parsed, for instance after upgrading the parser."
+
+    # pylint: disable-next=arguments-differ,too-many-arguments,too-many-locals
+    def run(self, provider=None, start_date="", end_date="", workers=1, dryrun=False) -> int:
+        """Executes the Job."""
+        raw_notifications = get_unparsed_raw_notifications(
+            provider, parse_date_var("start_date", start_date), parse_date_var("end_date", end_date)
+        )
+        total = raw_notifications.count()
+        if not total:
+            self.logger.info("No notifications to reprocess.")
+            return 0
+
+        if workers > 1 and multiprocessing.current_process().daemon:
+            self.logger.warning(
+                "Parsing the notifications in the Job process, as daemonic processes, like the Celery prefork "
+                "workers, are not allowed to start others."
+            )
+            workers = 1
+
+        processed = parsed = 0
+        with contextlib.ExitStack() as stack:
+            if workers > 1:
+                # Forking, the workers don't import the app again, and they don't access the DB
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+                )
+                parse_map = executor.map
+            else:
+                parse_map = map
+
+            for chunk in iter_raw_notification_chunks(raw_notifications):
+                results = parse_map(
+                    parse_notification_payload,
+                    [get_provider_parser_type(raw_notification.provider) for raw_notification in chunk],
+                    [raw_notification.raw_content for raw_notification in chunk],
+                )
+                for raw_notification, (parser_maintenances, error) in zip(chunk, results):
+                    if error:
+                        self.logger.warning(error, extra={"object": raw_notification})
+                    elif not parser_maintenances:
+                        self.logger.info("No maintenance notifications detected.", extra={"object": raw_notification})
+                    elif dryrun:
+                        self.logger.info(
+                            f"DRYRUN mode, {len(parser_maintenances)} maintenances parsed.",
+                            extra={"object": raw_notification},
+                        )
+                        parsed += 1
+                    elif self.store_maintenances(raw_notification, parser_maintenances):
+                        parsed += 1
+
+                processed += len(chunk)
+                self.logger.info(f"{processed}/{total} notifications reprocessed, {parsed} parsed.")
+
+        return parsed
+
+    def store_maintenances(self, raw_notification: RawNotification, parser_maintenances: List[Maintenance]) -> bool:
+        """Store the Maintenances parsed from the RawNotification as when it's received, in a transaction.
+
+        A failure is logged and rolled back, without stopping the reprocessing of the other notifications.
+
+        Returns:
+            bool: Whether the Maintenances were stored.
+        """
+        notification = MaintenanceNotification(
+            msg_id=str(raw_notification.pk).encode(),
+            # The base Source doesn't tag the messages, they may not be in the source anymore
+            source=Source(name=raw_notification.source.name if raw_notification.source else "", url=""),
+            sender=raw_notification.sender,
+            subject=raw_notification.subject,
+            provider_type=raw_notification.provider.name,
+            raw_payload=raw_notification.raw_content,
+            date=raw_notification.stamp.isoformat(),
+        )
+        try:
+            with transaction.atomic():
+                save_parsed_maintenances(
+                    self, notification, raw_notification, parser_maintenances, raw_notification.provider
+                )
+        except Exception:  # pylint: disable=broad-except
+            self.logger.error(
+                "Storing the parsed maintenances failed, skipping the notification.",
+                extra={"object": raw_notification},
+                exc_info=True,
+            )
+            return False
+        return True
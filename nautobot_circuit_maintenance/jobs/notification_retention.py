@@ -0,0 +1,150 @@
+"""Job to prune, and optionally archive, the notifications older than the retention period."""
+
+import base64
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import IO, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch
+from nautobot.extras.jobs import BooleanVar, DryRunVar, IntegerVar, Job
+
+from nautobot_circuit_maintenance.models import ParsedNotification, RawNotification
+
+PLUGIN_SETTINGS = settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {})
+
+# Number of notifications archived and deleted per transaction, to not lock the tables for long
+PRUNE_CHUNK_SIZE = 500
+
+name = "Circuit Maintenance"  # pylint: disable=invalid-name
+
+
+def get_expired_raw_notifications(cutoff: datetime):
+    """Return the RawNotifications received before `cutoff`, except the ones of maintenances not finished yet.
+
+    Deleting a RawNotification also deletes its ParsedNotifications.
+    """
+    active_parsed_notifications = ParsedNotification.objects.filter(
+        raw_notification=OuterRef("pk"), maintenance__end_time__gte=datetime.now(timezone.utc)
+    )
+    return RawNotification.objects.filter(stamp__lt=cutoff).exclude(Exists(active_parsed_notifications))
+
+
+def archive_raw_notifications(raw_notifications, archive_file: IO[str]):
+    """Write the RawNotifications, with their ParsedNotifications, to the archive as JSON lines."""
+    for raw_notification in raw_notifications:
+        archive_file.write(
+            json.dumps(
+                {
+                    "id": str(raw_notification.pk),
+                    "subject": raw_notification.subject,
+                    "provider": raw_notification.provider.name,
+                    "sender": raw_notification.sender,
+                    "source": raw_notification.source.name if raw_notification.source else None,
+                    "stamp": raw_notification.stamp.isoformat(),
+                    "raw": base64.b64encode(raw_notification.raw_content).decode(),
+                    "parsed_notifications": [
+                        {"maintenance": parsed_notification.maintenance.name, "json": parsed_notification.json}
+                        for parsed_notification in raw_notification.parsednotification_set.all()
+                    ],
+                }
+            )
+            + "\n"
+        )
+
+
+def prune_raw_notifications(
+    queryset, chunk_size: int = PRUNE_CHUNK_SIZE, archive_file: Optional[IO[str]] = None
+) -> int:
+    """Delete the RawNotifications of the queryset in chunks, archiving them first if an archive file is provided.
+
+    Every chunk is archived and deleted in its own transaction, so the tables are only locked for a chunk at a time.
+    The archive file, backed by a file on disk, is flushed and synced before every chunk is deleted, so a crash doesn't
+    lose the archived copies of the notifications already deleted.
+
+    Returns:
+        int: Number of RawNotifications deleted.
+    """
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            chunk_ids = list(queryset.order_by("stamp").values_list("pk", flat=True)[:chunk_size])
+            if not chunk_ids:
+                return deleted
+
+            chunk = RawNotification.objects.filter(pk__in=chunk_ids)
+            if archive_file is not None:
+                archive_raw_notifications(
+                    chunk.select_related("provider", "source").prefetch_related(
+                        Prefetch(
+                            "parsednotification_set",
+                            queryset=ParsedNotification.objects.select_related("maintenance"),
+                        )
+                    ),
+                    archive_file,
+                )
+                # The archived copies must be on disk before the deletion is committed
+                archive_file.flush()
+                os.fsync(archive_file.fileno())
+            chunk.delete()
+        deleted += len(chunk_ids)
+
+
+class PruneNotifications(Job):
+    """Job to delete the Raw and Parsed Notifications older than the retention period.
+
+    The notifications of maintenances not finished yet are kept. Before being deleted, the notifications can be
+    archived to a gzipped JSON lines file in the `notification_archive_dir` directory.
+    """
+
+    retention_days = IntegerVar(
+        default=PLUGIN_SETTINGS.get("notification_retention_days", 365),
+        min_value=1,
+        description="Delete the notifications received more than this number of days ago.",
+    )
+    archive = BooleanVar(
+        default=False,
+        description="Archive the notifications to the `notification_archive_dir` directory before deleting them.",
+    )
+    dryrun = DryRunVar()
+
+    class Meta:
+        """Meta definition for the Job."""
+
+        name = "Prune Circuit Maintenance Notifications"
+        has_sensitive_variables = False
+        description = (
+            "Delete the Raw and Parsed Notifications older than the retention period, optionally archiving them."
+        )
+
+    # pylint: disable-next=arguments-differ
+    def run(self, retention_days=365, archive=False, dryrun=False) -> int:
+        """Executes the Job."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        raw_notifications = get_expired_raw_notifications(cutoff)
+
+        if dryrun:
+            self.logger.info(
+                f"DRYRUN mode, {raw_notifications.count()} notifications received before {cutoff} would be deleted."
+            )
+            return 0
+
+        if not archive:
+            deleted = prune_raw_notifications(raw_notifications)
+            self.logger.info(f"{deleted} notifications received before {cutoff} deleted.")
+            return deleted
+
+        archive_dir = PLUGIN_SETTINGS.get("notification_archive_dir")
+        if not archive_dir:
+            raise ValueError("The `notification_archive_dir` setting is required to archive the notifications.")
+
+        archive_path = os.path.join(
+            archive_dir, f"notifications_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.jsonl.gz"
+        )
+        with gzip.open(archive_path, "wt", encoding="utf-8") as archive_file:
+            deleted = prune_raw_notifications(raw_notifications, archive_file=archive_file)
+        self.logger.info(f"{deleted} notifications received before {cutoff} archived to {archive_path} and deleted.")
+        return deleted
@@ -2,13 +2,12 @@
 
 import functools
 from collections import OrderedDict
-from datetime import datetime, timezone
 
 from django.conf import settings
 from nautobot.circuits.models import CircuitTermination
 from prometheus_client.core import GaugeMetricFamily
 
-from .models import CircuitImpact, CircuitMaintenance
+from .impacted_circuits import get_impacted_circuits
 
 
 def rgetattr(obj, attr, *args):
@@ -52,24 +51,13 @@ def metric_circuit_operational():
         labels=list(labels.keys()),
     )
 
-    # Statuses that we understand a Circuit Maintenance is expected to run
-    # Not all the providers use all the standard statuses.
-    active_statuses = ["CONFIRMED", "IN-PROCESS", "RE-SCHEDULED"]
-    active_circuit_maintenances = CircuitMaintenance.objects.filter(
-        status__in=active_statuses, start_time__lte=datetime.now(timezone.utc), end_time__gte=datetime.now(timezone.utc)
-    )
-
-    active_circuit_impacts = (
-        CircuitImpact.objects.filter(maintenance__in=active_circuit_maintenances)
-        .exclude(impact="NO-IMPACT")
-        .prefetch_related("circuit")
-    )
+    impacted_circuit_ids = set(get_impacted_circuits().values_list("circuit_id", flat=True))
 
     for termination in CircuitTermination.objects.all().select_related(
         "circuit", "circuit__provider", "circuit__circuit_type", "location"
     ):
         status = 1
-        if any(circuit_impact.circuit == termination.circuit for circuit_impact in active_circuit_impacts):
+        if termination.circuit_id in impacted_circuit_ids:
             status = 2
 
         values = []
@@ -0,0 +1,50 @@
+import uuid
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dcim", "0034_migrate_region_and_site_data_to_locations"),
+        ("nautobot_circuit_maintenance", "0013_rename_site_search_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MaintenanceOverlap",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "_custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                ("start_time", models.DateTimeField()),
+                ("end_time", models.DateTimeField()),
+                ("impact", models.CharField(default="OUTAGE", max_length=50)),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="dcim.location"
+                    ),
+                ),
+                (
+                    "maintenances",
+                    models.ManyToManyField(
+                        related_name="overlaps", to="nautobot_circuit_maintenance.circuitmaintenance"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["start_time"],
+            },
+        ),
+    ]
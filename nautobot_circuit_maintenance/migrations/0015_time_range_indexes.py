@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_circuit_maintenance", "0014_maintenanceoverlap"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="circuitmaintenance",
+            index=models.Index(fields=["status", "start_time", "end_time"], name="cm_status_start_end_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="circuitmaintenance",
+            index=models.Index(fields=["start_time"], name="cm_start_time_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="rawnotification",
+            index=models.Index(fields=["provider", "stamp"], name="rawnotification_prov_stamp_idx"),
+        ),
+    ]
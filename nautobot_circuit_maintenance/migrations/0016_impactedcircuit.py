@@ -0,0 +1,45 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("circuits", "0002_initial_part_2"),
+        ("nautobot_circuit_maintenance", "0015_time_range_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImpactedCircuit",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("cid", models.CharField(db_index=True, max_length=255)),
+                ("impact", models.CharField(max_length=50)),
+                ("end_time", models.DateTimeField()),
+                (
+                    "circuit",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="circuits.circuit"
+                    ),
+                ),
+                (
+                    "maintenance",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="nautobot_circuit_maintenance.circuitmaintenance",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["cid"],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def init_last_fetched(apps, schema_editor):
+    """Initialize the watermark of every source with its last RawNotification, as the global reference used to."""
+    NotificationSource = apps.get_model("nautobot_circuit_maintenance", "NotificationSource")
+    for notification_source in NotificationSource.objects.annotate(
+        last_notification=Max("rawnotification__last_updated")
+    ).filter(last_notification__isnull=False):
+        notification_source.last_fetched = notification_source.last_notification
+        notification_source.save(update_fields=["last_fetched"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_circuit_maintenance", "0016_impactedcircuit"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationsource",
+            name="last_fetched",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(init_last_fetched, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,7 @@
 
 import logging
 import pickle  # nosec
+import zlib
 from datetime import datetime, timezone
 
 from django.conf import settings
@@ -11,6 +12,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.urls import reverse
 from nautobot.circuits.models import Circuit, Provider
+from nautobot.core.models import BaseModel
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
 from nautobot.extras.utils import extras_features
 
@@ -25,6 +27,40 @@ MAX_NOTIFICATION_SENDER_LENGTH = 200
 MAX_NOTIFICATION_SUBJECT_LENGTH = 200
 MAX_NOTIFICATION_TOTAL_LENGTH = 16384
 MAX_NOTE_TITLE_LENGTH = 200
+# Prefix of the compressed RawNotification.raw, RFC822 messages never start with a NUL byte
+RAW_ZLIB_MARKER = b"\x00zlib\x00"
+
+
+def compress_raw(raw: bytes, max_length: int) -> bytes:
+    """Compress a raw notification to store it, within `max_length` bytes.
+
+    Notifications that don't fit even compressed are truncated to the longest prefix that fits compressed, found by
+    binary search on its length, or stored uncompressed if they don't compress.
+    """
+    compressed = RAW_ZLIB_MARKER + zlib.compress(raw, 9)
+    if len(compressed) <= max_length:
+        return compressed
+
+    # The empty prefix always fits, the whole notification doesn't
+    fitting_length, fitting_compressed = 0, RAW_ZLIB_MARKER + zlib.compress(b"", 9)
+    not_fitting_length = len(raw)
+    while not_fitting_length - fitting_length > 1:
+        length = (fitting_length + not_fitting_length) // 2
+        compressed = RAW_ZLIB_MARKER + zlib.compress(raw[:length], 9)
+        if len(compressed) <= max_length:
+            fitting_length, fitting_compressed = length, compressed
+        else:
+            not_fitting_length = length
+
+    return fitting_compressed if fitting_length >= max_length else raw[:max_length]
+
+
+def decompress_raw(stored) -> bytes:
+    """Return the raw notification stored, compressed or not, as bytes."""
+    stored = bytes(stored)
+    if stored.startswith(RAW_ZLIB_MARKER):
+        return zlib.decompress(stored[len(RAW_ZLIB_MARKER) :])
+    return stored
 
 
 @extras_features(
@@ -64,6 +100,11 @@ class CircuitMaintenance(PrimaryModel):
 
     class Meta:  # noqa: D106 "Missing docstring in public nested class"
         ordering = ["start_time"]
+        indexes = [
+            # Maintenances in a set of statuses running at a given time, i.e. the active ones
+            models.Index(fields=["status", "start_time", "end_time"], name="cm_status_start_end_idx"),
+            models.Index(fields=["start_time"], name="cm_start_time_idx"),
+        ]
 
     def __str__(self):
         """String value for HTML rendering."""
@@ -181,6 +222,8 @@ class NotificationSource(OrganizationalModel):
         default=False,
         help_text="Attach all the Providers to this Notification Source",
     )
+    # Start of the last successful fetch, the notifications are fetched since then on the next one
+    last_fetched = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:  # noqa: D106 "Missing docstring in public nested class"
         ordering = ["name"]
@@ -237,12 +280,22 @@ class RawNotification(OrganizationalModel):
     class Meta:  # noqa: D106 "Missing docstring in public nested class"
         ordering = ["stamp"]
         unique_together = ("stamp", "provider", "subject")
+        indexes = [
+            # The unique constraint already indexes `stamp` first, this one serves the notifications of a provider
+            models.Index(fields=["provider", "stamp"], name="rawnotification_prov_stamp_idx"),
+        ]
+
+    @property
+    def raw_content(self) -> bytes:
+        """Raw notification, decompressed."""
+        return decompress_raw(self.raw)
 
     def save(self, *args, **kwargs):
         """Custom save for RawNotification."""
-        # Limiting the size of the notification stored.
+        # Compressing and limiting the size of the notification stored.
         notification_length = min(PLUGIN_SETTINGS.get("raw_notification_size"), MAX_NOTIFICATION_TOTAL_LENGTH)
-        self.raw = self.raw[:notification_length]
+        if not bytes(self.raw).startswith(RAW_ZLIB_MARKER):
+            self.raw = compress_raw(bytes(self.raw), notification_length)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -288,3 +341,58 @@ class ParsedNotification(OrganizationalModel):
     def get_absolute_url(self, api=False):
         """Returns reverse loop up URL."""
         return reverse("plugins:nautobot_circuit_maintenance:parsednotification", args=[self.pk])
+
+
+@extras_features(
+    "custom_links",
+    "export_templates",
+    "graphql",
+)
+class MaintenanceOverlap(OrganizationalModel):
+    """Model for overlapping maintenances at a location, computed by the overlap Job."""
+
+    location = models.ForeignKey("dcim.Location", on_delete=models.CASCADE, related_name="+")
+    maintenances = models.ManyToManyField(CircuitMaintenance, related_name="overlaps")
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    # Worst impact of the overlapping maintenances on the circuits terminating at the location
+    impact = models.CharField(
+        default=CircuitImpactChoices.OUTAGE,
+        max_length=50,
+        choices=CircuitImpactChoices,
+    )
+
+    class Meta:  # noqa: D106 "Missing docstring in public nested class"
+        ordering = ["start_time"]
+
+    def __str__(self):
+        """String value for HTML rendering."""
+        # str(self) is used in change logging, and ObjectChange.object_repr field is limited to 200 characters.
+        return f"Maintenance overlap at {self.location} on {self.start_time}"[:200]
+
+    def get_absolute_url(self, api=False):
+        """Returns reverse loop up URL."""
+        return reverse("plugins:nautobot_circuit_maintenance:maintenanceoverlap", args=[self.pk])
+
+
+class ImpactedCircuit(BaseModel):
+    """Model for the circuits impacted right now, materialized from the active maintenances and their impacts.
+
+    It's maintained by `nautobot_circuit_maintenance.impacted_circuits`, which rebuilds it once any change of the
+    maintenances and their impacts is committed, and by the Refresh Impacted Circuits Job after the start or end of a
+    maintenance.
+    """
+
+    circuit = models.OneToOneField(Circuit, on_delete=models.CASCADE, related_name="+")
+    cid = models.CharField(max_length=255, db_index=True)
+    # Worst impact of the active maintenances of the circuit, and the maintenance causing it
+    impact = models.CharField(max_length=50, choices=CircuitImpactChoices)
+    maintenance = models.ForeignKey(CircuitMaintenance, on_delete=models.CASCADE, related_name="+")
+    end_time = models.DateTimeField()
+
+    class Meta:  # noqa: D106 "Missing docstring in public nested class"
+        ordering = ["cid"]
+
+    def __str__(self):
+        """String value for HTML rendering."""
+        return f"Circuit {self.cid} with impact {self.impact}"
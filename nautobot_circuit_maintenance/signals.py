@@ -0,0 +1,82 @@
+"""Signal handlers for Circuit Maintenance."""
+
+import uuid
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from nautobot.circuits.models import Circuit, CircuitTermination
+from nautobot.dcim.models import Cable, Device, Interface, Location
+
+from .impacted_circuits import refresh_impacted_circuits_on_commit
+from .models import CircuitImpact, CircuitMaintenance
+
+DASHBOARD_CACHE_VERSION_KEY = "nautobot_circuit_maintenance.dashboard.version"
+
+
+def get_dashboard_cache_version() -> str:
+    """Return the current version of the cached dashboard data, initializing it if needed."""
+    return cache.get_or_set(DASHBOARD_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_dashboard_cache():
+    """Invalidate all the cached dashboard data by bumping its version."""
+    cache.set(DASHBOARD_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+@receiver(post_save, sender=CircuitMaintenance)
+@receiver(post_delete, sender=CircuitMaintenance)
+@receiver(post_save, sender=CircuitImpact)
+@receiver(post_delete, sender=CircuitImpact)
+@receiver(post_save, sender=Circuit)
+@receiver(post_delete, sender=Circuit)
+@receiver(post_save, sender=CircuitTermination)
+@receiver(post_delete, sender=CircuitTermination)
+@receiver(post_save, sender=Cable)
+@receiver(post_delete, sender=Cable)
+@receiver(post_save, sender=Interface)
+@receiver(post_delete, sender=Interface)
+@receiver(post_save, sender=Device)
+@receiver(post_delete, sender=Device)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_dashboard_cache_on_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Listen to the changes of the objects rendered in the dashboard to invalidate its cached data.
+
+    Besides the maintenances and their circuits, the dashboard renders the Devices and Locations connected to the
+    circuit terminations through Interfaces and Cables.
+    """
+    invalidate_dashboard_cache()
+
+
+@receiver(post_delete, sender=CircuitImpact)
+def touch_maintenance_on_impact_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Listen to CircuitImpact deletions to flag its CircuitMaintenance as updated.
+
+    Updating `last_updated` lets the overlap Job, when running incrementally, reevaluate the locations of the removed
+    CircuitImpact. It's done with `update()` to not trigger any other signal nor change logging.
+    """
+    CircuitMaintenance.objects.filter(pk=instance.maintenance_id).update(last_updated=timezone.now())
+
+
+@receiver(pre_delete, sender=CircuitMaintenance)
+def touch_overlapping_maintenances_on_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Listen to CircuitMaintenance deletions to flag the other maintenances of its MaintenanceOverlaps as updated.
+
+    The deletion removes the maintenance from the stored MaintenanceOverlaps, so updating `last_updated` of the
+    remaining ones lets the overlap Job, when running incrementally, reevaluate these locations.
+    """
+    CircuitMaintenance.objects.filter(overlaps__maintenances=instance).exclude(pk=instance.pk).update(
+        last_updated=timezone.now()
+    )
+
+
+@receiver(post_save, sender=CircuitMaintenance)
+@receiver(post_delete, sender=CircuitMaintenance)
+@receiver(post_save, sender=CircuitImpact)
+@receiver(post_delete, sender=CircuitImpact)
+@receiver(post_save, sender=Circuit)
+def refresh_impacted_circuits_on_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Listen to the changes of the maintenances, their impacts and circuits to rebuild the impacted circuits."""
+    refresh_impacted_circuits_on_commit()
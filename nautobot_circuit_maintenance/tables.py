@@ -6,12 +6,38 @@ from nautobot.core.tables import BaseTable, ToggleColumn
 from .models import CircuitImpact, CircuitMaintenance, Note, NotificationSource, RawNotification
 
 
+def get_impacted_circuits(circuit_impacts):
+    """Return the Circuits of the CircuitImpacts of a maintenance, reusing them if they are prefetched."""
+    return [circuit_impact.circuit for circuit_impact in circuit_impacts.all()]
+
+
+def get_impacted_providers(circuit_impacts):
+    """Return the distinct Providers of the CircuitImpacts of a maintenance, reusing them if they are prefetched."""
+    return list(dict.fromkeys(circuit.provider for circuit in get_impacted_circuits(circuit_impacts)))
+
+
 class CircuitMaintenanceTable(BaseTable):
-    """Table to display maintenace model."""
+    """Table to display maintenace model.
+
+    The circuits and providers are rendered from the CircuitImpacts, so the views prefetch them with
+    `Prefetch("circuitimpact_set", queryset=CircuitImpact.objects.select_related("circuit__provider"))`.
+    """
 
     name = tables.Column(linkify=True)
-    circuits = tables.ManyToManyColumn(linkify_item=True)
-    providers = tables.ManyToManyColumn(linkify_item=True)
+    circuits = tables.ManyToManyColumn(
+        accessor="circuitimpact_set",
+        filter=get_impacted_circuits,
+        linkify_item=True,
+        orderable=False,
+        verbose_name="Circuits",
+    )
+    providers = tables.ManyToManyColumn(
+        accessor="circuitimpact_set",
+        filter=get_impacted_providers,
+        linkify_item=True,
+        orderable=False,
+        verbose_name="Providers",
+    )
 
     pk = ToggleColumn()
 
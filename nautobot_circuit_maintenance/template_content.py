@@ -1,9 +1,16 @@
 """Additions to existing Nautobot page content."""
 
+from datetime import datetime, timezone
+
+from django.db.models import Case, F, IntegerField, Q, Value, When
 from nautobot.extras.plugins import PluginTemplateExtension
 
+from .impacted_circuits import ACTIVE_STATUSES
 from .models import CircuitImpact
 
+# Number of Circuit Maintenances shown in the Circuit view
+MAX_CIRCUIT_IMPACTS = 5
+
 
 # pylint: disable=abstract-method
 class CircuitMaintenanceContent(PluginTemplateExtension):
@@ -13,7 +20,31 @@ class CircuitMaintenanceContent(PluginTemplateExtension):
 
     def right_page(self):
         """Show table on right side of view."""
-        circuitimpacts = CircuitImpact.objects.filter(circuit__cid=self.context["object"].cid)[:5]
+        now = datetime.now(timezone.utc)
+        # Running maintenances first, then the upcoming ones by start time, and finally the latest past ones
+        relevance = Case(
+            When(
+                Q(
+                    maintenance__status__in=ACTIVE_STATUSES,
+                    maintenance__start_time__lte=now,
+                    maintenance__end_time__gte=now,
+                ),
+                then=Value(0),
+            ),
+            When(maintenance__start_time__gt=now, then=Value(1)),
+            default=Value(2),
+            output_field=IntegerField(),
+        )
+        circuitimpacts = (
+            CircuitImpact.objects.filter(circuit=self.context["object"])
+            .select_related("maintenance")
+            .annotate(relevance=relevance)
+            .order_by(
+                "relevance",
+                Case(When(relevance__lt=2, then=F("maintenance__start_time"))).asc(nulls_last=True),
+                "-maintenance__start_time",
+            )[:MAX_CIRCUIT_IMPACTS]
+        )
         return self.render(
             "nautobot_circuit_maintenance/circuit_extension.html", extra_context={"circuitimpacts": circuitimpacts}
         )
@@ -1,13 +1,26 @@
 """Unit tests for nautobot_circuit_maintenance."""
 
+import base64
+import functools
 from datetime import datetime, timedelta, timezone
 
 from django.urls import reverse
 from nautobot.circuits.models import Circuit, CircuitType, Provider
-from nautobot.core.testing import APIViewTestCases
+from nautobot.core.testing import APITestCase, APIViewTestCases
 from nautobot.extras.models import Status
 
-from nautobot_circuit_maintenance.models import CircuitImpact, CircuitMaintenance
+from nautobot_circuit_maintenance.api.views import BULK_UPSERT_PERMISSIONS, INGEST_PERMISSIONS
+from nautobot_circuit_maintenance.impacted_circuits import refresh_impacted_circuits
+from nautobot_circuit_maintenance.models import (
+    CircuitImpact,
+    CircuitMaintenance,
+    Note,
+    NotificationSource,
+    ParsedNotification,
+    RawNotification,
+)
+
+from .utils import BoundedQueriesMixin
 
 
 class CircuitMaintenanceTest(APIViewTestCases.CreateObjectViewTestCase):
@@ -116,3 +129,428 @@ class CircuitImpactTest(APIViewTestCases.CreateObjectViewTestCase):
             maintenance=CircuitMaintenance.objects.first(),
             circuit=Circuit.objects.first(),
         )[0]
+
+
+class APIListQueryCountTest(BoundedQueriesMixin, APITestCase):
+    """Check that listing objects in the API doesn't trigger additional queries per object."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Setup environment for testing."""
+        cls.provider = Provider.objects.create(name="Provider Query Count")
+        cls.circuit_type = CircuitType.objects.create(name="Circuit Type Query Count")
+        cls.active_status = Status.objects.get(name="Active")
+        cls.source = NotificationSource.objects.create(name="Source Query Count")
+        cls.source.providers.add(cls.provider)
+
+    def _create_objects(self, index):
+        """Create a set of related objects for every API endpoint."""
+        circuit = Circuit.objects.create(
+            cid=f"Circuit Query Count {index}",
+            status=self.active_status,
+            provider=self.provider,
+            circuit_type=self.circuit_type,
+        )
+        maintenance = CircuitMaintenance.objects.create(
+            name=f"UT-QUERY-COUNT-{index}",
+            start_time=datetime.now(timezone.utc) + timedelta(days=5),
+            end_time=datetime.now(timezone.utc) + timedelta(days=6),
+        )
+        CircuitImpact.objects.create(maintenance=maintenance, circuit=circuit)
+        Note.objects.create(maintenance=maintenance, title=f"Note {index}", comment="Comment")
+        raw_notification = RawNotification.objects.create(
+            subject=f"Subject {index}",
+            provider=self.provider,
+            sender="sender@example.com",
+            source=self.source,
+            raw=b"raw",
+            stamp=datetime.now(timezone.utc),
+        )
+        ParsedNotification.objects.create(maintenance=maintenance, raw_notification=raw_notification, json="{}")
+        NotificationSource.objects.create(name=f"Source Query Count {index}").providers.add(self.provider)
+
+    def _get_list(self, model_name):
+        """List all the objects of a model."""
+        response = self.client.get(
+            reverse(f"plugins-api:nautobot_circuit_maintenance-api:{model_name}-list"), **self.header
+        )
+        self.assertHttpStatus(response, 200)
+
+    def test_list_query_count_is_constant(self):
+        """The number of queries doesn't depend on the number of objects listed."""
+        self.add_permissions(
+            "nautobot_circuit_maintenance.view_circuitmaintenance",
+            "nautobot_circuit_maintenance.view_circuitimpact",
+            "nautobot_circuit_maintenance.view_note",
+            "nautobot_circuit_maintenance.view_rawnotification",
+            "nautobot_circuit_maintenance.view_parsednotification",
+            "nautobot_circuit_maintenance.view_notificationsource",
+        )
+        model_names = [
+            "circuitmaintenance",
+            "circuitimpact",
+            "note",
+            "rawnotification",
+            "parsednotification",
+            "notificationsource",
+        ]
+        self.assertBoundedQueries(
+            self._create_objects,
+            {model_name: functools.partial(self._get_list, model_name) for model_name in model_names},
+            few=1,
+            more=5,
+        )
+
+
+class RawNotificationTest(APITestCase):
+    """API tests for Raw Notification."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Setup environment for testing."""
+        cls.raw_notification = RawNotification.objects.create(
+            subject="Subject 1",
+            provider=Provider.objects.create(name="Provider 1"),
+            sender="sender@example.com",
+            raw=b"raw content",
+            stamp=datetime.now(timezone.utc),
+        )
+
+    def setUp(self):
+        """Grant the permissions to view raw notifications."""
+        super().setUp()
+        self.add_permissions("nautobot_circuit_maintenance.view_rawnotification")
+
+    def test_list_omits_raw(self):
+        """The raw content is not included by default."""
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:rawnotification-list")
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn("raw", response.data["results"][0])
+
+        response = self.client.get(f"{url}?include=raw", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIn("raw", response.data["results"][0])
+
+    def test_detail_include_raw(self):
+        """The raw content is included on demand in the detail view."""
+        url = reverse(
+            "plugins-api:nautobot_circuit_maintenance-api:rawnotification-detail",
+            kwargs={"pk": self.raw_notification.pk},
+        )
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn("raw", response.data)
+
+        response = self.client.get(f"{url}?include=raw", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(base64.b64decode(response.data["raw"]), b"raw content")
+
+    def test_download_raw(self):
+        """The raw content is streamed as is."""
+        url = reverse(
+            "plugins-api:nautobot_circuit_maintenance-api:rawnotification-download-raw",
+            kwargs={"pk": self.raw_notification.pk},
+        )
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response["Content-Type"], "application/octet-stream")
+        self.assertEqual(b"".join(response.streaming_content), b"raw content")
+
+    def test_ingest_invalid_payload(self):
+        """Raw notifications must be base64 encoded."""
+        self.add_permissions(*INGEST_PERMISSIONS)
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:rawnotification-ingest")
+        response = self.client.post(url, {"notifications": [{"raw": "not base64!"}]}, format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(RawNotification.objects.count(), 1)
+
+    def _ingest(self, provider="Provider 1", **data):
+        """Ingest a notification of the provider, returning the response."""
+        raw = b"From: sender@example.com\r\nSubject: Subject 2\r\nDate: Mon, 01 Feb 2021 09:33:34 +0000\r\n\r\nbody"
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:rawnotification-ingest")
+        data["notifications"] = [{"raw": base64.b64encode(raw).decode(), "provider": provider}]
+        return self.client.post(url, data, format="json", **self.header)
+
+    def test_ingest_constrained_source(self):
+        """Notifications can't be ingested for a source the user can't view."""
+        NotificationSource.objects.create(name="Source 1")
+        self.add_permissions(*INGEST_PERMISSIONS, "circuits.view_provider")
+        self.add_permissions("nautobot_circuit_maintenance.view_notificationsource", constraints={"name": "Other"})
+
+        response = self._ingest(source="Source 1")
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(RawNotification.objects.count(), 1)
+
+    def test_ingest_constrained_provider(self):
+        """Notifications can't be ingested for a provider the user can't view."""
+        self.add_permissions(*INGEST_PERMISSIONS)
+        self.add_permissions("circuits.view_provider", constraints={"name": "Other"})
+
+        response = self._ingest()
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data[0]["status"], "failed")
+        self.assertEqual(RawNotification.objects.count(), 1)
+
+    def test_ingest_constrained_raw_notification(self):
+        """Nothing is stored if any notification is out of the constraints of the user."""
+        self.add_permissions(
+            *[name for name in INGEST_PERMISSIONS if name != "nautobot_circuit_maintenance.add_rawnotification"],
+            "circuits.view_provider",
+        )
+        self.add_permissions("nautobot_circuit_maintenance.add_rawnotification", constraints={"subject": "Other"})
+
+        response = self._ingest()
+        self.assertHttpStatus(response, 403)
+        self.assertEqual(RawNotification.objects.count(), 1)
+
+    def test_cursor_pagination(self):
+        """Raw notifications can be tailed by cursor."""
+        for index in range(2, 4):
+            RawNotification.objects.create(
+                subject=f"Subject {index}",
+                provider=self.raw_notification.provider,
+                raw=b"raw content",
+                stamp=self.raw_notification.stamp + timedelta(minutes=index),
+            )
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:rawnotification-list")
+
+        response = self.client.get(f"{url}?cursor=&limit=2", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["subject"] for result in response.data["results"]], ["Subject 1", "Subject 2"])
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"], **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["subject"] for result in response.data["results"]], ["Subject 3"])
+        self.assertIsNone(response.data["next"])
+
+        # The last cursor resumes after the objects already seen
+        cursor = response.data["cursor"]
+        RawNotification.objects.create(
+            subject="Subject 4",
+            provider=self.raw_notification.provider,
+            raw=b"raw content",
+            stamp=self.raw_notification.stamp + timedelta(minutes=4),
+        )
+        response = self.client.get(f"{url}?cursor={cursor}&limit=2", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["subject"] for result in response.data["results"]], ["Subject 4"])
+
+    def test_cursor_pagination_null_field(self):
+        """Parsed notifications without `last_updated` can be tailed by cursor too."""
+        self.add_permissions("nautobot_circuit_maintenance.view_parsednotification")
+        maintenance = CircuitMaintenance.objects.create(
+            name="UT-TEST-1", start_time="2020-10-04 10:00:00Z", end_time="2020-10-04 12:00:00Z"
+        )
+        parsed_notifications = [
+            ParsedNotification.objects.create(
+                maintenance=maintenance, raw_notification=self.raw_notification, json={"index": index}
+            )
+            for index in range(3)
+        ]
+        ParsedNotification.objects.filter(pk__in=[parsed.pk for parsed in parsed_notifications[:2]]).update(
+            last_updated=None
+        )
+        expected = sorted(str(parsed.pk) for parsed in parsed_notifications[:2]) + [str(parsed_notifications[2].pk)]
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:parsednotification-list")
+
+        seen = []
+        response = self.client.get(f"{url}?cursor=&limit=1", **self.header)
+        while True:
+            self.assertHttpStatus(response, 200)
+            seen.extend(str(result["id"]) for result in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"], **self.header)
+        self.assertEqual(seen, expected)
+
+    def test_cursor_pagination_invalid_cursor(self):
+        """An invalid cursor is rejected."""
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:rawnotification-list")
+        response = self.client.get(f"{url}?cursor=invalid", **self.header)
+        self.assertHttpStatus(response, 404)
+
+
+class CircuitMaintenanceBulkUpsertTest(APITestCase):
+    """API tests for the Circuit Maintenance bulk upsert."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Setup environment for testing."""
+        providers = Provider.objects.bulk_create((Provider(name="Provider 1"), Provider(name="Provider 2")))
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        active_status = Status.objects.get(name="Active")
+        cls.circuits = Circuit.objects.bulk_create(
+            (
+                Circuit(cid="Circuit 1", status=active_status, provider=providers[0], circuit_type=circuit_type),
+                Circuit(cid="Circuit 2", status=active_status, provider=providers[1], circuit_type=circuit_type),
+            )
+        )
+        cls.url = reverse("plugins-api:nautobot_circuit_maintenance-api:circuitmaintenance-bulk-upsert")
+        cls.maintenance_data = {
+            "name": "UT-UPSERT-1",
+            "start_time": datetime.now(timezone.utc) + timedelta(days=5),
+            "end_time": datetime.now(timezone.utc) + timedelta(days=6),
+            "status": "CONFIRMED",
+            "circuits": [
+                {"provider": "Provider 1", "cid": "circuit 1", "impact": "NO-IMPACT"},
+                {"provider": "Provider 2", "cid": "Circuit 2"},
+                {"provider": "Provider 2", "cid": "Circuit 3"},
+            ],
+        }
+
+    def setUp(self):
+        """Grant the permissions needed for the bulk upsert."""
+        super().setUp()
+        self.add_permissions(*BULK_UPSERT_PERMISSIONS, "circuits.view_circuit")
+
+    def test_bulk_upsert_create(self):
+        """Maintenances are created with their circuit impacts."""
+        response = self.client.post(self.url, [self.maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.data[0]["created"])
+        self.assertEqual(response.data[0]["unknown_cids"], ["Circuit 3"])
+
+        circuit_maintenance = CircuitMaintenance.objects.get(name="UT-UPSERT-1")
+        self.assertEqual(circuit_maintenance.status, "CONFIRMED")
+        self.assertEqual(
+            {(impact.circuit, impact.impact) for impact in circuit_maintenance.circuitimpact_set.all()},
+            {(self.circuits[0], "NO-IMPACT"), (self.circuits[1], "OUTAGE")},
+        )
+        self.assertEqual(circuit_maintenance.note_set.count(), 1)
+
+    def test_bulk_upsert_update(self):
+        """Existing maintenances are updated, and their circuit impacts replaced."""
+        self.client.post(self.url, [self.maintenance_data], format="json", **self.header)
+        maintenance_data = {
+            **self.maintenance_data,
+            "status": "COMPLETED",
+            "circuits": [{"provider": "Provider 1", "cid": "Circuit 1", "impact": "OUTAGE"}],
+        }
+
+        response = self.client.post(self.url, [maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertFalse(response.data[0]["created"])
+
+        circuit_maintenance = CircuitMaintenance.objects.get(name="UT-UPSERT-1")
+        self.assertEqual(circuit_maintenance.status, "COMPLETED")
+        self.assertEqual(
+            {(impact.circuit, impact.impact) for impact in circuit_maintenance.circuitimpact_set.all()},
+            {(self.circuits[0], "OUTAGE")},
+        )
+
+    def test_bulk_upsert_unknown_provider(self):
+        """Nothing is created when a provider doesn't exist."""
+        maintenance_data = {**self.maintenance_data, "circuits": [{"provider": "Provider 3", "cid": "Circuit 1"}]}
+        response = self.client.post(self.url, [maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertFalse(CircuitMaintenance.objects.exists())
+
+    def test_bulk_upsert_invalid_window(self):
+        """Nothing is created when a maintenance ends before it starts."""
+        maintenance_data = {
+            **self.maintenance_data,
+            "start_time": self.maintenance_data["end_time"],
+            "end_time": self.maintenance_data["start_time"],
+        }
+        response = self.client.post(self.url, [maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertFalse(CircuitMaintenance.objects.exists())
+
+    def test_bulk_upsert_permission_denied(self):
+        """The bulk upsert requires the permissions to change maintenances and circuit impacts."""
+        self.user.user_permissions.clear()
+        self.user.object_permissions.all().delete()
+        response = self.client.post(self.url, [self.maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+
+    def test_bulk_upsert_constrained_permission_denied(self):
+        """Maintenances out of the ObjectPermission constraints of the user are neither created nor updated."""
+        self.user.object_permissions.all().delete()
+        self.add_permissions(
+            "nautobot_circuit_maintenance.add_circuitmaintenance",
+            "nautobot_circuit_maintenance.change_circuitmaintenance",
+            constraints={"name": "UT-UPSERT-OTHER"},
+        )
+        self.add_permissions(*BULK_UPSERT_PERMISSIONS[2:], "circuits.view_circuit")
+
+        response = self.client.post(self.url, [self.maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+        self.assertFalse(CircuitMaintenance.objects.exists())
+
+        CircuitMaintenance.objects.create(
+            name="UT-UPSERT-1",
+            start_time=self.maintenance_data["start_time"],
+            end_time=self.maintenance_data["end_time"],
+        )
+        response = self.client.post(self.url, [self.maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+        self.assertFalse(CircuitImpact.objects.exists())
+
+    def test_bulk_upsert_constrained_circuits(self):
+        """Circuits the user can't view are not found."""
+        self.user.object_permissions.all().delete()
+        self.add_permissions(*BULK_UPSERT_PERMISSIONS)
+        self.add_permissions("circuits.view_circuit", constraints={"cid": "Circuit 1"})
+
+        response = self.client.post(self.url, [self.maintenance_data], format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data[0]["unknown_cids"], ["Circuit 2", "Circuit 3"])
+
+
+class ImpactedCircuitTest(APITestCase):
+    """API tests for the circuits impacted right now."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Setup environment for testing."""
+        provider = Provider.objects.create(name="Provider 1")
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        active_status = Status.objects.get(name="Active")
+        cls.circuits = Circuit.objects.bulk_create(
+            Circuit(cid=f"Circuit {index}", status=active_status, provider=provider, circuit_type=circuit_type)
+            for index in range(3)
+        )
+        maintenance = CircuitMaintenance.objects.create(
+            name="UT-ACTIVE-1",
+            status="IN-PROCESS",
+            start_time=datetime.now(timezone.utc) - timedelta(hours=1),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        CircuitImpact.objects.create(maintenance=maintenance, circuit=cls.circuits[0])
+        CircuitImpact.objects.create(maintenance=maintenance, circuit=cls.circuits[1], impact="DEGRADED")
+
+    def setUp(self):
+        """Grant the permissions to view the impacted circuits."""
+        super().setUp()
+        self.add_permissions("nautobot_circuit_maintenance.view_impactedcircuit")
+        # The maintenances created in the test transaction are never committed
+        refresh_impacted_circuits()
+
+    def test_single_circuit(self):
+        """A circuit is looked up by its ID, and not found if it's not impacted."""
+        url = reverse(
+            "plugins-api:nautobot_circuit_maintenance-api:impactedcircuit-detail",
+            kwargs={"circuit": self.circuits[0].pk},
+        )
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["cid"], "Circuit 0")
+        self.assertEqual(response.data["impact"], "OUTAGE")
+
+        url = reverse(
+            "plugins-api:nautobot_circuit_maintenance-api:impactedcircuit-detail",
+            kwargs={"circuit": self.circuits[2].pk},
+        )
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 404)
+
+    def test_bulk_cids(self):
+        """A bulk of circuits is looked up by their CIDs, only the impacted ones are returned."""
+        url = reverse("plugins-api:nautobot_circuit_maintenance-api:impactedcircuit-list")
+        response = self.client.get(f"{url}?cid=Circuit 1&cid=Circuit 2", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            [(result["cid"], result["impact"]) for result in response.data["results"]], [("Circuit 1", "DEGRADED")]
+        )
@@ -1,12 +1,15 @@
 """Test cases for application metrics endpoint views."""
 
 from datetime import datetime, timedelta, timezone
+from unittest import skipUnless
 
+from django.db import connection
 from django.test import TestCase
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.models import Status
 
+from nautobot_circuit_maintenance.impacted_circuits import get_active_circuit_maintenances, refresh_impacted_circuits
 from nautobot_circuit_maintenance.metrics_app import metric_circuit_operational
 from nautobot_circuit_maintenance.models import CircuitImpact, CircuitMaintenance
 
@@ -80,6 +83,8 @@ class AppMetricTests(TestCase):
         )
         CircuitImpact.objects.create(circuit=getattr(self, "circuit_3"), maintenance=self.circuit_maintenance_3)
         # Circuit 4 and 5 have no maintenance attached
+        # The maintenances created in the test transaction are never committed
+        refresh_impacted_circuits()
 
     def test_metric_circuit_operational(self):
         """Ensure the metric_circuit_operational command is working properly."""
@@ -98,3 +103,40 @@ class AppMetricTests(TestCase):
                     self.assertEqual(sample.value, 2)
                 else:
                     self.assertEqual(sample.value, 1)
+
+
+@skipUnless(connection.vendor == "postgresql", "Query plans are only checked on PostgreSQL.")
+class ActiveMaintenancesQueryPlanTest(TestCase):
+    """Benchmark the query of the active maintenances over a realistic history of maintenances."""
+
+    def setUp(self):
+        """Create a history of maintenances, most of them completed, and a few active ones."""
+        now = datetime.now(timezone.utc)
+        maintenances = [
+            CircuitMaintenance(
+                name=f"Past maintenance {index}",
+                status="COMPLETED",
+                start_time=now - timedelta(days=index + 1, hours=4),
+                end_time=now - timedelta(days=index + 1),
+            )
+            for index in range(5000)
+        ]
+        maintenances.extend(
+            CircuitMaintenance(
+                name=f"Active maintenance {index}",
+                status="IN-PROCESS",
+                start_time=now - timedelta(hours=1),
+                end_time=now + timedelta(hours=1),
+            )
+            for index in range(5)
+        )
+        CircuitMaintenance.objects.bulk_create(maintenances)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {CircuitMaintenance._meta.db_table}")
+
+    def test_active_maintenances_use_index(self):
+        """Test that the active maintenances are found through the index instead of scanning all of them."""
+        query_plan = get_active_circuit_maintenances().explain(analyze=True)
+        self.assertIn("cm_status_start_end_idx", query_plan)
+        self.assertNotIn(f"Seq Scan on {CircuitMaintenance._meta.db_table}", query_plan)
+        self.assertEqual(get_active_circuit_maintenances().count(), 5)
@@ -0,0 +1,60 @@
+"""Unit tests for nautobot_circuit_maintenance custom validators."""
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from nautobot.circuits.models import Provider
+
+from nautobot_circuit_maintenance.custom_validators import ProviderEmailValidator, ProviderParserValidator
+
+
+class ProviderEmailValidatorTestCase(TestCase):
+    """Test the validation of the Provider emails."""
+
+    def setUp(self):
+        """Create Providers with emails."""
+        for index in range(5):
+            provider = Provider.objects.create(name=f"Provider {index}")
+            provider.cf["emails_circuit_maintenances"] = f"noc{index}@example.com, maintenances{index}@example.com"
+            provider.save()
+
+    def test_repeated_email(self):
+        """Test that the emails of another Provider are rejected, regardless of the case and surrounding spaces."""
+        provider = Provider(name="Provider new")
+        provider.cf["emails_circuit_maintenances"] = "new@example.com, Maintenances3@Example.com "
+        with self.assertRaises(ValidationError) as context:
+            ProviderEmailValidator(provider).clean()
+        self.assertIn("maintenances3@example.com", str(context.exception))
+
+    def test_similar_email(self):
+        """Test that emails containing the ones of another Provider are accepted."""
+        provider = Provider(name="Provider new")
+        provider.cf["emails_circuit_maintenances"] = "other-noc3@example.com"
+        ProviderEmailValidator(provider).clean()
+
+    def test_own_emails(self):
+        """Test that the Provider can keep its own emails, with a single query."""
+        provider = Provider.objects.get(name="Provider 3")
+        with CaptureQueriesContext(connection) as context:
+            ProviderEmailValidator(provider).clean()
+        self.assertEqual(len(context.captured_queries), 1)
+
+
+class ProviderParserValidatorTestCase(TestCase):
+    """Test the validation of the Provider parser."""
+
+    def test_supported_parser(self):
+        """Test that the supported parsers are accepted, regardless of the case, without any query."""
+        provider = Provider(name="Provider new")
+        provider.cf["provider_parser_circuit_maintenances"] = "NTT"
+        with CaptureQueriesContext(connection) as context:
+            ProviderParserValidator(provider).clean()
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_unsupported_parser(self):
+        """Test that the parsers not supported by the library are rejected."""
+        provider = Provider(name="Provider new")
+        provider.cf["provider_parser_circuit_maintenances"] = "unknown"
+        with self.assertRaises(ValidationError):
+            ProviderParserValidator(provider).clean()
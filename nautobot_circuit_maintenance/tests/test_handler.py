@@ -16,11 +16,16 @@ from nautobot_circuit_maintenance.handle_notifications.handler import (
     HandleCircuitMaintenanceNotifications,
     create_circuit_maintenance,
     get_maintenances_from_notification,
-    get_since_reference,
+    ingest_raw_notifications,
     process_raw_notification,
+    save_parsed_maintenances,
     update_circuit_maintenance,
 )
-from nautobot_circuit_maintenance.handle_notifications.sources import MaintenanceNotification, Source
+from nautobot_circuit_maintenance.handle_notifications.sources import (
+    MaintenanceNotification,
+    Source,
+    get_since_reference,
+)
 from nautobot_circuit_maintenance.models import (
     MAX_MAINTENANCE_NAME_LENGTH,
     MAX_NOTIFICATION_SENDER_LENGTH,
@@ -268,6 +273,34 @@ class TestHandleNotificationsJob(TestCase):  # pylint: disable=too-many-public-m
         self.assertEqual(1, len(ParsedNotification.objects.all()))
         self.job.logger.info.assert_any_call("Raw notification created.", extra=ANY)
 
+    def test_save_parsed_maintenances(self):
+        """Test save_parsed_maintenances with several maintenances, processed more than once."""
+        provider = Provider.objects.get(name="ntt")
+        parser_provider = init_provider(provider_type="ntt")
+        parser_maintenances = []
+        for name in ("MNT-1", "MNT-2", "MNT-3"):
+            notification_data = get_base_notification_data()
+            notification_data["name"] = name
+            test_notification = generate_email_notification(notification_data, self.source)
+            data_to_process = NotificationData.init_from_email_bytes(test_notification.raw_payload)
+            parser_maintenances.extend(parser_provider.get_maintenances(data_to_process))
+        raw_notification = RawNotification.objects.create(
+            subject=test_notification.subject[:MAX_NOTIFICATION_SUBJECT_LENGTH],
+            provider=provider,
+            raw=test_notification.raw_payload,
+            stamp=datetime.now(timezone.utc),
+        )
+
+        save_parsed_maintenances(self.job, test_notification, raw_notification, parser_maintenances, provider)
+        save_parsed_maintenances(self.job, test_notification, raw_notification, parser_maintenances, provider)
+
+        raw_notification.refresh_from_db()
+        self.assertTrue(raw_notification.parsed)
+        self.assertEqual(
+            sorted(raw_notification.parsednotification_set.values_list("maintenance__name", flat=True)),
+            ["ntt-MNT-1", "ntt-MNT-2", "ntt-MNT-3"],
+        )
+
     def test_process_raw_notification_duplicated_issue(self):
         """Test process_raw_notification duplicated."""
         self.test_process_raw_notification()
@@ -550,13 +583,75 @@ class TestHandleNotificationsJob(TestCase):  # pylint: disable=too-many-public-m
         # Verify that both parsed notifications are linked to the CircuitMaintenance for future reference
         self.assertEqual(len(circuit_maintenance_entry.parsednotification_set.all()), 2)
 
-    def test_get_since_with_previous_raw_notification(self):
-        """Test get_since_reference with a previous raw_notification."""
+    def test_get_since_with_last_fetched(self):
+        """Test get_since_reference with the last_fetched watermark of the source."""
+        self.notification_source.last_fetched = datetime(2021, 8, 8, 7, 13, tzinfo=timezone.utc)
+        since_reference = get_since_reference(self.job, self.notification_source)
+        self.assertEqual(since_reference, int(self.notification_source.last_fetched.timestamp()))
+
+    def test_get_since_without_last_fetched(self):
+        """Test get_since_reference for a source never fetched, from the initial days since setting."""
+        since_reference = get_since_reference(self.job, self.notification_source)
+        self.assertLess(since_reference, datetime.now(timezone.utc).timestamp() - 24 * 60 * 60)
+
+    def test_run_saves_last_fetched(self):
+        """Test that the watermark set by get_notifications is saved, unless in dryrun mode."""
+        last_fetched = datetime(2021, 8, 8, 7, 13, tzinfo=timezone.utc)
+
+        def fetch(job, notification_sources):  # pylint: disable=unused-argument
+            for notification_source in notification_sources:
+                notification_source.last_fetched = last_fetched
+            return []
+
+        with patch("nautobot_circuit_maintenance.handle_notifications.handler.get_notifications", side_effect=fetch):
+            self.job.run(dryrun=True)
+            self.notification_source.refresh_from_db()
+            self.assertIsNone(self.notification_source.last_fetched)
+
+            self.job.run()
+            self.notification_source.refresh_from_db()
+            self.assertEqual(self.notification_source.last_fetched, last_fetched)
+
+    def test_run_caps_last_fetched_on_failure(self):
+        """Test that the watermark isn't moved past the notifications that failed, to fetch them again."""
+        previous_last_fetched = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        self.notification_source.last_fetched = previous_last_fetched
+        self.notification_source.save()
         notification_data = get_base_notification_data()
-        test_notification = generate_email_notification(notification_data, self.source)
-        raw_id = process_raw_notification(self.job, test_notification)
-        since_reference = get_since_reference(self.job)
-        self.assertEqual(since_reference, RawNotification.objects.get(id=raw_id).last_updated.timestamp())
+        notification_data["stamp"] = datetime(2021, 2, 1, 9, 33, 34, tzinfo=timezone.utc)
+        failed_notification = generate_email_notification(notification_data, self.source)
+        notification_data["stamp"] = datetime(2021, 2, 2, 9, 33, 34, tzinfo=timezone.utc)
+        processed_notification = generate_email_notification(notification_data, self.source)
+
+        def fetch(job, notification_sources):  # pylint: disable=unused-argument
+            for notification_source in notification_sources:
+                notification_source.last_fetched = datetime(2021, 8, 8, 7, 13, tzinfo=timezone.utc)
+            return [processed_notification, failed_notification]
+
+        def process(job, notification):  # pylint: disable=unused-argument
+            if notification is failed_notification:
+                raise RuntimeError("DB error")
+            return None
+
+        with patch(
+            "nautobot_circuit_maintenance.handle_notifications.handler.get_notifications", side_effect=fetch
+        ), patch(
+            "nautobot_circuit_maintenance.handle_notifications.handler.process_raw_notification", side_effect=process
+        ):
+            self.job.run()
+            self.notification_source.refresh_from_db()
+            self.assertEqual(
+                self.notification_source.last_fetched, datetime(2021, 2, 1, 9, 33, 34, tzinfo=timezone.utc)
+            )
+            self.job.logger.warning.assert_called()
+
+            # Without the date of the failed notification, the previous watermark is kept
+            self.notification_source.last_fetched = previous_last_fetched
+            self.notification_source.save()
+            failed_notification.date = "not a date"
+            self.job.run()
+            self.notification_source.refresh_from_db()
+            self.assertEqual(self.notification_source.last_fetched, previous_last_fetched)
 
     def test_update_circuit_maintenance_with_duplicated_notes(self):
         """Test update_circuit_maintenance with duplicated notes."""
@@ -609,3 +704,32 @@ class TestHandleNotificationsJob(TestCase):  # pylint: disable=too-many-public-m
         self.assertEqual(1, len(CircuitMaintenance.objects.all()))
         self.assertEqual(1, len(CircuitImpact.objects.all()))
         self.assertEqual(0, len(Note.objects.all()))
+
+    def test_ingest_raw_notifications(self):
+        """Test ingest_raw_notifications with a valid and an invalid payload."""
+        notification_data = get_base_notification_data()
+        test_notification = generate_email_notification(notification_data, self.source)
+
+        results = ingest_raw_notifications(
+            self.job,
+            self.source,
+            [(test_notification.raw_payload, test_notification.provider_type), (b"Subject: no sender", None)],
+        )
+
+        self.assertEqual(results[0].status, "processed")
+        self.assertEqual(results[0].raw_notification_id, RawNotification.objects.get().id)
+        self.assertEqual(results[1].status, "failed")
+        self.assertEqual(1, len(CircuitMaintenance.objects.all()))
+        self.assertEqual(1, len(ParsedNotification.objects.all()))
+
+    def test_ingest_raw_notifications_duplicated(self):
+        """Test ingest_raw_notifications skips the notifications already stored."""
+        notification_data = get_base_notification_data()
+        test_notification = generate_email_notification(notification_data, self.source)
+        payloads = [(test_notification.raw_payload, test_notification.provider_type)]
+
+        ingest_raw_notifications(self.job, self.source, payloads)
+        results = ingest_raw_notifications(self.job, self.source, payloads)
+
+        self.assertEqual(results[0].status, "skipped")
+        self.assertEqual(1, len(RawNotification.objects.all()))
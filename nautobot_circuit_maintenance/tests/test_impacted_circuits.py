@@ -0,0 +1,131 @@
+"""Tests for the materialized set of the circuits impacted right now."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+from nautobot.circuits.models import Circuit, CircuitType, Provider
+from nautobot.extras.models import Status
+
+from nautobot_circuit_maintenance.impacted_circuits import (
+    get_active_circuit_maintenances,
+    get_impacted_circuits,
+    get_refresh_at_cache_key,
+    invalidate_impacted_circuits,
+    is_impacted_circuits_outdated,
+    refresh_impacted_circuits,
+)
+from nautobot_circuit_maintenance.jobs.impacted_circuits_refresh import RefreshImpactedCircuits
+from nautobot_circuit_maintenance.models import CircuitImpact, CircuitMaintenance, ImpactedCircuit
+
+from .utils import MockedLogger
+
+
+class ImpactedCircuitsTest(TestCase):
+    """Test the refresh of the ImpactedCircuit table."""
+
+    def setUp(self):
+        """Create circuits impacted by an active and an upcoming maintenance."""
+        provider = Provider.objects.create(name="Provider 1")
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        active_status = Status.objects.get(name="Active")
+        self.circuits = [
+            Circuit.objects.create(
+                cid=f"Circuit {index}", provider=provider, circuit_type=circuit_type, status=active_status
+            )
+            for index in range(3)
+        ]
+        self.now = datetime.now(timezone.utc)
+        self.active_maintenance = CircuitMaintenance.objects.create(
+            name="Active maintenance",
+            status="IN-PROCESS",
+            start_time=self.now - timedelta(hours=1),
+            end_time=self.now + timedelta(hours=1),
+        )
+        self.other_active_maintenance = CircuitMaintenance.objects.create(
+            name="Other active maintenance",
+            status="CONFIRMED",
+            start_time=self.now - timedelta(hours=1),
+            end_time=self.now + timedelta(hours=2),
+        )
+        self.upcoming_maintenance = CircuitMaintenance.objects.create(
+            name="Upcoming maintenance",
+            status="CONFIRMED",
+            start_time=self.now + timedelta(hours=3),
+            end_time=self.now + timedelta(hours=4),
+        )
+        CircuitImpact.objects.create(maintenance=self.active_maintenance, circuit=self.circuits[0], impact="DEGRADED")
+        CircuitImpact.objects.create(maintenance=self.other_active_maintenance, circuit=self.circuits[0])
+        CircuitImpact.objects.create(maintenance=self.active_maintenance, circuit=self.circuits[1], impact="NO-IMPACT")
+        CircuitImpact.objects.create(maintenance=self.upcoming_maintenance, circuit=self.circuits[2])
+
+    def test_refresh_worst_impact(self):
+        """Test that only the impacted circuits are stored, with their worst impact."""
+        self.assertEqual(refresh_impacted_circuits(self.now), 1)
+        impacted_circuit = ImpactedCircuit.objects.get()
+        self.assertEqual(impacted_circuit.circuit, self.circuits[0])
+        self.assertEqual(impacted_circuit.cid, "Circuit 0")
+        self.assertEqual(impacted_circuit.impact, "OUTAGE")
+        self.assertEqual(impacted_circuit.maintenance, self.other_active_maintenance)
+        # Outdated when the first active maintenance ends
+        self.assertEqual(cache.get(get_refresh_at_cache_key()), self.active_maintenance.end_time.timestamp())
+
+    def test_refresh_on_window_boundary(self):
+        """Test that the refresh Job rebuilds the impacted circuits once the next maintenance starts."""
+        job = RefreshImpactedCircuits()
+        job.logger = MockedLogger()
+        refresh_impacted_circuits(self.now + timedelta(hours=2, minutes=30))
+        self.assertFalse(get_impacted_circuits().filter(circuit=self.circuits[2]).exists())
+        self.assertEqual(cache.get(get_refresh_at_cache_key()), self.upcoming_maintenance.start_time.timestamp())
+        self.assertEqual(job.run(), 0)
+        self.assertFalse(get_impacted_circuits().filter(circuit=self.circuits[0]).exists())
+
+        cache.set(get_refresh_at_cache_key(), (self.now - timedelta(seconds=1)).timestamp(), timeout=None)
+        self.assertEqual(job.run(), 1)
+        self.assertTrue(get_impacted_circuits().filter(circuit=self.circuits[0]).exists())
+
+    def test_refresh_on_write(self):
+        """Test that any change of the impacts rebuilds the impacted circuits once it's committed."""
+        refresh_impacted_circuits()
+        with self.captureOnCommitCallbacks(execute=True):
+            CircuitImpact.objects.filter(circuit=self.circuits[1]).update(impact="OUTAGE")
+        # update() doesn't send signals
+        self.assertEqual(get_impacted_circuits().count(), 1)
+
+        with self.captureOnCommitCallbacks(execute=True), transaction.atomic():
+            CircuitImpact.objects.get(circuit=self.circuits[1]).save()
+            # Not rebuilt before the commit
+            self.assertEqual(get_impacted_circuits().count(), 1)
+        self.assertEqual(get_impacted_circuits().count(), 2)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks, transaction.atomic():
+            self.active_maintenance.delete()
+            self.other_active_maintenance.delete()
+        # Rebuilt once for all the changes committed together
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(get_impacted_circuits().count(), 0)
+
+    def test_invalidate(self):
+        """Test that invalidating the impacted circuits leaves them outdated until the next refresh."""
+        refresh_impacted_circuits(self.now)
+        self.assertFalse(is_impacted_circuits_outdated(self.now))
+        invalidate_impacted_circuits()
+        self.assertTrue(is_impacted_circuits_outdated(self.now))
+        refresh_impacted_circuits(self.now)
+        self.assertFalse(is_impacted_circuits_outdated(self.now))
+
+    def test_invalidate_during_refresh(self):
+        """Test that an invalidation happening while the impacted circuits are rebuilt is not lost."""
+
+        def get_active_circuit_maintenances_and_invalidate(now):
+            invalidate_impacted_circuits()
+            return get_active_circuit_maintenances(now)
+
+        with patch(
+            "nautobot_circuit_maintenance.impacted_circuits.get_active_circuit_maintenances",
+            side_effect=get_active_circuit_maintenances_and_invalidate,
+        ):
+            refresh_impacted_circuits(self.now)
+        self.assertTrue(is_impacted_circuits_outdated(self.now))
@@ -1,12 +1,33 @@
 """Tests for Overlap Jobs being included."""
 
 # pylint: disable=missing-class-docstring,no-name-in-module
-from datetime import datetime
+import uuid
+from datetime import date, datetime
 from typing import NamedTuple
+from unittest.mock import Mock
 
 from django.test import TestCase
+from django.utils import timezone
+from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.models import Location, LocationType
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import JobResult, Status
 
-from nautobot_circuit_maintenance.jobs.location_search import check_for_overlap
+from nautobot_circuit_maintenance.jobs.location_search import (
+    OVERLAPS_RESULT_KEY,
+    FindLocationsWithMaintenanceOverlap,
+    OverlapWindow,
+    annotate_has_impactful_circuit,
+    build_locations_to_maintenance_mapper,
+    check_for_overlap,
+    find_capacity_shortfalls,
+    find_overlapping_maintenances,
+    get_circuits_per_location,
+    get_maintenance_location_impacts,
+    get_touched_location_ids,
+    save_maintenance_overlaps,
+)
+from nautobot_circuit_maintenance.models import CircuitImpact, CircuitMaintenance, MaintenanceOverlap
 
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
@@ -68,3 +89,268 @@ class TestOverlap(TestCase):
 
         result = check_for_overlap(record1, record2)
         self.assertFalse(result)
+
+
+class TestFindOverlappingMaintenances(TestCase):
+    @staticmethod
+    def _record(start_time, end_time):
+        return MockCircuitMaintenance(
+            start_time=datetime.strptime(start_time, DATE_FORMAT),
+            end_time=datetime.strptime(end_time, DATE_FORMAT),
+        )
+
+    def test_no_overlap(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 12:00:00")
+        record2 = self._record("2020-10-05 10:00:00", "2020-10-05 12:00:00")
+
+        self.assertEqual(find_overlapping_maintenances([record1, record2]), [])
+
+    def test_overlap_pair(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 12:00:00")
+        record2 = self._record("2020-10-04 11:00:00", "2020-10-05 12:00:00")
+
+        result = find_overlapping_maintenances([record2, record1])
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].start_time, record2.start_time)
+        self.assertEqual(result[0].end_time, record1.end_time)
+        self.assertEqual(set(result[0].maintenances), {record1, record2})
+
+    def test_overlap_touching_boundaries(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 12:00:00")
+        record2 = self._record("2020-10-04 12:00:00", "2020-10-04 14:00:00")
+
+        result = find_overlapping_maintenances([record1, record2])
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(set(result[0].maintenances), {record1, record2})
+
+    def test_overlap_sets(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 18:00:00")
+        record2 = self._record("2020-10-04 11:00:00", "2020-10-04 13:00:00")
+        record3 = self._record("2020-10-04 12:00:00", "2020-10-04 14:00:00")
+        record4 = self._record("2020-10-04 15:00:00", "2020-10-04 16:00:00")
+        record5 = self._record("2020-10-05 10:00:00", "2020-10-05 12:00:00")
+
+        result = find_overlapping_maintenances([record5, record4, record3, record2, record1])
+
+        self.assertEqual(
+            [set(overlap.maintenances) for overlap in result],
+            [{record1, record2, record3}, {record1, record4}],
+        )
+        self.assertEqual(result[0].start_time, record3.start_time)
+        self.assertEqual(result[0].end_time, record2.end_time)
+
+
+class TestFindCapacityShortfalls(TestCase):
+    @staticmethod
+    def _record(start_time, end_time):
+        return MockCircuitMaintenance(
+            start_time=datetime.strptime(start_time, DATE_FORMAT),
+            end_time=datetime.strptime(end_time, DATE_FORMAT),
+        )
+
+    def test_redundancy_kept(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 12:00:00")
+        record2 = self._record("2020-10-04 11:00:00", "2020-10-04 13:00:00")
+
+        result = find_capacity_shortfalls([("circuit-1", record1), ("circuit-2", record2)], 3, 1)
+
+        self.assertEqual(result, [])
+
+    def test_all_circuits_down(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 12:00:00")
+        record2 = self._record("2020-10-04 11:00:00", "2020-10-04 13:00:00")
+        record3 = self._record("2020-10-04 11:30:00", "2020-10-04 14:00:00")
+
+        result = find_capacity_shortfalls(
+            [("circuit-1", record1), ("circuit-2", record2), ("circuit-3", record3)], 3, 1
+        )
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].start_time, record3.start_time)
+        self.assertEqual(result[0].end_time, record1.end_time)
+        self.assertEqual(result[0].available_circuits, 0)
+        self.assertEqual(result[0].total_circuits, 3)
+        self.assertEqual(set(result[0].maintenances), {record1, record2, record3})
+
+    def test_same_circuit_counted_once(self):
+        record1 = self._record("2020-10-04 10:00:00", "2020-10-04 12:00:00")
+        record2 = self._record("2020-10-04 11:00:00", "2020-10-04 13:00:00")
+
+        result = find_capacity_shortfalls([("circuit-1", record1), ("circuit-1", record2)], 2, 2)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].start_time, record1.start_time)
+        self.assertEqual(result[0].end_time, record2.end_time)
+        self.assertEqual(result[0].available_circuits, 1)
+        self.assertEqual(set(result[0].maintenances), {record1, record2})
+
+
+class TestLocationsToMaintenanceMapper(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        status = Status.objects.get(name="Active")
+        provider = Provider.objects.create(name="Provider 1")
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        location_type = LocationType.objects.create(name="Location Type 1")
+        cls.location_1 = Location.objects.create(name="Location 1", location_type=location_type, status=status)
+        cls.location_2 = Location.objects.create(name="Location 2", location_type=location_type, status=status)
+
+        circuits = []
+        for index, (location_a, location_z) in enumerate(
+            [(cls.location_1, cls.location_2), (cls.location_1, None), (cls.location_2, cls.location_2)]
+        ):
+            circuit = Circuit.objects.create(
+                cid=f"Circuit {index}", provider=provider, circuit_type=circuit_type, status=status
+            )
+            CircuitTermination.objects.create(circuit=circuit, term_side="A", location=location_a)
+            if location_z:
+                CircuitTermination.objects.create(circuit=circuit, term_side="Z", location=location_z)
+            circuits.append(circuit)
+
+        cls.maintenance_1 = CircuitMaintenance.objects.create(
+            name="UT-TEST-1", start_time="2020-10-04 10:00:00Z", end_time="2020-10-04 12:00:00Z"
+        )
+        cls.maintenance_2 = CircuitMaintenance.objects.create(
+            name="UT-TEST-2", start_time="2020-10-04 11:00:00Z", end_time="2020-10-04 13:00:00Z"
+        )
+        CircuitImpact.objects.create(maintenance=cls.maintenance_1, circuit=circuits[0])
+        CircuitImpact.objects.create(maintenance=cls.maintenance_2, circuit=circuits[1], impact="NO-IMPACT")
+        CircuitImpact.objects.create(maintenance=cls.maintenance_2, circuit=circuits[2])
+
+    def test_get_maintenance_location_impacts(self):
+        with self.assertNumQueries(1):
+            result = get_maintenance_location_impacts(CircuitMaintenance.objects.all())
+
+        self.assertEqual(
+            {(row.maintenance_id, row.location_id, row.location_name, row.impact) for row in result},
+            {
+                (self.maintenance_1.pk, self.location_1.pk, "Location 1", "OUTAGE"),
+                (self.maintenance_1.pk, self.location_2.pk, "Location 2", "OUTAGE"),
+                (self.maintenance_2.pk, self.location_1.pk, "Location 1", "NO-IMPACT"),
+                (self.maintenance_2.pk, self.location_2.pk, "Location 2", "OUTAGE"),
+            },
+        )
+
+    def test_get_maintenance_location_impacts_location_ids(self):
+        with self.assertNumQueries(1):
+            result = get_maintenance_location_impacts(CircuitMaintenance.objects.all(), [self.location_2.pk])
+
+        # Only the terminations at the location, not the other ends of the circuits
+        self.assertEqual(
+            {(row.maintenance_id, row.location_id, row.impact) for row in result},
+            {
+                (self.maintenance_1.pk, self.location_2.pk, "OUTAGE"),
+                (self.maintenance_2.pk, self.location_2.pk, "OUTAGE"),
+            },
+        )
+
+    def test_annotate_has_impactful_circuit(self):
+        CircuitImpact.objects.filter(maintenance=self.maintenance_2).update(impact="NO-IMPACT")
+        no_impact_maintenance = CircuitMaintenance.objects.create(
+            name="UT-TEST-3", start_time="2020-10-04 11:00:00Z", end_time="2020-10-04 13:00:00Z"
+        )
+
+        with self.assertNumQueries(1):
+            result = {
+                circuit_maint.name: circuit_maint.has_impactful_circuit
+                for circuit_maint in annotate_has_impactful_circuit(CircuitMaintenance.objects.all())
+            }
+
+        self.assertEqual(
+            result, {self.maintenance_1.name: True, self.maintenance_2.name: False, no_impact_maintenance.name: False}
+        )
+
+    def test_get_circuits_per_location(self):
+        with self.assertNumQueries(1):
+            result = get_circuits_per_location([self.location_1.pk, self.location_2.pk])
+
+        self.assertEqual(result, {self.location_1.pk: 2, self.location_2.pk: 2})
+
+    def test_build_locations_to_maintenance_mapper(self):
+        with self.assertNumQueries(2):
+            result = build_locations_to_maintenance_mapper(CircuitMaintenance.objects.all())
+
+        self.assertEqual(
+            result,
+            {
+                self.location_1.pk: {self.maintenance_1, self.maintenance_2},
+                self.location_2.pk: {self.maintenance_1, self.maintenance_2},
+            },
+        )
+
+    def test_save_maintenance_overlaps(self):
+        location_impacts = get_maintenance_location_impacts(CircuitMaintenance.objects.all())
+        overlap = OverlapWindow(
+            start_time=self.maintenance_2.start_time,
+            end_time=self.maintenance_1.end_time,
+            maintenances=[self.maintenance_1, self.maintenance_2],
+        )
+
+        save_maintenance_overlaps([(self.location_1.pk, overlap)], location_impacts, date(2020, 10, 4))
+
+        maintenance_overlap = MaintenanceOverlap.objects.get()
+        self.assertEqual(maintenance_overlap.location, self.location_1)
+        self.assertEqual(maintenance_overlap.impact, "OUTAGE")
+        self.assertEqual(set(maintenance_overlap.maintenances.all()), {self.maintenance_1, self.maintenance_2})
+
+        # Only the evaluated locations are replaced
+        save_maintenance_overlaps([], location_impacts, date(2020, 10, 4), location_ids=[self.location_2.pk])
+        self.assertTrue(MaintenanceOverlap.objects.exists())
+
+        save_maintenance_overlaps([], location_impacts, date(2020, 10, 4))
+        self.assertFalse(MaintenanceOverlap.objects.exists())
+
+    def test_get_touched_location_ids(self):
+        since = timezone.now()
+        self.assertEqual(get_touched_location_ids(since), set())
+
+        # All the locations of the maintenance are reevaluated
+        CircuitImpact.objects.get(circuit__cid="Circuit 2").save()
+        self.assertEqual(get_touched_location_ids(since), {self.location_1.pk, self.location_2.pk})
+
+    def test_get_touched_location_ids_stale_overlap(self):
+        maintenance_overlap = MaintenanceOverlap.objects.create(
+            location=self.location_1, start_time="2020-10-04 11:00:00Z", end_time="2020-10-04 12:00:00Z"
+        )
+        maintenance_overlap.maintenances.set([self.maintenance_1, self.maintenance_2])
+        since = timezone.now()
+        self.assertEqual(get_touched_location_ids(since), set())
+
+        self.maintenance_2.delete()
+        self.assertEqual(get_touched_location_ids(since), {self.location_1.pk})
+
+    def test_get_touched_location_ids_shrunk_overlap(self):
+        maintenance_3 = CircuitMaintenance.objects.create(
+            name="UT-TEST-3", start_time="2020-10-04 11:30:00Z", end_time="2020-10-04 12:30:00Z"
+        )
+        maintenance_overlap = MaintenanceOverlap.objects.create(
+            location=self.location_1, start_time="2020-10-04 11:30:00Z", end_time="2020-10-04 12:00:00Z"
+        )
+        maintenance_overlap.maintenances.set([self.maintenance_1, self.maintenance_2, maintenance_3])
+        since = timezone.now()
+
+        # The overlap is left with two maintenances, still stale
+        maintenance_3.delete()
+        self.assertIn(self.location_1.pk, get_touched_location_ids(since))
+
+    def test_get_location_ids_to_reevaluate(self):
+        job = FindLocationsWithMaintenanceOverlap()
+        job.job_result = Mock(job_model=None, pk=uuid.uuid4())
+
+        # Without stored overlaps, all the locations are reevaluated
+        self.assertIsNone(job.get_location_ids_to_reevaluate())
+
+        maintenance_overlap = MaintenanceOverlap.objects.create(
+            location=self.location_1, start_time="2020-10-04 11:00:00Z", end_time="2020-10-04 12:00:00Z"
+        )
+        maintenance_overlap.maintenances.set([self.maintenance_1, self.maintenance_2])
+        # Runs that didn't store the overlaps are not a reference to reevaluate incrementally
+        JobResult.objects.create(name="overlap", status=JobResultStatusChoices.STATUS_SUCCESS, result=None)
+        self.assertIsNone(job.get_location_ids_to_reevaluate())
+
+        JobResult.objects.create(
+            name="overlap", status=JobResultStatusChoices.STATUS_SUCCESS, result={OVERLAPS_RESULT_KEY: 1}
+        )
+        self.assertEqual(job.get_location_ids_to_reevaluate(), set())
@@ -1,13 +1,22 @@
 """Unit tests for nautobot_circuit_maintenance models."""
 
 import datetime
+import random
 
 from django.test import TestCase
 from nautobot.circuits.models import Circuit, CircuitType, Provider
 from nautobot.extras.models import Status
 
 from nautobot_circuit_maintenance.choices import CircuitImpactChoices
-from nautobot_circuit_maintenance.models import CircuitImpact, CircuitMaintenance, NotificationSource, RawNotification
+from nautobot_circuit_maintenance.models import (
+    RAW_ZLIB_MARKER,
+    CircuitImpact,
+    CircuitMaintenance,
+    NotificationSource,
+    RawNotification,
+    compress_raw,
+    decompress_raw,
+)
 
 
 class CircuitMaintenanceModelTestCase(TestCase):
@@ -88,3 +97,55 @@ class RawNotificationModelTestCase(TestCase):
                 f"WARNING:nautobot_circuit_maintenance.models:Stamp time {stamp} is not consistent, it's in the future.",
                 log_res.output,
             )
+
+    def test_raw_compression(self):
+        """Validate that the raw notification is stored compressed, without truncating its content."""
+        raw = b"From: noc@example.com\n\n" + b"<p>Maintenance notification</p>\n" * 2000
+        raw_notification = RawNotification.objects.create(
+            raw=raw,
+            subject="compressed",
+            provider=self.provider,
+            source=self.source,
+            stamp=datetime.datetime.now(datetime.timezone.utc),
+        )
+        raw_notification.refresh_from_db()
+        self.assertTrue(bytes(raw_notification.raw).startswith(RAW_ZLIB_MARKER))
+        self.assertLess(len(raw_notification.raw), 8192)
+        self.assertEqual(raw_notification.raw_content, raw)
+
+        # Saving it again doesn't compress it twice
+        raw_notification.save()
+        raw_notification.refresh_from_db()
+        self.assertEqual(raw_notification.raw_content, raw)
+
+    def test_compress_raw_truncated(self):
+        """Validate that a notification not fitting compressed keeps the longest prefix that fits compressed."""
+        raw = b"From: noc@example.com\n\n" + b"".join(
+            f"Circuit CID-{index} impacted by maintenance MNT-{index % 7}\n".encode() for index in range(20000)
+        )
+        compressed = compress_raw(raw, 8192)
+        self.assertLessEqual(len(compressed), 8192)
+        self.assertTrue(compressed.startswith(RAW_ZLIB_MARKER))
+        content = decompress_raw(compressed)
+        self.assertTrue(raw.startswith(content))
+        # Far more than the uncompressed limit
+        self.assertGreater(len(content), 4 * 8192)
+        # One more byte doesn't fit
+        self.assertGreater(len(compress_raw(raw[: len(content) + 1], 8192 * 100)), 8192)
+
+        # Not compressible content is stored uncompressed
+        raw = random.Random(0).randbytes(20000)
+        self.assertEqual(compress_raw(raw, 8192), raw[:8192])
+
+    def test_raw_uncompressed(self):
+        """Validate that the raw notifications stored before the compression are still readable."""
+        raw_notification = RawNotification.objects.create(
+            raw=b"",
+            subject="uncompressed",
+            provider=self.provider,
+            source=self.source,
+            stamp=datetime.datetime.now(datetime.timezone.utc),
+        )
+        RawNotification.objects.filter(pk=raw_notification.pk).update(raw=b"From: noc@example.com\n\nbody")
+        raw_notification.refresh_from_db()
+        self.assertEqual(raw_notification.raw_content, b"From: noc@example.com\n\nbody")
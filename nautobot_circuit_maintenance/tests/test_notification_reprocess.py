@@ -0,0 +1,128 @@
+"""Tests for the Job reprocessing the notifications not parsed."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.test import TestCase
+from nautobot.circuits.models import Provider
+
+from nautobot_circuit_maintenance.handle_notifications.sources import Source
+from nautobot_circuit_maintenance.jobs.notification_reprocess import (
+    ReprocessNotifications,
+    get_unparsed_raw_notifications,
+    iter_raw_notification_chunks,
+    parse_date_var,
+    parse_notification_payload,
+)
+from nautobot_circuit_maintenance.models import CircuitMaintenance, ParsedNotification, RawNotification
+
+from .test_handler import generate_email_notification, get_base_notification_data
+from .utils import MockedLogger
+
+
+class ReprocessNotificationsTest(TestCase):
+    """Test the reprocessing of the notifications not parsed."""
+
+    fixtures = ["handle_notifications_job.yaml"]
+
+    def setUp(self):
+        """Store a notification not parsed, as if the parser failed when it was received."""
+        self.source = Source(name="source", url="http://example.com")
+        self.notification = generate_email_notification(get_base_notification_data(), self.source)
+        self.raw_notification = RawNotification.objects.create(
+            subject=self.notification.subject[:50],
+            provider=Provider.objects.get(name="ntt"),
+            raw=self.notification.raw_payload,
+            sender=self.notification.sender,
+            stamp=datetime(2021, 2, 1, 9, 33, 34, tzinfo=timezone.utc),
+        )
+        self.job = ReprocessNotifications()
+        self.job.logger = MockedLogger()
+
+    def test_parse_notification_payload(self):
+        """Test the parsing of a raw notification, without the DB."""
+        maintenances, error = parse_notification_payload("ntt", self.notification.raw_payload)
+        self.assertEqual(error, "")
+        self.assertEqual(len(maintenances), 1)
+
+        maintenances, error = parse_notification_payload("unknown", self.notification.raw_payload)
+        self.assertIsNone(maintenances)
+        self.assertIn("unknown", error)
+
+    def test_filters(self):
+        """Test the Provider and date range filters."""
+        self.assertEqual(list(get_unparsed_raw_notifications()), [self.raw_notification])
+        self.assertFalse(get_unparsed_raw_notifications(provider=Provider.objects.create(name="Provider 1")))
+        self.assertFalse(get_unparsed_raw_notifications(start_date=datetime(2021, 2, 2).date()))
+        self.assertFalse(get_unparsed_raw_notifications(end_date=datetime(2021, 1, 31).date()))
+
+    def test_chunks(self):
+        """Test that the chunks go through all the notifications, even if they leave the queryset."""
+        provider = Provider.objects.get(name="ntt")
+        for index in range(4):
+            RawNotification.objects.create(
+                subject=f"Notification {index}",
+                provider=provider,
+                raw=b"raw content",
+                stamp=datetime(2021, 2, 1, 9, 33, 34, tzinfo=timezone.utc),
+            )
+
+        seen = []
+        for chunk in iter_raw_notification_chunks(get_unparsed_raw_notifications(), chunk_size=2):
+            self.assertLessEqual(len(chunk), 2)
+            seen.extend(chunk)
+            RawNotification.objects.filter(pk__in=[raw_notification.pk for raw_notification in chunk]).update(
+                parsed=True
+            )
+        self.assertEqual(len(seen), 5)
+
+    def test_run_dryrun(self):
+        """Test that the dryrun mode doesn't store anything."""
+        self.assertEqual(self.job.run(dryrun=True), 1)
+        self.raw_notification.refresh_from_db()
+        self.assertFalse(self.raw_notification.parsed)
+        self.assertFalse(CircuitMaintenance.objects.exists())
+
+    def test_run(self):
+        """Test that the notification is parsed and its Circuit Maintenance created."""
+        self.assertEqual(self.job.run(), 1)
+        self.raw_notification.refresh_from_db()
+        self.assertTrue(self.raw_notification.parsed)
+        self.assertEqual(CircuitMaintenance.objects.get().name, "ntt-MNT-NTT")
+        self.assertEqual(ParsedNotification.objects.get().raw_notification, self.raw_notification)
+
+        # Parsed notifications aren't reprocessed
+        self.assertEqual(self.job.run(), 0)
+
+    def test_run_workers(self):
+        """Test parsing the notifications in a process pool."""
+        self.assertEqual(self.job.run(workers=2), 1)
+        self.raw_notification.refresh_from_db()
+        self.assertTrue(self.raw_notification.parsed)
+
+    def test_parse_date_var(self):
+        """Test that the dates matching the regex but not valid are rejected with a clear error."""
+        self.assertIsNone(parse_date_var("start_date", ""))
+        self.assertEqual(parse_date_var("start_date", "2024-02-29"), datetime(2024, 2, 29).date())
+        with self.assertRaisesRegex(ValueError, "Invalid end_date '2024-02-30'"):
+            parse_date_var("end_date", "2024-02-30")
+        with self.assertRaisesRegex(ValueError, "Invalid end_date"):
+            self.job.run(end_date="2024-02-30")
+
+    def test_run_store_failure(self):
+        """Test that a notification failing to be stored doesn't stop the reprocessing of the others."""
+        other = RawNotification.objects.create(
+            subject="Other notification",
+            provider=Provider.objects.get(name="ntt"),
+            raw=self.notification.raw_payload,
+            sender=self.notification.sender,
+            stamp=datetime(2021, 2, 2, 9, 33, 34, tzinfo=timezone.utc),
+        )
+        with patch(
+            "nautobot_circuit_maintenance.jobs.notification_reprocess.save_parsed_maintenances",
+            side_effect=[RuntimeError("DB error"), None],
+        ) as mock_save:
+            self.assertEqual(self.job.run(), 1)
+        self.assertEqual(mock_save.call_count, 2)
+        self.assertEqual(mock_save.call_args.args[2], other)
+        self.job.logger.error.assert_called_once()
@@ -0,0 +1,117 @@
+"""Tests for the Job pruning the notifications."""
+
+import base64
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.test import TestCase
+from nautobot.circuits.models import Provider
+
+from nautobot_circuit_maintenance.jobs.notification_retention import (
+    PruneNotifications,
+    get_expired_raw_notifications,
+    prune_raw_notifications,
+)
+from nautobot_circuit_maintenance.models import CircuitMaintenance, ParsedNotification, RawNotification
+
+
+class PruneNotificationsTest(TestCase):
+    """Test the pruning of the notifications older than the retention period."""
+
+    def setUp(self):
+        """Create old notifications, of a finished and an upcoming maintenance, and a recent one."""
+        provider = Provider.objects.create(name="Provider 1")
+        now = datetime.now(timezone.utc)
+        self.old_raw_notifications = [
+            RawNotification.objects.create(
+                subject=f"Old notification {index}",
+                provider=provider,
+                raw=b"old raw content",
+                stamp=now - timedelta(days=400, minutes=index),
+            )
+            for index in range(5)
+        ]
+        self.recent_raw_notification = RawNotification.objects.create(
+            subject="Recent notification", provider=provider, raw=b"recent raw content", stamp=now
+        )
+        finished_maintenance = CircuitMaintenance.objects.create(
+            name="Finished maintenance", start_time=now - timedelta(days=399), end_time=now - timedelta(days=398)
+        )
+        self.upcoming_maintenance = CircuitMaintenance.objects.create(
+            name="Upcoming maintenance", start_time=now + timedelta(days=1), end_time=now + timedelta(days=2)
+        )
+        ParsedNotification.objects.create(
+            maintenance=finished_maintenance, raw_notification=self.old_raw_notifications[0], json={"status": "done"}
+        )
+        ParsedNotification.objects.create(
+            maintenance=self.upcoming_maintenance, raw_notification=self.old_raw_notifications[1], json={}
+        )
+
+    def test_expired_raw_notifications(self):
+        """Test that the notifications of maintenances not finished yet are kept."""
+        expired = get_expired_raw_notifications(datetime.now(timezone.utc) - timedelta(days=365))
+        self.assertEqual(set(expired), set(self.old_raw_notifications) - {self.old_raw_notifications[1]})
+
+    def test_prune_in_chunks(self):
+        """Test that all the expired notifications are deleted, with their parsed notifications."""
+        expired = get_expired_raw_notifications(datetime.now(timezone.utc) - timedelta(days=365))
+        self.assertEqual(prune_raw_notifications(expired, chunk_size=2), 4)
+        self.assertEqual(
+            set(RawNotification.objects.all()), {self.old_raw_notifications[1], self.recent_raw_notification}
+        )
+        self.assertEqual(ParsedNotification.objects.get().maintenance, self.upcoming_maintenance)
+
+    def test_prune_archive_synced_before_delete(self):
+        """Test that every chunk is synced to the archive file before it's deleted."""
+        notification_counts = []
+
+        def fsync(fd):
+            notification_counts.append(RawNotification.objects.count())
+            os.fsync(fd)
+
+        expired = get_expired_raw_notifications(datetime.now(timezone.utc) - timedelta(days=365))
+        with tempfile.TemporaryDirectory() as archive_dir:
+            with gzip.open(os.path.join(archive_dir, "archive.jsonl.gz"), "wt", encoding="utf-8") as archive_file:
+                with patch("nautobot_circuit_maintenance.jobs.notification_retention.os.fsync", side_effect=fsync):
+                    self.assertEqual(prune_raw_notifications(expired, chunk_size=2, archive_file=archive_file), 4)
+
+        self.assertEqual(notification_counts, [6, 4])
+
+    def test_job_dryrun(self):
+        """Test that nothing is deleted in dry run mode."""
+        self.assertEqual(PruneNotifications().run(retention_days=365, dryrun=True), 0)
+        self.assertEqual(RawNotification.objects.count(), 6)
+
+    def test_job_archive(self):
+        """Test that the notifications are archived before being deleted."""
+        with tempfile.TemporaryDirectory() as archive_dir:
+            with patch.dict(
+                "nautobot_circuit_maintenance.jobs.notification_retention.PLUGIN_SETTINGS",
+                {"notification_archive_dir": archive_dir},
+            ):
+                self.assertEqual(PruneNotifications().run(retention_days=365, archive=True), 4)
+
+            (archive_name,) = os.listdir(archive_dir)
+            with gzip.open(os.path.join(archive_dir, archive_name), "rt", encoding="utf-8") as archive_file:
+                archived = [json.loads(line) for line in archive_file]
+
+        self.assertEqual(len(archived), 4)
+        self.assertEqual(base64.b64decode(archived[0]["raw"]), b"old raw content")
+        self.assertIn(
+            [{"maintenance": "Finished maintenance", "json": {"status": "done"}}],
+            [entry["parsed_notifications"] for entry in archived],
+        )
+
+    def test_job_archive_without_directory(self):
+        """Test that the Job fails to archive without the archive directory setting."""
+        with patch.dict(
+            "nautobot_circuit_maintenance.jobs.notification_retention.PLUGIN_SETTINGS",
+            {"notification_archive_dir": None},
+        ):
+            with self.assertRaises(ValueError):
+                PruneNotifications().run(retention_days=365, archive=True)
+        self.assertEqual(RawNotification.objects.count(), 6)
@@ -9,6 +9,7 @@ from unittest.mock import ANY, MagicMock, patch
 
 import exchangelib
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 from googleapiclient.errors import HttpError
 from httplib2 import Response
@@ -18,6 +19,7 @@ from pydantic import ValidationError
 
 from nautobot_circuit_maintenance.handle_notifications.sources import (
     IMAP,
+    WATCH_CACHE_KEY_PREFIX,
     EmailSource,
     ExchangeWebService,
     GmailAPI,
@@ -661,6 +663,62 @@ class TestGmailAPISource(TestCase):
 
         self.assertEqual(result, source._get_search_criteria(since_timestamp))  # pylint: disable=protected-access
 
+    def test_watch(self):
+        """Test that the push notifications are only requested when a Pub/Sub topic is defined."""
+        cache.delete(f"{WATCH_CACHE_KEY_PREFIX}.account")
+        source = GmailAPI(
+            name="whatever",
+            url="https://accounts.google.com/o/oauth2/auth",
+            account="account",
+            credentials_file="path_to_file",
+        )
+        source.service = MagicMock()
+        self.assertIsNone(source.watch(self.job))
+        source.service.users().watch.assert_not_called()
+
+        source.pubsub_topic = "projects/my-project/topics/gmail"
+        source.service.users().watch().execute.return_value = {"historyId": "1234", "expiration": "1700000000000"}
+        self.assertEqual(source.watch(self.job)["historyId"], "1234")
+        source.service.users().watch.assert_called_with(
+            userId="account",
+            body={
+                "topicName": "projects/my-project/topics/gmail",
+                "labelIds": ["INBOX"],
+                "labelFilterAction": "include",
+            },
+        )
+
+    def test_watch_renewal(self):
+        """Test that the push notifications are only renewed when they are about to expire or the request changed."""
+        cache.delete(f"{WATCH_CACHE_KEY_PREFIX}.account")
+        source = GmailAPI(
+            name="whatever",
+            url="https://accounts.google.com/o/oauth2/auth",
+            account="account",
+            credentials_file="path_to_file",
+            pubsub_topic="projects/my-project/topics/gmail",
+        )
+        source.service = MagicMock()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        expiration = str(int((now + datetime.timedelta(days=7)).timestamp() * 1000))
+        source.service.users().watch().execute.return_value = {"historyId": "1234", "expiration": expiration}
+        source.service.users().watch.reset_mock()
+
+        self.assertIsNotNone(source.watch(self.job))
+        self.assertIsNone(source.watch(self.job))
+        self.assertEqual(source.service.users().watch.call_count, 1)
+
+        source.push_label_ids = ["Label_1"]
+        self.assertIsNotNone(source.watch(self.job))
+        self.assertEqual(source.service.users().watch.call_count, 2)
+
+        # Renewed less than a day before the expiration
+        watched = cache.get(f"{WATCH_CACHE_KEY_PREFIX}.account")
+        watched["expiration"] = str(int((now + datetime.timedelta(hours=23)).timestamp() * 1000))
+        cache.set(f"{WATCH_CACHE_KEY_PREFIX}.account", watched)
+        self.assertIsNotNone(source.watch(self.job))
+        self.assertEqual(source.service.users().watch.call_count, 3)
+
     @patch("time.sleep", return_value=None)
     def test_execute_retry_logic(self, mock_sleep):
         """Test the googleapi execute retry logic."""
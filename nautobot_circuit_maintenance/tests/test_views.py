@@ -2,27 +2,43 @@
 # pylint: disable=duplicate-code,too-many-public-methods
 """Test for Circuit Maintenace Views."""
 
-from datetime import datetime, timezone
+import base64
+import functools
+import json
+from datetime import datetime, timedelta, timezone
 from unittest import skip
 from unittest.mock import patch
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from nautobot.circuits.models import Circuit, CircuitType, Provider
+from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
 from nautobot.core.testing import ModelViewTestCase, ViewTestCases
-from nautobot.extras.models import Status
+from nautobot.core.testing import TestCase as NautobotTestCase
+from nautobot.dcim.models import Cable, Device, DeviceType, Interface, Location, LocationType, Manufacturer
+from nautobot.extras.models import Role, Status
 from nautobot.users.models import ObjectPermission
 
+from nautobot_circuit_maintenance.handle_notifications.sources import IMAP, GmailAPIServiceAccount
 from nautobot_circuit_maintenance.models import (
     CircuitImpact,
     CircuitMaintenance,
+    MaintenanceOverlap,
     Note,
     NotificationSource,
     ParsedNotification,
     RawNotification,
 )
-from nautobot_circuit_maintenance.views import CircuitMaintenanceOverview
+from nautobot_circuit_maintenance.signals import get_dashboard_cache_version, invalidate_dashboard_cache
+from nautobot_circuit_maintenance.tables import CircuitMaintenanceTable
+from nautobot_circuit_maintenance.template_content import CircuitMaintenanceContent
+from nautobot_circuit_maintenance.views import CircuitMaintenanceListView, CircuitMaintenanceOverview
+
+from .utils import BoundedQueriesMixin
 
 
 class CircuitMaintenanceTest(ViewTestCases.PrimaryObjectViewTestCase):
@@ -491,6 +507,274 @@ class ParsedNotificationTest(
         pass
 
 
+class MaintenanceOverlapTest(
+    ViewTestCases.GetObjectViewTestCase,
+):
+    """View tests for MaintenanceOverlap."""
+
+    model = MaintenanceOverlap
+
+    def _get_base_url(self):
+        return f"plugins:{self.model._meta.app_label}:{self.model._meta.model_name}_{{}}"
+
+    def assertInstanceEqual(self, instance, data, api=False):  # pylint: disable=arguments-differ
+        """Used to overwrite inbuilt function. Causing type issues for datetimepicker."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Setup environment for testing."""
+        location_type = LocationType.objects.create(name="Location Type Overlap")
+        location = Location.objects.create(
+            name="Location Overlap", location_type=location_type, status=Status.objects.get(name="Active")
+        )
+        circuit_maintenances = CircuitMaintenance.objects.bulk_create(
+            (
+                CircuitMaintenance(
+                    name="UT-TEST-1", start_time="2020-10-04 10:00:00Z", end_time="2020-10-04 12:00:00Z"
+                ),
+                CircuitMaintenance(
+                    name="UT-TEST-2", start_time="2020-10-04 11:00:00Z", end_time="2020-10-04 13:00:00Z"
+                ),
+            )
+        )
+        for _ in range(2):
+            maintenance_overlap = MaintenanceOverlap.objects.create(
+                location=location, start_time="2020-10-04 11:00:00Z", end_time="2020-10-04 12:00:00Z"
+            )
+            maintenance_overlap.maintenances.set(circuit_maintenances)
+
+    @skip("Not implemented yet.")
+    def test_has_advanced_tab(self):
+        pass
+
+    @skip("Not implemented yet.")
+    def test_get_object_anonymous(self):
+        pass
+
+
+class CircuitMaintenanceTableQueryTest(BoundedQueriesMixin, TestCase):
+    """Test the queries to render the circuits and providers of the CircuitMaintenanceTable."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create circuits of several providers."""
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        status = Status.objects.get(name="Active")
+        cls.circuits = [
+            Circuit.objects.create(
+                cid=f"CID-{index}",
+                provider=Provider.objects.create(name=f"Provider {index}"),
+                circuit_type=circuit_type,
+                status=status,
+            )
+            for index in range(3)
+        ]
+
+    def _create_maintenance(self, index):
+        """Create a maintenance impacting all the circuits."""
+        maintenance = CircuitMaintenance.objects.create(
+            name=f"UT-TABLE-{index}",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=2),
+        )
+        for circuit in self.circuits:
+            CircuitImpact.objects.create(maintenance=maintenance, circuit=circuit)
+
+    def _render_table(self):
+        """Render the circuits and providers of the list view table."""
+        table = CircuitMaintenanceTable(CircuitMaintenanceListView.queryset.all())
+        for row in table.rows:
+            self.assertIn("Provider 2", row.get_cell("providers"))
+            self.assertIn("CID-2", row.get_cell("circuits"))
+
+    def test_list_view_bounded_queries(self):
+        """Test that the number of queries doesn't depend on the number of maintenances."""
+        self.assertBoundedQueries(self._create_maintenance, {"table": self._render_table})
+
+
+class ListViewQueryCountTest(BoundedQueriesMixin, NautobotTestCase):
+    """Test that the list views render their related objects with a constant number of queries per page."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the objects shared by all the rows."""
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        cls.status = Status.objects.get(name="Active")
+        cls.circuit_type = circuit_type
+
+    def setUp(self):
+        """Grant the permissions to view all the listed models."""
+        super().setUp()
+        self.add_permissions(
+            "nautobot_circuit_maintenance.view_circuitimpact",
+            "nautobot_circuit_maintenance.view_note",
+            "nautobot_circuit_maintenance.view_rawnotification",
+            "nautobot_circuit_maintenance.view_notificationsource",
+        )
+
+    def _create_objects(self, index):
+        """Create a row of every list view, each one with its own related objects."""
+        provider = Provider.objects.create(name=f"Provider {index}")
+        circuit = Circuit.objects.create(
+            cid=f"CID-{index}", provider=provider, circuit_type=self.circuit_type, status=self.status
+        )
+        maintenance = CircuitMaintenance.objects.create(
+            name=f"UT-LIST-{index}",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc) + timedelta(hours=2),
+        )
+        CircuitImpact.objects.create(maintenance=maintenance, circuit=circuit)
+        Note.objects.create(maintenance=maintenance, title=f"Note {index}", comment="comment")
+        source = NotificationSource.objects.create(name=f"Source {index}")
+        source.providers.set([provider])
+        RawNotification.objects.create(
+            subject=f"Subject {index}",
+            provider=provider,
+            source=source,
+            raw=b"raw content",
+            stamp=datetime.now(timezone.utc),
+        )
+
+    def _get_list(self, url_name):
+        """Render a page of the list view."""
+        response = self.client.get(f"{reverse(url_name)}?per_page=50")
+        self.assertHttpStatus(response, 200)
+
+    def test_list_views_bounded_queries(self):
+        """Test that the number of queries doesn't depend on the number of rows."""
+        url_names = [
+            "plugins:nautobot_circuit_maintenance:circuitimpact_list",
+            "plugins:nautobot_circuit_maintenance:note_list",
+            "plugins:nautobot_circuit_maintenance:rawnotification_list",
+            "plugins:nautobot_circuit_maintenance:notificationsource_list",
+        ]
+        self.assertBoundedQueries(
+            self._create_objects, {url_name: functools.partial(self._get_list, url_name) for url_name in url_names}
+        )
+
+
+class CircuitMaintenanceContentTest(TestCase):
+    """Test the Circuit Maintenances added to the Circuit view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create past, running and upcoming maintenances of a circuit, and another circuit with the same CID."""
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1")
+        status = Status.objects.get(name="Active")
+        cls.circuit = Circuit.objects.create(
+            cid="CID-1", provider=Provider.objects.create(name="Provider 1"), circuit_type=circuit_type, status=status
+        )
+        other_circuit = Circuit.objects.create(
+            cid="CID-1", provider=Provider.objects.create(name="Provider 2"), circuit_type=circuit_type, status=status
+        )
+        now = datetime.now(timezone.utc)
+        for name, start_time, circuit in (
+            ("Past maintenance", now - timedelta(days=2), cls.circuit),
+            ("Upcoming maintenance later", now + timedelta(days=2), cls.circuit),
+            ("Upcoming maintenance", now + timedelta(days=1), cls.circuit),
+            ("Running maintenance", now - timedelta(hours=1), cls.circuit),
+            ("Other provider maintenance", now - timedelta(hours=1), other_circuit),
+        ):
+            maintenance = CircuitMaintenance.objects.create(
+                name=name, status="CONFIRMED", start_time=start_time, end_time=start_time + timedelta(hours=2)
+            )
+            CircuitImpact.objects.create(maintenance=maintenance, circuit=circuit)
+
+    def test_right_page(self):
+        """Test that only the maintenances of the circuit are shown, by relevance, with a constant number of queries."""
+        with CaptureQueriesContext(connection) as context:
+            content = CircuitMaintenanceContent({"object": self.circuit}).right_page()
+        self.assertEqual(len(context.captured_queries), 1)
+
+        self.assertNotIn("Other provider maintenance", content)
+        positions = [
+            content.index(name)
+            for name in (
+                "Running maintenance",
+                "Upcoming maintenance<",
+                "Upcoming maintenance later",
+                "Past maintenance",
+            )
+        ]
+        self.assertEqual(positions, sorted(positions))
+
+
+class GmailPushTest(TestCase):
+    """Test the Gmail Pub/Sub push notifications endpoint."""
+
+    def setUp(self):
+        """Prepare data for tests."""
+        self.notification_source = NotificationSource.objects.create(name="gmail source")
+        self.source = GmailAPIServiceAccount(
+            name="gmail source",
+            url="https://accounts.google.com/o/oauth2/auth",
+            account="user@example.com",
+            credentials_file="path_to_file",
+            push_token="secret",
+            push_username="push-user",
+        )
+        self.url = reverse("plugins:nautobot_circuit_maintenance:gmail_push", kwargs={"name": "gmail source"})
+        self.push_user = get_user_model().objects.create(username="push-user")
+
+    def _post(self, token="secret", email_address="user@example.com"):
+        """Simulate a Pub/Sub push delivery of a Gmail mailbox change."""
+        data = base64.b64encode(json.dumps({"emailAddress": email_address, "historyId": "9876"}).encode()).decode()
+        envelope = {"message": {"data": data, "messageId": "1"}, "subscription": "projects/my-project/subscriptions/s"}
+        with patch("nautobot_circuit_maintenance.views.Source.init", return_value=self.source), patch(
+            "nautobot_circuit_maintenance.views.enqueue_handle_notifications"
+        ) as mock_enqueue:
+            response = self.client.post(
+                f"{self.url}?token={token}", json.dumps(envelope), content_type="application/json"
+            )
+        return response, mock_enqueue
+
+    def test_push_enqueues_source(self):
+        """Test that a push notification enqueues the processing of its source only."""
+        response, mock_enqueue = self._post()
+        self.assertEqual(response.status_code, 204)
+        mock_enqueue.assert_called_once()
+        self.assertEqual(mock_enqueue.call_args.args[0], self.notification_source)
+        self.assertEqual(mock_enqueue.call_args.args[1], self.push_user)
+
+    def test_push_user_not_found(self):
+        """Test that a push notification is acknowledged but ignored if the push user doesn't exist."""
+        self.push_user.delete()
+        response, mock_enqueue = self._post()
+        self.assertEqual(response.status_code, 204)
+        mock_enqueue.assert_not_called()
+
+    def test_push_invalid_token(self):
+        """Test that a push notification without the right token is rejected."""
+        response, mock_enqueue = self._post(token="wrong")
+        self.assertEqual(response.status_code, 403)
+        mock_enqueue.assert_not_called()
+
+    def test_push_other_account(self):
+        """Test that a push notification for another mailbox is acknowledged but ignored."""
+        response, mock_enqueue = self._post(email_address="other@example.com")
+        self.assertEqual(response.status_code, 204)
+        mock_enqueue.assert_not_called()
+
+    def test_push_invalid_message(self):
+        """Test that a request that is not a Pub/Sub push message is rejected."""
+        with patch("nautobot_circuit_maintenance.views.Source.init", return_value=self.source):
+            response = self.client.post(f"{self.url}?token=secret", "{}", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_push_not_gmail_source(self):
+        """Test that only Gmail sources with push notifications configured accept them."""
+        source = IMAP(
+            name="gmail source",
+            url="imap://example.com",
+            account="user@example.com",
+            password="pass",
+            imap_server="example.com",
+        )
+        with patch("nautobot_circuit_maintenance.views.Source.init", return_value=source):
+            response = self.client.post(f"{self.url}?token=secret", "{}", content_type="application/json")
+        self.assertEqual(response.status_code, 404)
+
+
 class DashboardTest(ModelViewTestCase):
     """View tests for CircuitMaintenance Dashboard."""
 
@@ -610,6 +894,118 @@ class DashboardTest(ModelViewTestCase):
 
         self.assertEqual(expected_result, result)
 
+    def _get_overview_with_request(self):
+        test_object = CircuitMaintenanceOverview()
+        test_object.request = RequestFactory().get("/")
+        test_object.request.user = self.user
+        return test_object
+
+    def test_extra_context_is_cached(self):
+        """Test that the dashboard content is only computed once while there are no changes."""
+        invalidate_dashboard_cache()
+        first_result = self._get_overview_with_request().extra_context()
+
+        with self.assertNumQueries(0):
+            second_result = self._get_overview_with_request().extra_context()
+
+        self.assertEqual(first_result["circuit_maint_metric_data"], second_result["circuit_maint_metric_data"])
+
+    def test_extra_context_cache_invalidated_on_change(self):
+        """Test that a new CircuitMaintenance invalidates the cached dashboard content."""
+        invalidate_dashboard_cache()
+        first_result = self._get_overview_with_request().extra_context()
+
+        CircuitMaintenance.objects.create(
+            name="UT-TEST-CACHE",
+            start_time=datetime.now(timezone.utc) + timedelta(days=400),
+            end_time=datetime.now(timezone.utc) + timedelta(days=400, hours=2),
+        )
+        second_result = self._get_overview_with_request().extra_context()
+
+        self.assertEqual(
+            first_result["circuit_maint_metric_data"]["Future Maintenances"] + 1,
+            second_result["circuit_maint_metric_data"]["Future Maintenances"],
+        )
+
+    def test_extra_context_cache_invalidated_on_location_change(self):
+        """Test that a renamed Location, rendered from the connected endpoints, invalidates the cached dashboard content."""
+        location = Location.objects.create(
+            name="Location Cache",
+            location_type=LocationType.objects.create(name="Location Type Cache"),
+            status=Status.objects.get(name="Active"),
+        )
+        invalidate_dashboard_cache()
+        version = get_dashboard_cache_version()
+
+        location.name = "Location Cache Renamed"
+        location.save()
+
+        self.assertNotEqual(get_dashboard_cache_version(), version)
+
+    def test_get_overview(self):
+        """Test rendering the overview, with the listed and the upcoming maintenances prefetching their impacts."""
+        self.add_permissions("nautobot_circuit_maintenance.view_circuitmaintenance")
+        maintenance = CircuitMaintenance.objects.create(
+            name="UT-TEST-UPCOMING",
+            start_time=datetime.now(timezone.utc) + timedelta(days=1),
+            end_time=datetime.now(timezone.utc) + timedelta(days=1, hours=2),
+        )
+        CircuitImpact.objects.create(
+            maintenance=maintenance,
+            circuit=Circuit.objects.create(
+                cid="CID-UPCOMING",
+                provider=Provider.objects.create(name="Provider Upcoming"),
+                circuit_type=CircuitType.objects.create(name="Circuit Type Upcoming"),
+                status=Status.objects.get(name="Active"),
+            ),
+        )
+        invalidate_dashboard_cache()
+
+        response = self.client.get(reverse("plugins:nautobot_circuit_maintenance:circuitmaintenance_overview"))
+
+        self.assertHttpStatus(response, 200)
+        self.assertIn("CID-UPCOMING", response.content.decode())
+
+    def test_get_maintenance_overlaps_restricted(self):
+        """Test that the overlaps card only shows the overlaps, locations and maintenances the user can view."""
+        location_type = LocationType.objects.create(name="Location Type Overlaps")
+        active_status = Status.objects.get(name="Active")
+        overlaps = {}
+        for name in ("Location Overlap 1", "Location Overlap 2"):
+            overlap = MaintenanceOverlap.objects.create(
+                location=Location.objects.create(name=name, location_type=location_type, status=active_status),
+                start_time=datetime(2022, 8, 26, 10, tzinfo=timezone.utc),
+                end_time=datetime(2022, 8, 27, 12, tzinfo=timezone.utc),
+            )
+            overlap.maintenances.set(self.maintenances_after)
+            overlaps[name] = overlap
+        test_object = CircuitMaintenanceOverview()
+
+        self.assertEqual(len(test_object.get_maintenance_overlaps(start_date=self.test_date)), 2)
+        self.assertEqual(test_object.get_maintenance_overlaps(start_date=self.test_date, user=self.user), [])
+
+        self.add_permissions("dcim.view_location")
+        self.add_permissions(
+            "nautobot_circuit_maintenance.view_maintenanceoverlap", constraints={"location__name": "Location Overlap 1"}
+        )
+        self.add_permissions("nautobot_circuit_maintenance.view_circuitmaintenance", constraints={"name": "UT-TEST-2"})
+        result = test_object.get_maintenance_overlaps(start_date=self.test_date, user=self.user)
+        self.assertEqual(result, [overlaps["Location Overlap 1"]])
+        self.assertEqual([maintenance.name for maintenance in result[0].maintenances.all()], ["UT-TEST-2"])
+
+    def test_get_overview_filtered(self):
+        """Test that the filters of the listed maintenances don't change the cached dashboard."""
+        self.add_permissions("nautobot_circuit_maintenance.view_circuitmaintenance")
+        url = reverse("plugins:nautobot_circuit_maintenance:circuitmaintenance_overview")
+        invalidate_dashboard_cache()
+        unfiltered_metrics = self.client.get(url).context["circuit_maint_metric_data"]
+
+        for query in ("?q=UT-TEST-1", "?q=UT-TEST-2"):
+            invalidate_dashboard_cache()
+            response = self.client.get(f"{url}{query}")
+            self.assertHttpStatus(response, 200)
+            self.assertEqual(response.context["circuit_maint_metric_data"], unfiltered_metrics)
+
 
 class DashboardTestZeroMaintenances(ModelViewTestCase):
     """View tests for CircuitMaintenance Dashboard."""
@@ -671,3 +1067,67 @@ class DashboardTestZeroMaintenances(ModelViewTestCase):
         result = test_object.get_maintenances_per_month()
 
         self.assertEqual(expected_result, result)
+
+
+class DashboardUpcomingMaintenancesQueryTest(BoundedQueriesMixin, TestCase):
+    """Query count tests for the upcoming maintenances of the CircuitMaintenance Dashboard."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Setup environment for testing."""
+        cls.test_date = datetime.now(timezone.utc).date()
+        cls.active_status = Status.objects.get(name="Active")
+        cls.connected_status = Status.objects.get(name="Connected")
+        cls.provider = Provider.objects.create(name="Provider Dashboard")
+        cls.circuit_type = CircuitType.objects.create(name="Circuit Type Dashboard")
+        location_type = LocationType.objects.create(name="Location Type Dashboard")
+        location_type.content_types.add(ContentType.objects.get_for_model(Device))
+        location_type.content_types.add(ContentType.objects.get_for_model(CircuitTermination))
+        cls.location = Location.objects.create(
+            name="Location Dashboard", location_type=location_type, status=cls.active_status
+        )
+        manufacturer = Manufacturer.objects.create(name="Manufacturer Dashboard")
+        cls.device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Device Type Dashboard")
+        cls.role = Role.objects.create(name="Role Dashboard")
+        cls.role.content_types.add(ContentType.objects.get_for_model(Device))
+
+    def _create_upcoming_maintenance(self, index):
+        """Create an upcoming maintenance impacting a circuit connected to a device interface."""
+        circuit = Circuit.objects.create(
+            cid=f"Circuit Dashboard {index}",
+            provider=self.provider,
+            circuit_type=self.circuit_type,
+            status=self.active_status,
+        )
+        termination = CircuitTermination.objects.create(circuit=circuit, term_side="A", location=self.location)
+        device = Device.objects.create(
+            name=f"Device Dashboard {index}",
+            device_type=self.device_type,
+            role=self.role,
+            location=self.location,
+            status=self.active_status,
+        )
+        interface = Interface.objects.create(device=device, name="eth0", status=self.active_status)
+        Cable.objects.create(termination_a=interface, termination_b=termination, status=self.connected_status)
+        maintenance = CircuitMaintenance.objects.create(
+            name=f"UT-DASHBOARD-{index}",
+            start_time=datetime.now(timezone.utc) + timedelta(days=1),
+            end_time=datetime.now(timezone.utc) + timedelta(days=1, hours=2),
+        )
+        CircuitImpact.objects.create(maintenance=maintenance, circuit=circuit)
+
+    def _render_upcoming_maintenances(self):
+        """Walk the same relations as the dashboard template."""
+        maintenances = CircuitMaintenanceOverview().get_maintenances_next_n_days(start_date=self.test_date, n_days=7)
+        for maintenance in maintenances:
+            for circuit_impact in maintenance.circuitimpact_set.all():
+                circuit = circuit_impact.circuit
+                self.assertEqual(circuit.status.name, "Active")
+                endpoint = circuit.circuit_termination_a.connected_endpoint
+                self.assertEqual(endpoint.parent.location.name, self.location.name)
+
+    def test_get_maintenances_next_n_days_bounded_queries(self):
+        """Test that the number of queries doesn't depend on the number of upcoming maintenances."""
+        self.assertBoundedQueries(
+            self._create_upcoming_maintenance, {"upcoming maintenances": self._render_upcoming_maintenances}
+        )
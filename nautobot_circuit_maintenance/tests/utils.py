@@ -2,8 +2,12 @@
 """Test utilities."""
 
 import logging
+from typing import Callable, Dict
 from unittest.mock import Mock
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 
 def _add(level):
     def side_effect(*args, **kwargs):
@@ -38,3 +42,39 @@ def assert_called_with_substring(mock, substring):
             if substring in arg:
                 return
     raise AssertionError(f"Expected substring '{substring}' not found in any call arguments.")
+
+
+def count_queries(operation: Callable[[], None]) -> int:
+    """Run the operation and return the number of queries it executed."""
+    with CaptureQueriesContext(connection) as context:
+        operation()
+    return len(context.captured_queries)
+
+
+class BoundedQueriesMixin:
+    """Mixin for the TestCases checking that the queries of an operation don't grow with the number of objects."""
+
+    def assertBoundedQueries(  # pylint: disable=invalid-name
+        self,
+        create_objects: Callable[[int], None],
+        operations: Dict[str, Callable[[], None]],
+        few: int = 2,
+        more: int = 10,
+    ):
+        """Assert that every operation executes the same number of queries with `few` and with `more` objects.
+
+        Args:
+            create_objects (Callable[[int], None]): Creates the objects of the given index.
+            operations (Dict[str, Callable[[], None]]): Operations to count the queries of, by name.
+            few (int): Number of objects of the first count.
+            more (int): Number of objects of the second count.
+        """
+        for index in range(few):
+            create_objects(index)
+        query_counts = {name: count_queries(operation) for name, operation in operations.items()}
+
+        for index in range(few, more):
+            create_objects(index)
+        for name, operation in operations.items():
+            with self.subTest(operation=name):
+                self.assertEqual(count_queries(operation), query_counts[name])
@@ -71,10 +71,13 @@ urlpatterns = [
         views.ParsedNotificationView.as_view(),
         name="parsednotification",
     ),
+    # Maintenance Overlap
+    path("overlap/<uuid:pk>/", views.MaintenanceOverlapView.as_view(), name="maintenanceoverlap"),
     # Notification Source
     path("source/", views.NotificationSourceListView.as_view(), name="notificationsource_list"),
     path("source/google_authorize/<str:name>/", views.google_authorize, name="google_authorize"),
     path("source/google_oauth2callback/", views.google_oauth2callback, name="google_oauth2callback"),
+    path("source/gmail_push/<str:name>/", views.gmail_push, name="gmail_push"),
     path("source/edit/", views.NotificationSourceBulkEditView.as_view(), name="notificationsource_bulk_edit"),
     path("source/<uuid:pk>/edit/", views.NotificationSourceEditView.as_view(), name="notificationsource_edit"),
     path("source/<uuid:pk>/", views.NotificationSourceView.as_view(), name="notificationsource"),
@@ -1,23 +1,88 @@
 """Views for Circuit Maintenance."""
 
+import base64
+import binascii
+import collections
 import datetime
+import hmac
+import json
 import logging
 
 import google_auth_oauthlib
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseForbidden, HttpResponseNotFound
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from nautobot.circuits.models import Circuit, Provider
 from nautobot.core.views import generic
+from nautobot.dcim.models import Location
 
 from nautobot_circuit_maintenance import filters, forms, models, tables
-from nautobot_circuit_maintenance.handle_notifications.sources import RedirectAuthorize, Source
+from nautobot_circuit_maintenance.handle_notifications.handler import enqueue_handle_notifications
+from nautobot_circuit_maintenance.handle_notifications.sources import GmailAPI, RedirectAuthorize, Source
 from nautobot_circuit_maintenance.models import CircuitMaintenance
+from nautobot_circuit_maintenance.signals import get_dashboard_cache_version
 
 logger = logging.getLogger(__name__)
 
 
+def get_upcoming_maintenances_prefetch() -> Prefetch:
+    """Prefetch plan for the CircuitImpacts of the maintenances rendered in the dashboard.
+
+    The dashboard walks `circuit -> circuit_termination_a/z -> connected_endpoint -> parent -> location` for every
+    circuit of every upcoming maintenance, so all these relations are fetched in a bounded number of queries.
+    """
+    return Prefetch(
+        "circuitimpact_set",
+        queryset=models.CircuitImpact.objects.select_related(
+            "circuit",
+            "circuit__status",
+            "circuit__circuit_termination_a___path",
+            "circuit__circuit_termination_z___path",
+        )
+        .prefetch_related(
+            "circuit__circuit_termination_a___path__destination",
+            "circuit__circuit_termination_z___path__destination",
+        )
+        .order_by("circuit__provider__name", "circuit__cid"),
+    )
+
+
+def get_circuit_impacts_prefetch() -> Prefetch:
+    """Prefetch plan for the Circuits and Providers rendered by the CircuitMaintenanceTable."""
+    return Prefetch(
+        "circuitimpact_set",
+        queryset=models.CircuitImpact.objects.select_related("circuit__provider").order_by(
+            "circuit__provider__name", "circuit__cid"
+        ),
+    )
+
+
+def prefetch_connected_endpoint_locations(maintenances):
+    """Prefetch the Device and Location of the connected endpoints of the maintenances circuits.
+
+    The connected endpoints are retrieved via a GenericForeignKey, so they are grouped by model to prefetch the
+    related Device and Location in a couple of queries per model.
+    """
+    endpoints_by_model = collections.defaultdict(list)
+    for maintenance in maintenances:
+        for circuit_impact in maintenance.circuitimpact_set.all():
+            circuit = circuit_impact.circuit
+            for termination in [circuit.circuit_termination_a, circuit.circuit_termination_z]:
+                endpoint = termination.connected_endpoint if termination else None
+                if endpoint is not None and hasattr(endpoint, "device_id"):
+                    endpoints_by_model[type(endpoint)].append(endpoint)
+
+    for endpoints in endpoints_by_model.values():
+        prefetch_related_objects(endpoints, "device__location")
+
+
 class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too-many-locals
     """View for an overview dashboard of summary view.
 
@@ -33,24 +98,70 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
     table = tables.CircuitMaintenanceTable
     template_name = "nautobot_circuit_maintenance/circuit_maintenance_overview.html"
     queryset = models.CircuitMaintenance.objects.all()  # Needs to remain all objects, otherwise other calcs will fail.
-    today = datetime.date.today()
     extra_content = None
 
+    def alter_queryset(self, request):
+        """Prefetch the Circuits and Providers of the listed maintenances only, not for the dashboard calculations."""
+        return super().alter_queryset(request).prefetch_related(get_circuit_impacts_prefetch())
+
+    def get_dashboard_queryset(self):
+        """Return the maintenances the user can view, to compute the dashboard from.
+
+        The dashboard is cached per user, so it ignores the filters of the listed maintenances. Neither it uses their
+        prefetch, as the dashboard prefetches other relations of the same CircuitImpacts, which Django doesn't allow
+        to combine.
+        """
+        queryset = models.CircuitMaintenance.objects.all()
+        user = getattr(getattr(self, "request", None), "user", None)
+        if user is not None:
+            queryset = queryset.restrict(user, "view")
+        return queryset
+
     def extra_context(self):
-        """Extra content method on."""
+        """Extra content method on.
+
+        The computed content is cached per day and per user, and invalidated when any of the rendered objects changes.
+        """
+        today = datetime.date.today()
+        user = getattr(getattr(self, "request", None), "user", None)
+        cache_key = (
+            f"nautobot_circuit_maintenance.dashboard.{get_dashboard_cache_version()}."
+            f"{today.isoformat()}.{getattr(user, 'pk', None)}"
+        )
+
+        self.extra_content = cache.get(cache_key)
+        if self.extra_content is None:
+            self.extra_content = self.get_extra_content(today=today)
+            cache.set(
+                cache_key,
+                self.extra_content,
+                settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {}).get("dashboard_cache_timeout"),
+            )
+
+        return self.extra_content
+
+    def get_extra_content(self, today: datetime.date):
+        """Compute the dashboard content for a given day.
+
+        Args:
+            today (datetime.date): Date to use as reference for the upcoming and historical maintenances.
+
+        Returns:
+            dict: Content to pass to the template.
+        """
         # add global aggregations to extra context.
         n_days = settings.PLUGINS_CONFIG.get("nautobot_circuit_maintenance", {}).get("dashboard_n_days")
-        maintenance_in_upcoming_days = self.get_maintenances_next_n_days(start_date=self.today, n_days=n_days)
+        maintenance_in_upcoming_days = self.get_maintenances_next_n_days(start_date=today, n_days=n_days)
 
         # Get historical matrix for number of maintenances, includes calculating the average number per month
-        historical_matrix = self._get_historical_matrix(start_date=self.today)
+        historical_matrix = self._get_historical_matrix(start_date=today)
 
         ###############################################################
         # Get Average duration for the maintenances
         ###############################################################
         total_duration_in_minutes = 0
 
-        for ckt_maint in self.queryset.all():
+        for ckt_maint in self.get_dashboard_queryset():
             duration = ckt_maint.end_time - ckt_maint.start_time
             total_duration_in_minutes += round(duration.total_seconds() / 60.0, 0)
 
@@ -63,14 +174,11 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
             average_maintenance_duration = "No maintenances found."
 
         # Get count of upcoming maintenances
-        future_maintenance_count = self.calculate_future_maintenances(start_date=self.today)
+        future_maintenance_count = self.calculate_future_maintenances(start_date=today)
 
         circuit_object_count = Circuit.objects.count()
         if circuit_object_count > 0:
-            circuit_count_ratio = round(
-                len(self.get_maintenances_next_n_days(start_date=self.today, n_days=n_days)) / circuit_object_count,
-                2,
-            )
+            circuit_count_ratio = round(len(maintenance_in_upcoming_days) / circuit_object_count, 2)
         else:
             circuit_count_ratio = 0
 
@@ -89,13 +197,34 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
         # Build out the extra content, but this does require that there is a method of `extra_content` to be created.
         # If this method is not defined, and returning the extra_content value, then the data will not be passed to the
         # template.
-        self.extra_content = {
+        return {
             "upcoming_maintenances": maintenance_in_upcoming_days,
+            "maintenance_overlaps": self.get_maintenance_overlaps(
+                start_date=today, user=getattr(getattr(self, "request", None), "user", None)
+            ),
             "circuit_maint_metric_data": metric_values,
             "n_days": n_days,
         }
 
-        return self.extra_content
+    def get_maintenance_overlaps(self, start_date: datetime.date, user=None):
+        """Gets the maintenance overlaps, stored by the overlap Job, that are not over yet.
+
+        Args:
+            start_date (datetime.date): Date to start the search.
+            user (User): If provided, only the overlaps, locations and maintenances this user can view are returned.
+
+        Returns:
+            List: List of maintenance overlaps
+        """
+        start_date_midnight = datetime.datetime.combine(start_date, datetime.datetime.min.time())
+        overlaps = models.MaintenanceOverlap.objects.filter(end_time__gte=start_date_midnight)
+        maintenances = models.CircuitMaintenance.objects.all()
+        if user is not None:
+            overlaps = overlaps.restrict(user, "view").filter(location__in=Location.objects.restrict(user, "view"))
+            maintenances = maintenances.restrict(user, "view")
+        return list(
+            overlaps.select_related("location").prefetch_related(Prefetch("maintenances", queryset=maintenances))
+        )
 
     def get_maintenances_next_n_days(self, start_date: datetime.date, n_days: int):
         """Gets maintenances in the next n number of days.
@@ -109,9 +238,14 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
         """
         start_date_midnight = datetime.datetime.combine(start_date, datetime.datetime.min.time())
         end_date_midnight = start_date_midnight + datetime.timedelta(days=n_days)
-        maintenances = self.queryset.filter(start_time__gte=start_date_midnight, start_time__lte=end_date_midnight)
+        maintenances = list(
+            self.get_dashboard_queryset()
+            .filter(start_time__gte=start_date_midnight, start_time__lte=end_date_midnight)
+            .prefetch_related(get_upcoming_maintenances_prefetch())
+        )
+        prefetch_connected_endpoint_locations(maintenances)
 
-        return list(maintenances)
+        return maintenances
 
     def get_maintenance_past_n_days(self, start_date: datetime.date, n_days: int):
         """Gets maintenances in the past n number of days.
@@ -122,7 +256,9 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
         """
         start_date_midnight = datetime.datetime.combine(start_date, datetime.datetime.min.time())
         end_date_midnight = start_date_midnight + datetime.timedelta(days=n_days)
-        maintenances = self.queryset.filter(start_time__gte=end_date_midnight, start_time__lte=start_date_midnight)
+        maintenances = self.get_dashboard_queryset().filter(
+            start_time__gte=end_date_midnight, start_time__lte=start_date_midnight
+        )
 
         return list(maintenances)
 
@@ -159,9 +295,11 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
         Returns:
             int: Count of future maintenances
         """
-        count = self.queryset.filter(
-            start_time__gte=datetime.datetime.combine(start_date, datetime.datetime.min.time())
-        ).count()
+        count = (
+            self.get_dashboard_queryset()
+            .filter(start_time__gte=datetime.datetime.combine(start_date, datetime.datetime.min.time()))
+            .count()
+        )
 
         return count
 
@@ -186,13 +324,15 @@ class CircuitMaintenanceOverview(generic.ObjectListView):  # pylint: disable=too
         # Then get the differences in months. Then add 1 to account for the current month.
         delta_months = (end.year - start.year) * 12 + end.month - start.month + 1
 
-        return self.queryset.count() / delta_months
+        return self.get_dashboard_queryset().count() / delta_months
 
 
 class CircuitMaintenanceListView(generic.ObjectListView):
     """View for listing the config circuitmaintenance feature definition."""
 
-    queryset = models.CircuitMaintenance.objects.order_by("-start_time")
+    queryset = models.CircuitMaintenance.objects.prefetch_related(get_circuit_impacts_prefetch()).order_by(
+        "-start_time"
+    )
     table = tables.CircuitMaintenanceTable
     filterset = filters.CircuitMaintenanceFilterSet
     filterset_form = forms.CircuitMaintenanceFilterForm
@@ -279,14 +419,14 @@ class CircuitImpactListView(generic.ObjectListView):
     table = tables.CircuitImpactTable
     filterset = filters.CircuitImpactFilterSet
     filterset_form = forms.CircuitImpactFilterForm
-    queryset = models.CircuitImpact.objects.all()
+    queryset = models.CircuitImpact.objects.select_related("maintenance", "circuit")
     action_buttons = ("add", "export")
 
 
 class CircuitImpactView(generic.ObjectView):
     """Detail view for specific Circuit Impact windows."""
 
-    queryset = models.CircuitImpact.objects.all()
+    queryset = models.CircuitImpact.objects.select_related("maintenance", "circuit")
 
 
 class CircuitImpactEditView(generic.ObjectEditView):
@@ -329,7 +469,7 @@ class NoteListView(generic.ObjectListView):
     """View for listing all notes."""
 
     table = tables.NoteTable
-    queryset = models.Note.objects.all()
+    queryset = models.Note.objects.select_related("maintenance")
     filterset = filters.NoteFilterSet
     filterset_form = forms.NoteFilterForm
     action_buttons = ("add", "export")
@@ -345,7 +485,7 @@ class NoteEditView(generic.ObjectEditView):
 class NoteView(generic.ObjectView):
     """View for maintenance note."""
 
-    queryset = models.Note.objects.all()
+    queryset = models.Note.objects.select_related("maintenance")
 
 
 class NoteDeleteView(generic.ObjectDeleteView):
@@ -380,7 +520,7 @@ class NoteBulkDeleteView(generic.BulkDeleteView):
 class RawNotificationView(generic.ObjectView):
     """Detail view for raw notifications."""
 
-    queryset = models.RawNotification.objects.all()
+    queryset = models.RawNotification.objects.select_related("provider", "source")
 
     def get_extra_context(self, request, instance):
         """Extend content of detailed view for RawNotification."""
@@ -389,10 +529,7 @@ class RawNotificationView(generic.ObjectView):
         else:
             parsed_notification = None
         try:
-            if isinstance(instance.raw, bytes):
-                raw_repr = instance.raw.decode("utf-8", "strict")
-            else:
-                raw_repr = instance.raw.tobytes().decode("utf-8", "strict")
+            raw_repr = instance.raw_content.decode("utf-8", "strict")
         except UnicodeDecodeError as exc:
             raw_repr = "Raw content was not able to be decoded with utf-8"
             logger.warning("%s: %s", raw_repr, exc)
@@ -404,7 +541,7 @@ class RawNotificationListView(generic.ObjectListView):
     """View for listing all raw notifications."""
 
     table = tables.RawNotificationTable
-    queryset = models.RawNotification.objects.order_by("-stamp")
+    queryset = models.RawNotification.objects.select_related("provider", "source").defer("raw").order_by("-stamp")
     filterset = filters.RawNotificationFilterSet
     filterset_form = forms.RawNotificationFilterSetForm
     action_buttons = ("export",)
@@ -428,14 +565,22 @@ class RawNotificationDeleteView(generic.ObjectDeleteView):
 class ParsedNotificationView(generic.ObjectView):
     """Detail view for parsed notifications."""
 
-    queryset = models.ParsedNotification.objects.all()
+    queryset = models.ParsedNotification.objects.select_related("maintenance", "raw_notification").defer(
+        "raw_notification__raw"
+    )
+
+
+class MaintenanceOverlapView(generic.ObjectView):
+    """Detail view for maintenance overlaps."""
+
+    queryset = models.MaintenanceOverlap.objects.select_related("location").prefetch_related("maintenances")
 
 
 class NotificationSourceListView(generic.ObjectListView):
     """View for Notification Source."""
 
     table = tables.NotificationSourceTable
-    queryset = models.NotificationSource.objects.all()
+    queryset = models.NotificationSource.objects.prefetch_related("providers")
     filterset = filters.NotificationSourceFilterSet
     filterset_form = forms.NotificationSourceFilterSetForm
     action_buttons = ("edit", "export")
@@ -590,3 +735,51 @@ def google_oauth2callback(request):
             kwargs={"name": source_name},
         )
     )
+
+
+@csrf_exempt
+@require_POST
+def gmail_push(request, name):
+    """View to receive the Gmail push notifications, delivered by a Google Cloud Pub/Sub push subscription.
+
+    The subscription endpoint must include the `push_token` of the source as `token` query parameter. Every
+    notification of changes in the mailbox enqueues the processing of the notifications from this source only.
+    """
+    try:
+        notification_source = models.NotificationSource.objects.get(name=name)
+        source = Source.init(name=notification_source.name)
+    except (models.NotificationSource.DoesNotExist, ValueError):
+        return HttpResponseNotFound()
+
+    if not isinstance(source, GmailAPI) or not source.push_token or not source.push_username:
+        return HttpResponseNotFound()
+
+    if not hmac.compare_digest(request.GET.get("token", ""), source.push_token):
+        return HttpResponseForbidden()
+
+    try:
+        envelope = json.loads(request.body)
+        history = json.loads(base64.b64decode(envelope["message"]["data"]))
+    except (binascii.Error, KeyError, TypeError, ValueError):
+        return HttpResponseBadRequest("Not a Pub/Sub push message.")
+
+    if history.get("emailAddress", "").lower() != source.account.lower():
+        # Acknowledged anyway, otherwise Pub/Sub retries delivering it
+        logger.warning("Gmail push notification for %s received by %s", history.get("emailAddress"), name)
+        return HttpResponse(status=204)
+
+    try:
+        user = get_user_model().objects.get(username=source.push_username)
+    except get_user_model().DoesNotExist:
+        # Pub/Sub retries delivering any message not acknowledged with a 2xx, retrying won't create the user
+        logger.error("Gmail push notification for %s dropped, user %s not found", name, source.push_username)
+        return HttpResponse(status=204)
+
+    job_result = enqueue_handle_notifications(notification_source, user)
+    logger.debug(
+        "Gmail push notification for %s with history ID %s enqueued as %s",
+        name,
+        history.get("historyId"),
+        job_result.pk,
+    )
+    return HttpResponse(status=204)